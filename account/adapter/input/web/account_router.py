@@ -6,6 +6,7 @@ from account.adapter.input.web.response.account_response import AccountResponse
 from account.adapter.input.web.session_helper import get_current_user
 from account.application.usecase.account_usecase import AccountUseCase
 from account.infrastructure.orm.account_orm import OAuthProvider
+from config.database.db_executor import run_in_db_executor
 from config.redis_config import get_redis
 from sosial_oauth.infrastructure.service.google_oauth2_service import GoogleOAuth2Service
 from util.cache.ai_cache import AICache
@@ -43,7 +44,7 @@ async def update_account(
 ):
 
     # 기존 계정 조회 (세션 ID로)
-    existing_account = usecase.get_account_by_session_id(session_id)
+    existing_account = await run_in_db_executor(usecase.get_account_by_session_id, session_id)
     if not existing_account:
         raise HTTPException(status_code=404, detail="Account not found")
 
@@ -61,7 +62,7 @@ async def update_account(
     )
     await usecase.update_account(updated_account)
 
-    updated_account = usecase.get_account_by_session_id(session_id)
+    updated_account = await run_in_db_executor(usecase.get_account_by_session_id, session_id)
 
     return AccountResponse(
         session_id=updated_account.session_id,
@@ -130,7 +131,7 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
         return response
 
     # session_id로 계정 조회
-    account = usecase.get_account_by_session_id(session_id)
+    account = await run_in_db_executor(usecase.get_account_by_session_id, session_id)
     logger.debug("Account found")
 
     if not account:
@@ -177,7 +178,7 @@ async def departure(request: Request, session_id: str | None = Cookie(None)):
         logger.debug("Non-Google account detected, skipping token revoke")
 
     # 계정 삭제 (향후 table이 account 외에 더 늘어날 경우 이쪽에 테이블 삭제 로직 추가)
-    deleted = usecase.delete_account_by_oauth_id(account.oauth_type, account.oauth_id)
+    deleted = await run_in_db_executor(usecase.delete_account_by_oauth_id, account.oauth_type, account.oauth_id)
     logger.debug("Account deleted: %s", deleted)
 
     # Redis 세션 삭제
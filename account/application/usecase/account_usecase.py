@@ -3,6 +3,7 @@ from typing import Optional
 from account.adapter.input.web.request.update_account_request import UpdateAccountRequest
 from account.domain.account import Account
 from account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
+from config.database.db_executor import run_in_db_executor
 from util.log.log import Log
 
 logger = Log.get_logger()
@@ -25,7 +26,7 @@ class AccountUseCase:
         account = Account(session_id=session_id, oauth_id=oauth_id, oauth_type=oauth_type, nickname=nickname, name=name, profile_image=profile_image, email=email, phone_number=phone_number, active_status=active_status, role_id=role_id)
         return await self.account_repo.save(account)
     
-    def update_account(self, updated_account: UpdateAccountRequest):
+    async def update_account(self, updated_account: UpdateAccountRequest):
         session_id = updated_account.session_id
         nickname = updated_account.nickname
         profile_image = updated_account.profile_image
@@ -37,7 +38,7 @@ class AccountUseCase:
         logger.info(f"nickname={nickname}")
         
         # 기존 계정 조회
-        existing_account = self.account_repo.get_account_by_session_id(session_id)
+        existing_account = await run_in_db_executor(self.account_repo.get_account_by_session_id, session_id)
         logger.info(f"existing_account={existing_account}")
         
         if existing_account is None:
@@ -57,7 +58,7 @@ class AccountUseCase:
             target_period=target_period if target_period is not None else existing_account.target_period,
             target_amount=target_amount if target_amount is not None else existing_account.target_amount,
         )
-        return self.account_repo.update(updated_account)
+        return await self.account_repo.update(updated_account)
 
     def get_account_by_oauth_id(self, oauth_type:str, oauth_id: str) -> Optional[Account]:
         return self.account_repo.get_account_by_oauth_id(oauth_type, oauth_id)
@@ -0,0 +1,18 @@
+import hmac
+import os
+
+from fastapi import Header, HTTPException
+
+ADMIN_API_TOKEN = os.getenv("ADMIN_API_TOKEN")
+
+
+def verify_admin_token(x_admin_token: str | None = Header(None)):
+    """
+    관리자 API 인증 (X-Admin-Token 헤더)
+
+    ADMIN_API_TOKEN이 설정되지 않은 환경에서는 관리자 API 전체를 비활성화한다.
+    """
+    if not ADMIN_API_TOKEN:
+        raise HTTPException(status_code=403, detail="관리자 API가 비활성화되어 있습니다. (ADMIN_API_TOKEN 미설정)")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, ADMIN_API_TOKEN):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 올바르지 않습니다.")
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+
+from admin.adapter.input.web.admin_auth import verify_admin_token
+from config.database.sql_trace import SqlTrace
+
+admin_router = APIRouter(tags=["admin"], dependencies=[Depends(verify_admin_token)])
+
+
+@admin_router.get("/sql-trace")
+async def get_sql_trace(
+        limit: int = Query(100, ge=1, le=1000),
+        slow_only: bool = Query(False),
+):
+    """
+    최근 SQL 실행 기록(링 버퍼)과 지문별 집계를 조회한다.
+    """
+    trace = SqlTrace.get_instance()
+    return {
+        "settings": trace.settings(),
+        "summary": trace.summary(),
+        "items": trace.entries(limit=limit, slow_only=slow_only),
+    }
+
+
+@admin_router.put("/sql-trace/mode")
+async def set_sql_trace_mode(mode: str = Body(..., embed=True)):
+    """
+    SQL 로깅 모드 변경 (off / sampled / slow / all) - 재시작 시 SQL_TRACE_MODE 값으로 복귀
+    """
+    trace = SqlTrace.get_instance()
+    try:
+        trace.set_mode(mode)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return trace.settings()
+
+
+@admin_router.delete("/sql-trace")
+async def clear_sql_trace():
+    """
+    SQL 실행 기록 초기화
+    """
+    SqlTrace.get_instance().clear()
+    return {"message": "SQL 실행 기록을 초기화했습니다."}
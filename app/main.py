@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 from dotenv import load_dotenv
@@ -9,11 +10,19 @@ from market_data.adapter.input.web.market_data_router import market_data_router
 load_dotenv()
 
 from product.adapter.input.web.product_data_router.product_data_router import product_data_router
+from product.application.service.catalogue_warmup_service import CatalogueWarmupService
 from account.adapter.input.web.account_router import account_router
-from config.database.session import Base, engine
+from admin.adapter.input.web.admin_router import admin_router
+from asset_allocation.infrastructure.index.analyze_pattern_index import warm_up_pattern_index
+from config.database.db_executor import shutdown_db_executor
+from config.parse_executor import shutdown_parse_executor, start_parse_executor
+from config.http_client import HttpClientRegistry
+from config.database.migration.migrator import run_migrations
+from config.database.session_middleware import DBSessionMiddleware
 from documents_multi_agents.adapter.input.web.document_multi_agent_router import documents_multi_agents_router
 from ecos.adapter.input.web.ecos_data_router.ecos_data_router import ecos_data_router
 from ieinfo.adapter.input.web.ie_info_router import ie_info_router
+from ingestion.adapter.input.web.ingestion_router import ingestion_router
 from kftc.adapter.input.web.kftc_router import kftc_router
 from sosial_oauth.adapter.input.web.google_oauth2_router import authentication_router
 from recommendation.adapter.output.web.etf_recommendation_router import etf_recommendation_router
@@ -27,17 +36,30 @@ from jobs import scheduler as jobs_scheduler
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 CORS_ALLOWED_FRONTEND_URL = os.getenv("CORS_ALLOWED_FRONTEND_URL")
+DB_MIGRATE_ON_STARTUP = os.getenv("DB_MIGRATE_ON_STARTUP", "true").lower() == "true"
 
 app = FastAPI()
 
 @app.on_event("startup")
 async def on_startup():
     # .env가 이미 로드되어 있다고 가정
+    # HTML 파싱 프로세스 풀은 다른 스레드가 생기기 전에 fork로 미리 생성
+    start_parse_executor()
+    # 미적용 스키마 마이그레이션만 실행 (데이터 유지, 워커 간 GET_LOCK으로 직렬화)
+    if DB_MIGRATE_ON_STARTUP:
+        run_migrations()
+    # /future-assets 유사 패턴 검색용 인메모리 인덱스 적재 (기동을 막지 않도록 백그라운드)
+    asyncio.get_running_loop().run_in_executor(None, warm_up_pattern_index)
+    # 추천용 상품 목록 점검 / 수집 (기동을 막지 않도록 백그라운드)
+    CatalogueWarmupService.get_instance().start()
     jobs_scheduler.start_scheduler()
 
 @app.on_event("shutdown")
 async def on_shutdown():
-    jobs_scheduler.stop_scheduler()
+    await jobs_scheduler.stop_scheduler()
+    await HttpClientRegistry.get_instance().close()
+    shutdown_db_executor()
+    shutdown_parse_executor()
 
 origins = [
     CORS_ALLOWED_FRONTEND_URL,  # Next.js 프론트 엔드 URL
@@ -51,6 +73,9 @@ app.add_middleware(
     allow_headers=["*"],         # 모든 헤더 허용
 )
 
+# 요청 1건당 DB 세션 1개 (Repository가 현재 요청의 세션을 사용)
+app.add_middleware(DBSessionMiddleware)
+
 app.include_router(account_router, prefix="/account")
 app.include_router(authentication_router, prefix="/authentication")
 app.include_router(documents_multi_agents_router, prefix="/documents-multi-agents")
@@ -68,93 +93,14 @@ app.include_router(card_news_recommendation, prefix="/card-news-recommendation")
 app.include_router(news_info_router, prefix="/news_info")
 app.include_router(community_router, prefix="/community")
 app.include_router(kakao_authentication_router, prefix="/kakao-authentication")
+app.include_router(admin_router, prefix="/admin")
+app.include_router(ingestion_router, prefix="/ingestion")
 
 # 앱 실행
 if __name__ == "__main__":
     import uvicorn
-    from ieinfo.infrastructure.orm.ie_rule import IERule
-    from ieinfo.infrastructure.orm.ie_info import IEType
-    from asset_allocation.infrastructure.orm.analyze_history import AnalyzeHistory  # 🔥 추가
-    from sqlalchemy import select
-    
+
     host = os.getenv("APP_HOST")
     port = int(os.getenv("APP_PORT"))
-    
-    # 🔥 IE_RULE 데이터 백업 (서버 재시작해도 유지)
-    backup_rules = []
-    try:
-        with engine.connect() as conn:
-            # IE_RULE 테이블이 존재하면 데이터 백업
-            result = conn.execute(select(IERule))
-            backup_rules = [
-                {'keyword': row.keyword, 'ie_type': row.ie_type}
-                for row in result
-            ]
-            print(f"📦 IE_RULE 백업: {len(backup_rules)}개 규칙")
-    except Exception as e:
-        print(f"⚠️  IE_RULE 백업 실패 (첫 실행일 수 있음): {str(e)}")
-    
-    # 모든 테이블 삭제 및 재생성
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    
-    # 🔥 IE_RULE 데이터 복구 또는 초기 데이터 삽입
-    from sqlalchemy.orm import Session
-    session = Session(bind=engine)
-    
-    if backup_rules:
-        # 백업 데이터가 있으면 복구
-        try:
-            for rule_data in backup_rules:
-                new_rule = IERule(
-                    keyword=rule_data['keyword'],
-                    ie_type=rule_data['ie_type']
-                )
-                session.add(new_rule)
-            
-            session.commit()
-            print(f"✅ IE_RULE 복구 완료: {len(backup_rules)}개 규칙")
-        except Exception as e:
-            session.rollback()
-            print(f"❌ IE_RULE 복구 실패: {str(e)}")
-    else:
-        # 백업 데이터가 없으면 초기 데이터 자동 삽입
-        print("🎯 백업 데이터 없음 → 초기 키워드 자동 삽입")
-        
-        # 초기 소득 키워드
-        INITIAL_INCOME_KEYWORDS = [
-            "급여", "월급", "연봉", "봉급", "임금",
-            "상여", "상여금", "보너스", "성과급", "인센티브",
-            "수당", "식대", "교통비", "주거수당",
-            "이자", "배당", "배당금", "이자소득"
-        ]
-        
-        # 초기 지출 키워드
-        INITIAL_EXPENSE_KEYWORDS = [
-            "보험료", "국민연금", "건강보험", "고용보험", "산재보험",
-            "세금", "소득세", "지방소득세", "주민세",
-            "카드", "신용카드", "체크카드", "카드사용액",
-            "공제", "공제액", "차감"
-        ]
-        
-        try:
-            # 소득 키워드 삽입
-            for keyword in INITIAL_INCOME_KEYWORDS:
-                rule = IERule(keyword=keyword, ie_type=IEType.INCOME)
-                session.add(rule)
-            
-            # 지출 키워드 삽입
-            for keyword in INITIAL_EXPENSE_KEYWORDS:
-                rule = IERule(keyword=keyword, ie_type=IEType.EXPENSE)
-                session.add(rule)
-            
-            session.commit()
-            total = len(INITIAL_INCOME_KEYWORDS) + len(INITIAL_EXPENSE_KEYWORDS)
-            print(f"✅ 초기 키워드 삽입 완료: {total}개 (소득 {len(INITIAL_INCOME_KEYWORDS)}개, 지출 {len(INITIAL_EXPENSE_KEYWORDS)}개)")
-        except Exception as e:
-            session.rollback()
-            print(f"❌ 초기 키워드 삽입 실패: {str(e)}")
-    
-    session.close()
-    
+
     uvicorn.run(app, host=host, port=port)
@@ -49,6 +49,20 @@ class AnalyzeHistoryRepositoryPort(ABC):
         """
         pass
     
+    @abstractmethod
+    def apply_use_counts(self, counts: Dict[int, int], flush_id: Optional[str] = None) -> int:
+        """
+        누적된 사용 횟수 일괄 반영
+        
+        Args:
+            counts: {분석 ID: 증가량}
+            flush_id: flush 배치 ID (이미 반영한 배치면 건너뜀)
+        
+        Returns:
+            갱신된 행 수
+        """
+        pass
+    
     @abstractmethod
     def get_total_count(self) -> int:
         """
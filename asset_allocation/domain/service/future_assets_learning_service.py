@@ -5,6 +5,7 @@ GPT 조언을 학습하여 유사한 패턴의 사용자에게 재사용
 
 from typing import Dict, Any, Optional
 from config.database.session import SessionLocal
+from asset_allocation.infrastructure.counter.use_count_buffer import UseCountBuffer
 from asset_allocation.infrastructure.repository.analyze_history_repository_impl import AnalyzeHistoryRepositoryImpl
 import logging
 
@@ -93,7 +94,7 @@ class FutureAssetsLearningService:
             # 유사 패턴 검색
             similar_pattern = repository.find_similar_pattern(pattern)
             
-            # USE_COUNT 증가
+            # USE_COUNT 증가 (write-behind 버퍼에 누적, DB 반영은 flush_use_counts)
             if similar_pattern:
                 repository.increment_use_count(similar_pattern["analyze_id"])
                 similar_pattern["use_count"] += 1
@@ -131,6 +132,24 @@ class FutureAssetsLearningService:
         except Exception as e:
             logger.error(f"[ERROR] save_gpt_advice failed: {str(e)}")
     
+    @staticmethod
+    def flush_use_counts() -> int:
+        """
+        누적된 USE_COUNT 증가분을 ANALYZE_HISTORY에 일괄 반영 (스케줄러 주기 작업)
+        
+        Returns:
+            반영한 총 증가량
+        """
+        db = SessionLocal()
+        try:
+            repository = AnalyzeHistoryRepositoryImpl(db)
+            return UseCountBuffer.get_instance().flush(repository.apply_use_counts)
+        except Exception as e:
+            logger.error(f"[ERROR] flush_use_counts failed: {str(e)}")
+            return 0
+        finally:
+            db.close()
+    
     # 헬퍼 메서드
     @staticmethod
     def _extract_total(data: Dict[str, Any], keys: list) -> int:
@@ -0,0 +1,157 @@
+"""
+ANALYZE_HISTORY USE_COUNT write-behind 버퍼
+
+- 요청 경로: Redis HINCRBY 한 번 (DB 쓰기 없음)
+  Redis 장애 시에는 프로세스 메모리에 누적
+- 주기 작업(flush): 누적분을 ANALYZE_ID 별 증가량으로 모아
+  UPDATE ... SET USE_COUNT = USE_COUNT + n 으로 일괄 반영
+
+워커 간 유실 / 중복 방지:
+- flush는 Redis 락을 잡은 워커 하나만 수행 (DB 반영 / 처리용 키 삭제 직전에 락 소유를 확인하며 연장)
+- 대기 해시를 RENAME으로 처리용 키로 옮긴 뒤 반영 → 그 사이 들어온 증가분은 새 대기 해시에 쌓임
+- DB 반영이 실패하면 처리용 키를 남겨 두고 다음 flush에서 다시 반영
+- 처리용 키마다 배치 ID(flush_id)를 붙여 DB 반영과 같은 트랜잭션에 기록
+  → 반영 후 처리용 키를 지우기 전에 죽거나 락이 만료돼 다른 워커가 같은 배치를 다시 반영해도 한 번만 반영
+"""
+
+import os
+import threading
+import uuid
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from config.redis_config import get_redis
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# flush 주기 (초)
+ANALYZE_USE_COUNT_FLUSH_SEC = int(os.getenv("ANALYZE_USE_COUNT_FLUSH_SEC", "30"))
+# flush 락 만료 (초, flush 도중 프로세스가 죽어도 다음 주기에 다른 워커가 이어받도록)
+ANALYZE_USE_COUNT_LOCK_TTL = int(os.getenv("ANALYZE_USE_COUNT_LOCK_TTL", "60"))
+
+# 락 소유자일 때만 연장 / 해제
+_RENEW_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+# {ANALYZE_ID: 증가량}, flush 배치 ID(메모리 누적분은 None) → 한 트랜잭션으로 반영 (실패 시 예외)
+ApplyUseCounts = Callable[[Dict[int, int], Optional[str]], None]
+
+
+class UseCountBuffer:
+    """ANALYZE_ID → 미반영 사용 횟수"""
+
+    __instance = None
+
+    PENDING_KEY = "analyze_history:use_count:pending"
+    FLUSHING_KEY = "analyze_history:use_count:flushing"
+    LOCK_KEY = "analyze_history:use_count:flush_lock"
+    # 처리용 해시 안의 배치 ID 필드 (ANALYZE_ID와 겹치지 않는 이름)
+    FLUSH_ID_FIELD = "flush_id"
+
+    @classmethod
+    def get_instance(cls) -> "UseCountBuffer":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        self.redis_client = get_redis()
+        self._lock = threading.Lock()
+        # Redis에 기록하지 못한 증가분 (이 프로세스의 flush에서 반영)
+        self._local: Counter = Counter()
+
+    def increment(self, analyze_id: int, amount: int = 1):
+        """사용 횟수 증가 예약 (DB에는 다음 flush에서 반영)"""
+        try:
+            self.redis_client.hincrby(self.PENDING_KEY, str(analyze_id), amount)
+        except Exception as e:
+            logger.warning(f"[ANALYZE_HISTORY] USE_COUNT Redis 기록 실패 - 메모리에 누적: {str(e)}")
+            with self._lock:
+                self._local[analyze_id] += amount
+
+    def flush(self, apply: ApplyUseCounts) -> int:
+        """
+        누적된 증가분을 DB에 반영
+
+        Args:
+            apply: ({ANALYZE_ID: 증가량}, flush_id)를 한 트랜잭션으로 반영하는 함수 (실패 시 예외)
+
+        Returns:
+            반영한 총 증가량
+        """
+        return self._flush_local(apply) + self._flush_redis(apply)
+
+    def _flush_local(self, apply: ApplyUseCounts) -> int:
+        with self._lock:
+            counts, self._local = dict(self._local), Counter()
+        if not counts:
+            return 0
+
+        try:
+            apply(counts, None)
+        except Exception:
+            # 반영 실패분은 다시 누적
+            with self._lock:
+                self._local.update(counts)
+            raise
+        return sum(counts.values())
+
+    def _flush_redis(self, apply: ApplyUseCounts) -> int:
+        token = uuid.uuid4().hex
+        try:
+            if not self.redis_client.set(self.LOCK_KEY, token, nx=True, ex=ANALYZE_USE_COUNT_LOCK_TTL):
+                # 다른 워커가 flush 중
+                return 0
+        except Exception as e:
+            logger.warning(f"[ANALYZE_HISTORY] USE_COUNT flush 락 획득 실패: {str(e)}")
+            return 0
+
+        try:
+            # 이전 flush가 DB 반영 후 정리하지 못했다면 처리용 키가 남아 있음 → 그것부터 반영 (같은 배치 ID)
+            if not self.redis_client.exists(self.FLUSHING_KEY):
+                if not self.redis_client.exists(self.PENDING_KEY):
+                    return 0
+                self.redis_client.rename(self.PENDING_KEY, self.FLUSHING_KEY)
+            self.redis_client.hsetnx(self.FLUSHING_KEY, self.FLUSH_ID_FIELD, uuid.uuid4().hex)
+
+            batch = self.redis_client.hgetall(self.FLUSHING_KEY)
+            flush_id = batch.pop(self.FLUSH_ID_FIELD)
+            counts = {
+                int(analyze_id): int(amount)
+                for analyze_id, amount in batch.items()
+                if int(amount) > 0
+            }
+            if counts:
+                if not self._renew_lock(token):
+                    return 0
+                apply(counts, flush_id)
+            if not self._renew_lock(token):
+                # 반영은 끝났고 배치 ID가 기록됐으므로 다음 flush가 중복 없이 정리
+                return sum(counts.values())
+            self.redis_client.delete(self.FLUSHING_KEY)
+            return sum(counts.values())
+        finally:
+            try:
+                self.redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, self.LOCK_KEY, token)
+            except Exception as e:
+                logger.warning(f"[ANALYZE_HISTORY] USE_COUNT flush 락 해제 실패: {str(e)}")
+
+    def _renew_lock(self, token: str) -> bool:
+        """아직 락 소유자면 만료를 연장하고 True (만료돼 다른 워커가 잡았으면 False)"""
+        if self.redis_client.eval(_RENEW_LOCK_SCRIPT, 1, self.LOCK_KEY, token, ANALYZE_USE_COUNT_LOCK_TTL):
+            return True
+        logger.warning("[ANALYZE_HISTORY] USE_COUNT flush 락이 만료되어 이번 flush를 중단합니다 (다음 flush에서 이어서 반영)")
+        return False
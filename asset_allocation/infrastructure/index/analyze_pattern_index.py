@@ -0,0 +1,378 @@
+"""
+ANALYZE_HISTORY 유사 패턴 k-NN 인덱스 (인메모리, NumPy)
+
+- ASSET_LEVEL 별로 파티션을 나누어 정규화된 특징 벡터 행렬을 보관
+- 파티션은 소득 순으로 정렬해 두고, 질의 소득 위치에서 좌우로 넓혀 가며
+  벡터 연산으로 거리를 계산 → 남은 구간이 k번째 거리보다 멀면 중단 (정확한 top-k)
+- 기동 시 전체 적재, save_gpt_advice 시 증분 추가,
+  다른 워커가 저장한 행은 ANALYZE_INDEX_REFRESH_SEC 마다 ANALYZE_ID 기준으로 추가 적재
+"""
+
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from asset_allocation.infrastructure.orm.analyze_history import AnalyzeHistory
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 다른 워커가 저장한 이력을 반영하는 주기 (초)
+ANALYZE_INDEX_REFRESH_SEC = float(os.getenv("ANALYZE_INDEX_REFRESH_SEC", "60"))
+# 적재 시 한 번에 가져올 행 수
+ANALYZE_INDEX_LOAD_BATCH = int(os.getenv("ANALYZE_INDEX_LOAD_BATCH", "10000"))
+# 후보 허용 범위: 소득/지출이 질의값의 ±INCOME_EXPENSE_TOLERANCE 이내 (기존 SQL의 ±30% 조건)
+INCOME_EXPENSE_TOLERANCE = 0.3
+
+# 특징 벡터: [log 소득, log 지출, 지출비율, 저축비율, 필수/여가/투자 지출비율]
+# 금액은 log 스케일(상대 차이), 비율은 0~1 스케일로 정규화 후 가중치 적용
+FEATURE_WEIGHTS = np.array([1.0, 1.0, 0.5, 0.5, 0.3, 0.3, 0.3], dtype=np.float32)
+FEATURE_DIM = len(FEATURE_WEIGHTS)
+
+# 정렬되지 않은 증분 영역이 이 크기를 넘으면 정렬 영역과 병합
+_TAIL_MERGE_SIZE = 4096
+# 정렬 영역을 좌우로 넓혀 가며 읽는 첫 블록 크기 (이후 두 배씩 증가)
+_SCAN_BLOCK = 1024
+
+# feature_matrix 인자 순서 (pattern 딕셔너리 키 = ORM 속성명)
+_FEATURE_COLUMNS = (
+    "monthly_income", "monthly_expense", "expense_ratio", "savings_ratio",
+    "essential_ratio", "leisure_ratio", "investment_ratio",
+)
+
+
+def feature_matrix(
+        monthly_income: np.ndarray,
+        monthly_expense: np.ndarray,
+        expense_ratio: np.ndarray,
+        savings_ratio: np.ndarray,
+        essential_ratio: np.ndarray,
+        leisure_ratio: np.ndarray,
+        investment_ratio: np.ndarray,
+) -> np.ndarray:
+    """소비 패턴 컬럼 배열 → 가중치가 적용된 정규화 특징 행렬 (n x FEATURE_DIM)"""
+    raw = np.column_stack([
+        np.log1p(np.maximum(monthly_income, 0.0)),
+        np.log1p(np.maximum(monthly_expense, 0.0)),
+        expense_ratio / 100.0,
+        savings_ratio / 100.0,
+        essential_ratio / 100.0,
+        leisure_ratio / 100.0,
+        investment_ratio / 100.0,
+    ]).astype(np.float32)
+    return raw * FEATURE_WEIGHTS
+
+
+def pattern_vector(pattern: Dict[str, Any]) -> np.ndarray:
+    """calculate_pattern() 결과 → 특징 벡터"""
+    return feature_matrix(*(
+        np.array([float(pattern.get(column) or 0)]) for column in _FEATURE_COLUMNS
+    ))[0]
+
+
+@dataclass
+class PatternMatch:
+    analyze_id: int
+    distance: float
+
+
+class _Block:
+    """특징 행렬 스냅샷 (생성 후 변경하지 않음 → 검색 중 교체되어도 안전)"""
+
+    __slots__ = ("ids", "income", "expense", "features")
+
+    def __init__(self, ids: np.ndarray, income: np.ndarray, expense: np.ndarray, features: np.ndarray):
+        self.ids = ids
+        self.income = income
+        self.expense = expense
+        self.features = features
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def empty(cls) -> "_Block":
+        return cls(
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.float64),
+            np.empty(0, dtype=np.float64),
+            np.empty((0, FEATURE_DIM), dtype=np.float32),
+        )
+
+    def concat(self, other: "_Block") -> "_Block":
+        return _Block(
+            np.concatenate([self.ids, other.ids]),
+            np.concatenate([self.income, other.income]),
+            np.concatenate([self.expense, other.expense]),
+            np.concatenate([self.features, other.features]),
+        )
+
+    def sorted_by_income(self) -> "_Block":
+        order = np.argsort(self.income, kind="stable")
+        return _Block(self.ids[order], self.income[order], self.expense[order], self.features[order])
+
+
+class _Partition:
+    """
+    ASSET_LEVEL 하나의 인덱스
+
+    - sorted: 소득 오름차순으로 정렬된 영역 (특징 0번 = log 소득도 같은 순서)
+    - tail  : 아직 정렬하지 않은 증분 영역 (_TAIL_MERGE_SIZE 이하, 전수 비교)
+    """
+
+    def __init__(self):
+        self._state: Tuple[_Block, _Block] = (_Block.empty(), _Block.empty())
+
+    @property
+    def size(self) -> int:
+        sorted_block, tail = self._state
+        return len(sorted_block) + len(tail)
+
+    def append(self, block: _Block):
+        sorted_block, tail = self._state
+        tail = tail.concat(block)
+        if len(tail) > _TAIL_MERGE_SIZE:
+            self._state = (sorted_block.concat(tail).sorted_by_income(), _Block.empty())
+        else:
+            self._state = (sorted_block, tail)
+
+    def compact(self):
+        """증분 영역을 정렬 영역에 병합"""
+        sorted_block, tail = self._state
+        if len(tail):
+            self._state = (sorted_block.concat(tail).sorted_by_income(), _Block.empty())
+
+    def search(self, query: np.ndarray, income: float, expense: float, k: int) -> List[Tuple[float, int]]:
+        """(거리 제곱, ANALYZE_ID) 목록 (거리 오름차순, 최대 k건)"""
+        # 검색 도중 append/compact가 일어나도 같은 스냅샷을 사용
+        sorted_block, tail = self._state
+        low, high = 1 - INCOME_EXPENSE_TOLERANCE, 1 + INCOME_EXPENSE_TOLERANCE
+        income_low, income_high = income * low, income * high
+        expense_low, expense_high = expense * low, expense * high
+
+        best_d = np.empty(0, dtype=np.float32)
+        best_i = np.empty(0, dtype=np.int64)
+
+        def merge(block: _Block, start: int, end: int):
+            nonlocal best_d, best_i
+            # 연속 구간 그대로 거리 계산 후 범위 밖 행만 제외 (fancy indexing 복사 회피)
+            expenses = block.expense[start:end]
+            outside = (expenses < expense_low) | (expenses > expense_high)
+            if block is tail:
+                incomes = block.income[start:end]
+                outside |= (incomes < income_low) | (incomes > income_high)
+            diff = block.features[start:end] - query
+            d = np.einsum("ij,ij->i", diff, diff)
+            d[outside] = np.inf
+
+            take = min(k, len(d))
+            top = np.argpartition(d, take - 1)[:take] if take < len(d) else np.arange(len(d))
+            top = top[np.isfinite(d[top])]
+            if len(top) == 0:
+                return
+            best_d = np.concatenate([best_d, d[top]])
+            best_i = np.concatenate([best_i, block.ids[start:end][top]])
+            if len(best_d) > k:
+                keep = np.argpartition(best_d, k - 1)[:k]
+                best_d, best_i = best_d[keep], best_i[keep]
+
+        if len(tail):
+            merge(tail, 0, len(tail))
+
+        if len(sorted_block):
+            # 소득 ±30% 범위만 후보 → 정렬 영역에서 이진 탐색으로 구간 한정
+            incomes = sorted_block.income
+            first = int(np.searchsorted(incomes, income_low, side="left"))
+            last = int(np.searchsorted(incomes, income_high, side="right"))
+            key = sorted_block.features[:, 0]
+            q0 = query[0]
+
+            # 질의 소득 위치에서 좌우로 넓혀 가며 비교,
+            # 남은 구간의 소득 차이만으로도 현재 k번째 거리보다 멀면 중단 (정확한 top-k)
+            center = min(max(int(np.searchsorted(incomes, income)), first), last)
+            left, right = center, center
+            block = _SCAN_BLOCK
+            while left > first or right < last:
+                kth = best_d.max() if len(best_d) == k else np.inf
+                left_open = left > first and (q0 - key[left - 1]) ** 2 <= kth
+                right_open = right < last and (key[right] - q0) ** 2 <= kth
+                if not left_open and not right_open:
+                    break
+                if left_open:
+                    new_left = max(first, left - block)
+                    merge(sorted_block, new_left, left)
+                    left = new_left
+                if right_open:
+                    new_right = min(last, right + block)
+                    merge(sorted_block, right, new_right)
+                    right = new_right
+                block *= 2
+
+        order = np.argsort(best_d, kind="stable")
+        return [(float(best_d[i]), int(best_i[i])) for i in order]
+
+
+class AnalyzePatternIndex:
+    """ANALYZE_HISTORY 유사 패턴 k-NN 인덱스 (프로세스당 하나)"""
+
+    __instance = None
+
+    @classmethod
+    def get_instance(cls) -> "AnalyzePatternIndex":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._partitions: Dict[str, _Partition] = {}
+        self._max_id = 0                # DB에서 적재한 마지막 ANALYZE_ID
+        self._added_ids = set()         # add()로 먼저 반영되어 적재 시 건너뛸 ID
+        self._loaded = False
+        self._refreshed_at = 0.0
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def size(self) -> int:
+        return sum(p.size for p in self._partitions.values())
+
+    def load(self, session: Session):
+        """전체 이력을 다시 적재"""
+        with self._lock:
+            self._reload(session)
+
+    def ensure_fresh(self, session: Session):
+        """미적재 상태면 전체 적재, 갱신 주기가 지났으면 새로 저장된 행만 추가"""
+        if not self._loaded:
+            with self._lock:
+                # 기동 시 적재가 진행 중이었다면 끝난 뒤 다시 적재하지 않음
+                if not self._loaded:
+                    self._reload(session)
+            return
+        if time.monotonic() - self._refreshed_at < ANALYZE_INDEX_REFRESH_SEC:
+            return
+
+        with self._lock:
+            if time.monotonic() - self._refreshed_at < ANALYZE_INDEX_REFRESH_SEC:
+                return
+            count = self._load_after(session, self._max_id)
+            self._refreshed_at = time.monotonic()
+        if count:
+            logger.info(f"[ANALYZE_INDEX] 신규 이력 {count}건 반영")
+
+    def _reload(self, session: Session):
+        self._partitions = {}
+        self._max_id = 0
+        self._added_ids = set()
+        count = self._load_after(session, 0)
+        self._loaded = True
+        self._refreshed_at = time.monotonic()
+        logger.info(f"[ANALYZE_INDEX] 유사 패턴 인덱스 적재 완료 ({count}건, {len(self._partitions)}개 자산 수준)")
+
+    def add(self, analyze_id: int, pattern: Dict[str, Any]):
+        """저장된 이력 1건을 인덱스에 추가 (save_gpt_advice 직후)"""
+        if not self._loaded:
+            # 아직 적재 전이면 다음 ensure_fresh()에서 DB로부터 함께 적재됨
+            return
+
+        block = _Block(
+            np.array([analyze_id], dtype=np.int64),
+            np.array([pattern["monthly_income"]], dtype=np.float64),
+            np.array([pattern["monthly_expense"]], dtype=np.float64),
+            pattern_vector(pattern).reshape(1, FEATURE_DIM),
+        )
+        with self._lock:
+            # _max_id는 올리지 않음 → 그 사이 다른 워커가 저장한 행도 다음 갱신에서 적재
+            if analyze_id <= self._max_id or analyze_id in self._added_ids:
+                return
+            self._added_ids.add(analyze_id)
+            self._partition(pattern["asset_level"]).append(block)
+
+    def search(self, pattern: Dict[str, Any], k: int = 1) -> List[PatternMatch]:
+        """
+        같은 자산 수준 안에서 소득/지출 ±30% 이내이면서 가장 가까운 이력 top-k
+
+        Args:
+            pattern: calculate_pattern() 결과
+            k: 반환할 최대 건수
+
+        Returns:
+            거리 오름차순 PatternMatch 목록 (후보가 없으면 빈 리스트)
+        """
+        partition = self._partitions.get(pattern["asset_level"])
+        if partition is None or k <= 0:
+            return []
+
+        matches = partition.search(
+            pattern_vector(pattern),
+            float(pattern["monthly_income"]),
+            float(pattern["monthly_expense"]),
+            k,
+        )
+        return [PatternMatch(analyze_id=analyze_id, distance=math.sqrt(d)) for d, analyze_id in matches]
+
+    def _load_after(self, session: Session, last_id: int) -> int:
+        """ANALYZE_ID > last_id 인 행을 배치 단위로 적재 (특징 컬럼만 조회)"""
+        t = AnalyzeHistory
+        stmt = (
+            select(t.analyze_id, t.asset_level, *(getattr(t, c) for c in _FEATURE_COLUMNS))
+            .where(t.analyze_id > last_id)
+            .order_by(t.analyze_id)
+            .execution_options(yield_per=ANALYZE_INDEX_LOAD_BATCH)
+        )
+
+        blocks: Dict[str, List[_Block]] = {}
+        count = 0
+        for rows in session.execute(stmt).partitions():
+            self._max_id = max(self._max_id, rows[-1].analyze_id)
+
+            by_level: Dict[str, List[Any]] = {}
+            for row in rows:
+                if row.analyze_id in self._added_ids:
+                    self._added_ids.discard(row.analyze_id)
+                    continue
+                by_level.setdefault(row.asset_level, []).append(row)
+
+            for level, level_rows in by_level.items():
+                columns = list(zip(*level_rows))
+                # columns[0]=ANALYZE_ID, [1]=ASSET_LEVEL, [2:]=_FEATURE_COLUMNS 순서
+                values = [np.fromiter((float(v or 0) for v in c), dtype=np.float64, count=len(c)) for c in columns[2:]]
+                blocks.setdefault(level, []).append(_Block(
+                    np.array(columns[0], dtype=np.int64), values[0], values[1], feature_matrix(*values),
+                ))
+                count += len(level_rows)
+
+        # 자산 수준별로 한 번에 병합 (배치마다 정렬하지 않도록)
+        for level, level_blocks in blocks.items():
+            merged = level_blocks[0]
+            for block in level_blocks[1:]:
+                merged = merged.concat(block)
+            self._partition(level).append(merged)
+        return count
+
+    def _partition(self, level: str) -> _Partition:
+        partition = self._partitions.get(level)
+        if partition is None:
+            partition = _Partition()
+            self._partitions[level] = partition
+        return partition
+
+
+def warm_up_pattern_index():
+    """기동 시 인덱스 전체 적재 (실패해도 첫 검색에서 다시 적재 시도)"""
+    from config.database.session import SessionLocal
+
+    try:
+        with SessionLocal() as session:
+            AnalyzePatternIndex.get_instance().load(session)
+    except Exception as e:
+        logger.error(f"[ANALYZE_INDEX] 유사 패턴 인덱스 적재 실패: {str(e)}")
@@ -0,0 +1,22 @@
+"""
+ANALYZE_USE_COUNT_FLUSH ORM 모델
+USE_COUNT flush 배치 반영 기록 (같은 배치를 두 번 반영하지 않도록)
+"""
+
+from sqlalchemy import Column, DateTime, String
+from sqlalchemy.sql import func
+
+from config.database.session import Base
+
+
+class AnalyzeUseCountFlush(Base):
+    """
+    반영한 USE_COUNT flush 배치 ID
+
+    증가량 UPDATE와 같은 트랜잭션에서 기록하므로, commit 후 Redis 처리용 키를 지우기 전에
+    프로세스가 죽어도 다음 flush에서 이미 반영한 배치임을 알 수 있다.
+    """
+    __tablename__ = "ANALYZE_USE_COUNT_FLUSH"
+
+    flush_id = Column("FLUSH_ID", String(32), primary_key=True)
+    applied_at = Column("APPLIED_AT", DateTime, nullable=False, server_default=func.now(), index=True)
@@ -2,18 +2,29 @@
 AnalyzeHistory Repository 구현체
 """
 
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import text
+from sqlalchemy import func, select, update
 import re
 
 from asset_allocation.application.port.analyze_history_repository_port import AnalyzeHistoryRepositoryPort
+from asset_allocation.infrastructure.counter.use_count_buffer import UseCountBuffer
+from asset_allocation.infrastructure.index.analyze_pattern_index import AnalyzePatternIndex
 from asset_allocation.infrastructure.orm.analyze_history import AnalyzeHistory
+from asset_allocation.infrastructure.orm.analyze_use_count_flush import AnalyzeUseCountFlush
+from config.database.bulk_upsert import BULK_CHUNK_SIZE
 from util.log.log import Log
 
 logger = Log.get_logger()
 
+# 인덱스에서 가져올 후보 수 (삭제된 행 대비 여유분)
+SIMILAR_PATTERN_CANDIDATES = 3
+# 반영한 flush 배치 ID 보관 기간 (일)
+ANALYZE_USE_COUNT_FLUSH_KEEP_DAYS = 7
+
 
 class AnalyzeHistoryRepositoryImpl(AnalyzeHistoryRepositoryPort):
     """미래 자산 예측 분석 이력 저장소 구현"""
@@ -71,61 +82,38 @@ class AnalyzeHistoryRepositoryImpl(AnalyzeHistoryRepositoryPort):
             유사한 패턴 정보 또는 None
         """
         try:
-            # 유사도 계산 SQL
-            query = text("""
-                SELECT 
-                    ANALYZE_ID,
-                    MONTHLY_INCOME,
-                    MONTHLY_EXPENSE,
-                    MONTHLY_SURPLUS,
-                    EXPENSE_RATIO,
-                    SAVINGS_RATIO,
-                    ASSET_LEVEL,
-                    GPT_ADVICE,
-                    USE_COUNT,
-                    (
-                        -- 소득 차이 (±30% 범위)
-                        ABS(MONTHLY_INCOME - :income) / :income * 100 +
-                        -- 지출 차이 (±30% 범위)
-                        ABS(MONTHLY_EXPENSE - :expense) / :expense * 100 +
-                        -- 지출 비율 차이
-                        ABS(EXPENSE_RATIO - :expense_ratio) * 5 +
-                        -- 저축 비율 차이
-                        ABS(SAVINGS_RATIO - :savings_ratio) * 5
-                    ) AS similarity_score
-                FROM ANALYZE_HISTORY
-                WHERE 
-                    -- 소득이 ±30% 범위 내
-                    MONTHLY_INCOME BETWEEN :income * 0.7 AND :income * 1.3
-                    -- 지출이 ±30% 범위 내
-                    AND MONTHLY_EXPENSE BETWEEN :expense * 0.7 AND :expense * 1.3
-                    -- 자산 수준 동일
-                    AND ASSET_LEVEL = :asset_level
-                ORDER BY similarity_score ASC
-                LIMIT 1
-            """)
-            
-            result = self.session.execute(query, {
-                "income": pattern["monthly_income"],
-                "expense": pattern["monthly_expense"],
-                "expense_ratio": pattern["expense_ratio"],
-                "savings_ratio": pattern["savings_ratio"],
-                "asset_level": pattern["asset_level"]
-            }).fetchone()
-            
-            if result:
-                logger.info(f"[ANALYZE_HISTORY] 유사 패턴 발견 (ID: {result[0]}, 유사도: {result[9]:.2f})")
-                
-                return {
-                    "analyze_id": result[0],
-                    "gpt_advice": result[7],
-                    "use_count": result[8],
-                    "similarity_score": float(result[9])
-                }
-            else:
+            # 자산 수준별 인메모리 k-NN 인덱스에서 후보 검색 (SQL 전체 스캔 대신)
+            index = AnalyzePatternIndex.get_instance()
+            index.ensure_fresh(self.session)
+            matches = index.search(pattern, k=SIMILAR_PATTERN_CANDIDATES)
+
+            if not matches:
                 logger.info("[ANALYZE_HISTORY] 유사 패턴 없음 - GPT 호출 필요")
                 return None
-                
+
+            # 조언 본문은 후보 ID로만 조회 (인덱스가 가진 ID가 삭제된 경우 다음 후보 사용)
+            rows = self.session.execute(
+                select(AnalyzeHistory.analyze_id, AnalyzeHistory.gpt_advice, AnalyzeHistory.use_count)
+                .where(AnalyzeHistory.analyze_id.in_([m.analyze_id for m in matches]))
+            ).all()
+            by_id = {row.analyze_id: row for row in rows}
+
+            for match in matches:
+                row = by_id.get(match.analyze_id)
+                if row is None:
+                    continue
+
+                logger.info(f"[ANALYZE_HISTORY] 유사 패턴 발견 (ID: {row.analyze_id}, 거리: {match.distance:.4f})")
+                return {
+                    "analyze_id": row.analyze_id,
+                    "gpt_advice": row.gpt_advice,
+                    "use_count": row.use_count,
+                    "similarity_score": match.distance
+                }
+
+            logger.info("[ANALYZE_HISTORY] 유사 패턴 없음 - GPT 호출 필요")
+            return None
+
         except Exception as e:
             logger.error(f"[ANALYZE_HISTORY] 유사 패턴 검색 실패: {str(e)}")
             return None
@@ -163,6 +151,9 @@ class AnalyzeHistoryRepositoryImpl(AnalyzeHistoryRepositoryPort):
             self.session.add(new_record)
             self.session.commit()
             
+            # 이 워커의 인덱스에는 바로 반영 (다른 워커는 주기적 갱신으로 반영)
+            AnalyzePatternIndex.get_instance().add(new_record.analyze_id, pattern)
+
             logger.info(f"✅ [ANALYZE_HISTORY] GPT 조언 저장 완료 (ID: {new_record.analyze_id}, 길이: {len(clean_advice)}자)")
             return True
             
@@ -179,7 +170,7 @@ class AnalyzeHistoryRepositoryImpl(AnalyzeHistoryRepositoryPort):
 
     def increment_use_count(self, analyze_id: int) -> bool:
         """
-        사용 횟수 증가
+        사용 횟수 증가 (write-behind: 요청 중에는 DB에 쓰지 않고 버퍼에 누적)
         
         Args:
             analyze_id: 분석 ID
@@ -187,26 +178,58 @@ class AnalyzeHistoryRepositoryImpl(AnalyzeHistoryRepositoryPort):
         Returns:
             성공 여부
         """
+        UseCountBuffer.get_instance().increment(analyze_id)
+        return True
+
+    def apply_use_counts(self, counts: Dict[int, int], flush_id: Optional[str] = None) -> int:
+        """
+        누적된 사용 횟수를 한 트랜잭션으로 반영 (실패 시 예외 → 버퍼가 다음 flush에서 재시도)
+
+        flush_id를 증가량과 같은 트랜잭션에 기록하므로, 반영 후 Redis 정리 전에 죽어서
+        같은 배치를 다시 반영하려 하면 중복 키로 건너뜀
+        
+        Args:
+            counts: {ANALYZE_ID: 증가량}
+            flush_id: flush 배치 ID (없으면 기록 없이 반영)
+        
+        Returns:
+            갱신된 행 수 (이미 반영한 배치면 0)
+        """
+        # 증가량이 같은 ID끼리 묶어 UPDATE ... SET USE_COUNT = USE_COUNT + n WHERE ANALYZE_ID IN (...)
+        by_amount: Dict[int, List[int]] = defaultdict(list)
+        for analyze_id, amount in counts.items():
+            by_amount[amount].append(analyze_id)
+
         try:
-            record = self.session.query(AnalyzeHistory).filter(
-                AnalyzeHistory.analyze_id == analyze_id
-            ).first()
-            
-            if record:
-                record.use_count += 1
-                self.session.commit()
-                logger.debug(f"[ANALYZE_HISTORY] 사용 횟수 증가 (ID: {analyze_id}, Count: {record.use_count})")
-                return True
-            else:
-                logger.warning(f"[ANALYZE_HISTORY] 레코드 없음 (ID: {analyze_id})")
-                return False
-                
-        except Exception as e:
+            if flush_id is not None:
+                self.session.add(AnalyzeUseCountFlush(flush_id=flush_id))
+                self.session.query(AnalyzeUseCountFlush).filter(
+                    AnalyzeUseCountFlush.applied_at < datetime.now() - timedelta(days=ANALYZE_USE_COUNT_FLUSH_KEEP_DAYS)
+                ).delete(synchronize_session=False)
+                self.session.flush()
+
+            updated = 0
+            for amount, ids in by_amount.items():
+                for start in range(0, len(ids), BULK_CHUNK_SIZE):
+                    result = self.session.execute(
+                        update(AnalyzeHistory)
+                        .where(AnalyzeHistory.analyze_id.in_(ids[start:start + BULK_CHUNK_SIZE]))
+                        .values(use_count=AnalyzeHistory.use_count + amount, last_used_at=func.now())
+                        .execution_options(synchronize_session=False)
+                    )
+                    updated += result.rowcount or 0
+            self.session.commit()
+            logger.info(f"[ANALYZE_HISTORY] 사용 횟수 반영 ({len(counts)}건, 증가량 {sum(counts.values())})")
+            return updated
+        except IntegrityError:
             self.session.rollback()
-            logger.error(f"[ANALYZE_HISTORY] 사용 횟수 증가 실패: {str(e)}")
-            return False
-        finally:
-            self.session.close()
+            if flush_id is None:
+                raise
+            logger.warning(f"[ANALYZE_HISTORY] 이미 반영한 사용 횟수 배치라 건너뜁니다 (flush_id={flush_id})")
+            return 0
+        except Exception:
+            self.session.rollback()
+            raise
 
     def get_total_count(self) -> int:
         """
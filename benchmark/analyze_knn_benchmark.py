@@ -0,0 +1,162 @@
+"""
+ANALYZE_HISTORY 유사 패턴 검색 벤치마크
+
+기존 SQL 유사도 계산(±30% 범위 내 전체 행 점수 계산 후 ORDER BY)과
+인메모리 k-NN 인덱스(AnalyzePatternIndex) 검색을 이력 건수별로 비교한다.
+
+측정 항목:
+- index.load    : DB → 인덱스 전체 적재 시간
+- index.search  : top-k 검색 (NumPy)
+- sql.legacy    : 변경 전 SQL 검색 (--sql-max-rows 이하 크기에서만)
+
+기본 DB는 SQLite 파일 DB(임시 디렉터리)이며, --database-url로 MySQL 등 실제 DB를 지정할 수 있다.
+(지정한 DB의 ANALYZE_HISTORY 테이블은 측정 중 삭제/재생성되므로 전용 스키마를 사용할 것)
+
+실행 예시:
+    python -m benchmark.analyze_knn_benchmark --output bench_knn.json
+    python -m benchmark.analyze_knn_benchmark --sizes 10000,100000 --sql-max-rows 100000
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from asset_allocation.domain.service.future_assets_learning_service import FutureAssetsLearningService
+from asset_allocation.infrastructure.index.analyze_pattern_index import AnalyzePatternIndex
+from asset_allocation.infrastructure.orm.analyze_history import AnalyzeHistory
+from benchmark.bench_runner import BenchmarkRunner, build_arg_parser, finish
+
+_LEGACY_SQL = text("""
+    SELECT ANALYZE_ID, GPT_ADVICE, USE_COUNT,
+        (
+            ABS(MONTHLY_INCOME - :income) / :income * 100 +
+            ABS(MONTHLY_EXPENSE - :expense) / :expense * 100 +
+            ABS(EXPENSE_RATIO - :expense_ratio) * 5 +
+            ABS(SAVINGS_RATIO - :savings_ratio) * 5
+        ) AS similarity_score
+    FROM ANALYZE_HISTORY
+    WHERE MONTHLY_INCOME BETWEEN :income * 0.7 AND :income * 1.3
+        AND MONTHLY_EXPENSE BETWEEN :expense * 0.7 AND :expense * 1.3
+        AND ASSET_LEVEL = :asset_level
+    ORDER BY similarity_score ASC
+    LIMIT 1
+""")
+
+
+def _synthetic_pattern(rnd: random.Random) -> dict:
+    income = rnd.randrange(1_500_000, 12_000_000, 10_000)
+    expense = int(income * rnd.uniform(0.3, 1.2)) // 1000 * 1000
+    essential = round(rnd.uniform(20, 70), 2)
+    leisure = round(rnd.uniform(0, 100 - essential) * 0.5, 2)
+    investment = round(rnd.uniform(0, 100 - essential - leisure), 2)
+    surplus = income - expense
+    return {
+        "monthly_income": income,
+        "monthly_expense": expense,
+        "monthly_surplus": surplus,
+        "expense_ratio": round(expense / income * 100, 2),
+        "savings_ratio": round(surplus / income * 100, 2),
+        "essential_ratio": essential,
+        "leisure_ratio": leisure,
+        "investment_ratio": investment,
+        "other_ratio": round(100 - essential - leisure - investment, 2),
+        "asset_level": FutureAssetsLearningService._determine_asset_level(surplus),
+    }
+
+
+def _populate(engine, rows: int, chunk: int = 20000):
+    table = AnalyzeHistory.__table__
+    table.drop(engine, checkfirst=True)
+    table.create(engine)
+
+    rnd = random.Random(rows)
+    with engine.begin() as conn:
+        for start in range(0, rows, chunk):
+            conn.execute(insert(table), [
+                {
+                    **{k.upper(): v for k, v in _synthetic_pattern(rnd).items()},
+                    "GPT_ADVICE": "advice",
+                    "USE_COUNT": 1,
+                }
+                for _ in range(min(chunk, rows - start))
+            ])
+
+
+def run(args) -> BenchmarkRunner:
+    runner = BenchmarkRunner("analyze_knn")
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    tmp_dir = None
+    database_url = args.database_url
+    if not database_url:
+        tmp_dir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{os.path.join(tmp_dir.name, 'analyze_history.db')}"
+
+    engine = create_engine(database_url)
+    Session = sessionmaker(bind=engine)
+    queries = [_synthetic_pattern(random.Random(i)) for i in range(args.queries)]
+
+    try:
+        for rows in sizes:
+            print(f"\n▶ ANALYZE_HISTORY {rows}건 준비 중...")
+            _populate(engine, rows)
+            params = {"rows": rows}
+
+            index = AnalyzePatternIndex()
+            with Session() as session:
+                start = time.perf_counter_ns()
+                index.load(session)
+                runner.record("index.load", [time.perf_counter_ns() - start], params=params)
+
+            cursor = iter(range(1 << 62))
+            runner.measure(
+                "index.search",
+                lambda: index.search(queries[next(cursor) % len(queries)], k=args.k),
+                params={**params, "k": args.k},
+                iterations=args.iterations,
+            )
+
+            if rows <= args.sql_max_rows:
+                with Session() as session:
+                    cursor = iter(range(1 << 62))
+
+                    def legacy():
+                        q = queries[next(cursor) % len(queries)]
+                        session.execute(_LEGACY_SQL, {
+                            "income": q["monthly_income"],
+                            "expense": q["monthly_expense"],
+                            "expense_ratio": q["expense_ratio"],
+                            "savings_ratio": q["savings_ratio"],
+                            "asset_level": q["asset_level"],
+                        }).fetchone()
+
+                    runner.measure("sql.legacy", legacy, params=params,
+                                   iterations=args.sql_iterations, warmup=min(5, args.sql_iterations))
+    finally:
+        AnalyzeHistory.__table__.drop(engine, checkfirst=True)
+        engine.dispose()
+        if tmp_dir:
+            tmp_dir.cleanup()
+
+    return runner
+
+
+if __name__ == "__main__":
+    parser = build_arg_parser("ANALYZE_HISTORY 유사 패턴 검색 벤치마크 - SQL vs 인메모리 k-NN")
+    parser.add_argument("--database-url", default=None, help="측정 대상 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="이력 건수 목록 (쉼표 구분)")
+    parser.add_argument("--k", type=int, default=3, help="검색할 이웃 수")
+    parser.add_argument("--queries", type=int, default=200, help="질의 패턴 수")
+    parser.add_argument("--sql-iterations", type=int, default=50, help="SQL 검색 반복 횟수")
+    parser.add_argument("--sql-max-rows", type=int, default=1000000, help="SQL 검색을 측정할 최대 이력 건수")
+    args = parser.parse_args()
+    sys.exit(finish(run(args), args))
@@ -0,0 +1,157 @@
+"""
+벤치마크 공통 러너
+
+- 함수 단위 반복 측정 (warmup 후 iterations 회 측정)
+- 결과를 JSON 파일로 저장하여 릴리즈 간 회귀 추적
+- 이전 결과(JSON)와 비교하여 변화율 출력
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+
+class BenchmarkRunner:
+    """벤치마크 측정 및 결과 저장"""
+
+    def __init__(self, suite: str):
+        self.suite = suite
+        self.results: List[Dict[str, Any]] = []
+
+    def measure(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        params: Optional[Dict[str, Any]] = None,
+        iterations: int = 1000,
+        warmup: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        func를 반복 실행하여 호출당 소요 시간 측정
+
+        Args:
+            name: 측정 항목명 (예: "crypto.enc_data")
+            func: 인자 없는 측정 대상 함수
+            params: 결과에 함께 기록할 파라미터 (예: {"items": 100})
+            iterations: 측정 반복 횟수
+            warmup: 측정 전 예열 횟수
+
+        Returns:
+            측정 결과 딕셔너리
+        """
+        for _ in range(warmup):
+            func()
+
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
+            func()
+            samples.append(time.perf_counter_ns() - start)
+
+        return self.record(name, samples, params)
+
+    def record(self, name: str, samples_ns: List[int], params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """외부에서 측정한 샘플(ns)을 결과로 기록"""
+        samples_ns = sorted(samples_ns)
+        mean_ns = statistics.fmean(samples_ns)
+        # nearest-rank p95: ceil(0.95 * n)번째 값 (부동소수 오차 없이 정수로 올림)
+        p95_index = max(0, -(-95 * len(samples_ns) // 100) - 1)
+
+        result = {
+            "name": name,
+            "params": params or {},
+            "iterations": len(samples_ns),
+            "mean_us": round(mean_ns / 1000, 3),
+            "median_us": round(statistics.median(samples_ns) / 1000, 3),
+            "p95_us": round(samples_ns[p95_index] / 1000, 3),
+            "min_us": round(samples_ns[0] / 1000, 3),
+            "ops_per_sec": round(1_000_000_000 / mean_ns, 1) if mean_ns else None,
+        }
+        self.results.append(result)
+        print(
+            f"{name:<45} {json.dumps(result['params'], ensure_ascii=False):<20} "
+            f"mean={result['mean_us']:>10.3f}us  p95={result['p95_us']:>10.3f}us  "
+            f"ops/s={result['ops_per_sec']}"
+        )
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "suite": self.suite,
+            "meta": {
+                "created_at": datetime.now().isoformat(),
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "git_commit": _git_commit(),
+            },
+            "results": self.results,
+        }
+
+    def save(self, path: str):
+        """결과를 JSON으로 저장"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {path}")
+
+    def compare(self, baseline_path: str, threshold_pct: float = 10.0) -> bool:
+        """
+        기준 결과(JSON)와 비교하여 mean 변화율 출력
+
+        Returns:
+            threshold_pct 이상 느려진 항목이 없으면 True
+        """
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        baseline_map = {
+            (r["name"], json.dumps(r["params"], sort_keys=True)): r
+            for r in baseline.get("results", [])
+        }
+
+        ok = True
+        print(f"\n📊 기준 결과와 비교: {baseline_path} (commit={baseline.get('meta', {}).get('git_commit')})")
+        for r in self.results:
+            base = baseline_map.get((r["name"], json.dumps(r["params"], sort_keys=True)))
+            if not base or not base["mean_us"]:
+                continue
+
+            change = (r["mean_us"] - base["mean_us"]) / base["mean_us"] * 100
+            marker = "⚠️ " if change >= threshold_pct else "  "
+            if change >= threshold_pct:
+                ok = False
+            print(f"{marker}{r['name']:<45} {json.dumps(r['params'], ensure_ascii=False):<20} {change:+.1f}%")
+        return ok
+
+
+def build_arg_parser(description: str) -> argparse.ArgumentParser:
+    """벤치마크 스크립트 공통 CLI 인자"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 판단할 mean 증가율(%%)")
+    parser.add_argument("--iterations", type=int, default=1000, help="항목당 측정 반복 횟수")
+    return parser
+
+
+def finish(runner: BenchmarkRunner, args: argparse.Namespace) -> int:
+    """결과 저장/비교 후 종료 코드 반환 (회귀 시 1)"""
+    if args.output:
+        runner.save(args.output)
+    if args.baseline:
+        return 0 if runner.compare(args.baseline, args.threshold) else 1
+    return 0
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
@@ -0,0 +1,165 @@
+"""
+ETF 일일 적재(save_etf_batch) 벤치마크
+
+기존 방식(행마다 SELECT ... first() + add_all + 행마다 refresh)과
+현재 ProductRepositoryImpl.save_etf_batch를 10,000건 ETF 페이로드로 비교한다.
+
+시나리오:
+- new_day : 처음 적재하는 기준일자 (전부 INSERT)
+- reload  : 이미 적재된 기준일자를 다시 적재 (전부 중복 → 건너뜀)
+
+기본 DB는 SQLite 메모리 DB이며, --database-url로 MySQL 등 실제 DB를 지정할 수 있다.
+(지정한 DB의 product_etf 테이블은 측정 중 삭제/재생성되므로 전용 스키마를 사용할 것)
+
+실행 예시:
+    python -m benchmark.bulk_upsert_benchmark --output bench_bulk.json
+    python -m benchmark.bulk_upsert_benchmark --database-url "mysql+pymysql://user:pw@localhost/bench"
+"""
+
+import asyncio
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from benchmark.bench_runner import BenchmarkRunner, build_arg_parser, finish
+from config.database.db_executor import shutdown_db_executor
+from product.domain.product_etf import ProductEtf
+from product.infrastructure.orm.product_etf import ProductETFORM
+from product.infrastructure.repository.product_repository_impl import ProductRepositoryImpl
+
+
+def _synthetic_etfs(rows: int, bas_dt: datetime) -> list:
+    rnd = random.Random(rows)
+    return [
+        ProductEtf(
+            fltRt=round(rnd.uniform(-5, 5), 2),
+            nav=round(rnd.uniform(5000, 50000), 2),
+            mkp=rnd.randint(5000, 50000),
+            hipr=rnd.randint(5000, 50000),
+            lopr=rnd.randint(5000, 50000),
+            trqu=rnd.randint(0, 1_000_000),
+            trPrc=rnd.randint(0, 10_000_000_000),
+            mrktTotAmt=rnd.randint(1_000_000_000, 10_000_000_000_000),
+            nPptTotAmt=rnd.randint(1_000_000_000, 10_000_000_000_000),
+            stLstgCnt=rnd.randint(100_000, 100_000_000),
+            bssIdxIdxNm=f"지수{i % 300}",
+            bssIdxClpr=round(rnd.uniform(100, 5000), 2),
+            basDt=bas_dt,
+            clpr=rnd.randint(5000, 50000),
+            vs=rnd.randint(-500, 500),
+        )
+        for i in range(rows)
+    ]
+
+
+def _legacy_save_etf_batch(db, etf_list):
+    """변경 전 save_etf_batch (행마다 SELECT, 저장 후 행마다 refresh)"""
+    new_etf_list = []
+    for etf in etf_list:
+        existing = db.query(ProductETFORM).filter(ProductETFORM.basDt == etf.basDt).first()
+        if not existing:
+            new_etf_list.append(etf)
+
+    if not new_etf_list:
+        return etf_list
+
+    orm_list = [
+        ProductETFORM(
+            fltRt=e.fltRt, nav=e.nav, mkp=e.mkp, hipr=e.hipr, lopr=e.lopr, trqu=e.trqu, trPrc=e.trPrc,
+            mrktTotAmt=e.mrktTotAmt, nPptTotAmt=e.nPptTotAmt, stLstgCnt=e.stLstgCnt,
+            bssIdxIdxNm=e.bssIdxIdxNm, bssIdxClpr=e.bssIdxClpr, basDt=e.basDt, clpr=e.clpr, vs=e.vs,
+        )
+        for e in new_etf_list
+    ]
+    db.add_all(orm_list)
+    db.commit()
+    for orm_item in orm_list:
+        db.refresh(orm_item)
+    return etf_list
+
+
+def _current_save_etf_batch(db, etf_list):
+    return asyncio.run(ProductRepositoryImpl(db).save_etf_batch(etf_list))
+
+
+def _build_engine(database_url: str):
+    if database_url.startswith("sqlite"):
+        # DB 스레드 풀에서 실행되는 Repository와 같은 메모리 DB를 공유
+        return create_engine(database_url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+    return create_engine(database_url)
+
+
+def _measure_scenario(runner, engine, name, save, etfs, history_days, repeat, reload):
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
+    table = ProductETFORM.__table__
+    samples = []
+
+    for _ in range(repeat):
+        table.drop(engine, checkfirst=True)
+        table.create(engine)
+
+        # 과거 적재분 (중복 체크가 실제 테이블 크기에 영향을 받도록)
+        with Session() as db:
+            for day in range(1, history_days + 1):
+                db.bulk_save_objects(_to_orm(_shift(etfs, -day)))
+            db.commit()
+            if reload:
+                db.bulk_save_objects(_to_orm(etfs))
+                db.commit()
+
+        with Session() as db:
+            start = time.perf_counter_ns()
+            save(db, etfs)
+            samples.append(time.perf_counter_ns() - start)
+
+    runner.record(name, samples, params={"rows": len(etfs), "scenario": "reload" if reload else "new_day"})
+
+
+def _shift(etfs, days):
+    shifted = []
+    for e in etfs:
+        copy = ProductEtf(**vars(e))
+        copy.basDt = e.basDt + timedelta(days=days)
+        shifted.append(copy)
+    return shifted
+
+
+def _to_orm(etfs):
+    return [ProductETFORM(**vars(e)) for e in etfs]
+
+
+def run(args) -> BenchmarkRunner:
+    runner = BenchmarkRunner("bulk_upsert")
+    engine = _build_engine(args.database_url)
+    etfs = _synthetic_etfs(args.rows, datetime(2025, 1, 2))
+
+    try:
+        for reload in (False, True):
+            _measure_scenario(runner, engine, "save_etf_batch.legacy", _legacy_save_etf_batch,
+                              etfs, args.history_days, args.repeat, reload)
+            _measure_scenario(runner, engine, "save_etf_batch.current", _current_save_etf_batch,
+                              etfs, args.history_days, args.repeat, reload)
+    finally:
+        ProductETFORM.__table__.drop(engine, checkfirst=True)
+        shutdown_db_executor()
+
+    return runner
+
+
+if __name__ == "__main__":
+    parser = build_arg_parser("ETF 일일 적재(save_etf_batch) 벤치마크 - 행 단위 vs 집합 단위 중복 체크")
+    parser.add_argument("--database-url", default="sqlite://", help="측정 대상 DB URL (기본: SQLite 메모리)")
+    parser.add_argument("--rows", type=int, default=10000, help="ETF 페이로드 행 수")
+    parser.add_argument("--history-days", type=int, default=3, help="미리 적재해 둘 과거 일수")
+    parser.add_argument("--repeat", type=int, default=3, help="시나리오별 반복 횟수")
+    args = parser.parse_args()
+    sys.exit(finish(run(args), args))
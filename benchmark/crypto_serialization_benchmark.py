@@ -0,0 +1,127 @@
+"""
+암호화 / 직렬화 벤치마크
+
+측정 대상:
+- Crypto.enc_data / dec_data (AES-CBC + base64)
+- DBEncryption.encrypt / decrypt / encrypt_int (Fernet)
+- AICache.generate_cache_key (json.dumps(sort_keys=True) + md5)
+- Redis 해시 복호화 루프 (추천 UseCase의 _get_financial_data_from_redis)
+
+합성 세션 크기: 10 / 100 / 1000 항목
+
+실행 예시:
+    python -m benchmark.crypto_serialization_benchmark --output bench_crypto.json
+    python -m benchmark.crypto_serialization_benchmark --baseline bench_crypto.json
+"""
+
+import json
+import logging
+import sys
+from types import SimpleNamespace
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from benchmark.bench_runner import BenchmarkRunner, build_arg_parser, finish
+from config.crypto import Crypto
+from util.cache.ai_cache import AICache
+from util.log.log import Log
+from util.security.db_encryption import DBEncryption
+
+SESSION_SIZES = [10, 100, 1000]
+
+
+class _FakeRedisHash:
+    """hgetall만 제공하는 합성 세션 저장소 (네트워크 비용 제외, 복호화 루프만 측정)"""
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def hgetall(self, _session_id: str) -> dict:
+        return self._data
+
+
+def _synthetic_items(size: int) -> dict:
+    """소득/지출 항목 합성 데이터 ("타입:필드명" → 금액 문자열)"""
+    items = {}
+    for i in range(size):
+        doc_type = "소득" if i % 2 == 0 else "지출"
+        items[f"{doc_type}:항목{i}"] = f"{(i + 1) * 12345:,}"
+    return items
+
+
+def _encrypted_session(crypto: Crypto, items: dict) -> dict:
+    """Redis에 저장되는 형태(키/값 모두 암호화)로 변환"""
+    session = {"USER_TOKEN": "GUEST"}
+    for key, value in items.items():
+        session[crypto.enc_data(key)] = crypto.enc_data(value)
+    return session
+
+
+def run(args) -> BenchmarkRunner:
+    # 복호화 루프 내부 info 로그가 결과를 오염시키지 않도록 경고 이상만 출력
+    Log.get_logger().setLevel(logging.WARNING)
+
+    from recommendation.application.usecase.etf_recommendation_usecase import ETFRecommendationUseCase
+
+    runner = BenchmarkRunner("crypto_serialization")
+    crypto = Crypto.get_instance()
+    iterations = args.iterations
+
+    # 1) 단건 암복호화
+    sample_text = "소득:급여"
+    aes_cipher = crypto.enc_data(sample_text)
+    runner.measure("crypto.enc_data", lambda: crypto.enc_data(sample_text), iterations=iterations)
+    runner.measure("crypto.dec_data", lambda: crypto.dec_data(aes_cipher), iterations=iterations)
+
+    fernet_cipher = DBEncryption.encrypt(sample_text)
+    fernet_int_cipher = DBEncryption.encrypt_int(3000000)
+    runner.measure("db_encryption.encrypt", lambda: DBEncryption.encrypt(sample_text), iterations=iterations)
+    runner.measure("db_encryption.decrypt", lambda: DBEncryption.decrypt(fernet_cipher), iterations=iterations)
+    runner.measure("db_encryption.encrypt_int", lambda: DBEncryption.encrypt_int(3000000), iterations=iterations)
+    runner.measure("db_encryption.decrypt_int", lambda: DBEncryption.decrypt_int(fernet_int_cipher), iterations=iterations)
+
+    # 2) 세션 크기별 직렬화 / 복호화 루프
+    for size in SESSION_SIZES:
+        params = {"items": size}
+        items = _synthetic_items(size)
+        loop_iterations = max(10, iterations // size)
+
+        runner.measure(
+            "ai_cache.generate_cache_key",
+            lambda: AICache.generate_cache_key(
+                json.dumps(items, ensure_ascii=False, sort_keys=True), "categorize-income"
+            ),
+            params=params,
+            iterations=loop_iterations,
+        )
+
+        holder = SimpleNamespace(
+            redis_client=_FakeRedisHash(_encrypted_session(crypto, items)),
+            crypto=crypto,
+        )
+        runner.measure(
+            "redis_hash.decode_loop",
+            lambda: ETFRecommendationUseCase._get_financial_data_from_redis(holder, "bench-session"),
+            params=params,
+            iterations=loop_iterations,
+            warmup=3,
+        )
+
+        plain_values = [str((i + 1) * 12345) for i in range(size)]
+        runner.measure(
+            "db_encryption.encrypt_int.batch",
+            lambda: [DBEncryption.encrypt_int(int(v)) for v in plain_values],
+            params=params,
+            iterations=loop_iterations,
+            warmup=3,
+        )
+
+    return runner
+
+
+if __name__ == "__main__":
+    parser = build_arg_parser("Crypto / DBEncryption / 캐시 키 / Redis 해시 복호화 벤치마크")
+    args = parser.parse_args()
+    sys.exit(finish(run(args), args))
@@ -0,0 +1,96 @@
+"""
+DB 호출 동시성 벤치마크
+
+Repository 메서드가 이벤트 루프에서 동기 쿼리를 그대로 실행할 때(inline)와
+DB 전용 스레드 풀로 넘길 때(offload, @db_offload)의 동시 요청 처리량을 비교한다.
+
+- DB 왕복은 블로킹 I/O(time.sleep)로 모사 (pymysql 소켓 대기와 동일하게 GIL 해제)
+- 요청마다 session_scope()를 열어 실제 요청 처리 경로(ContextVar 세션 + 세션 락)를 그대로 사용
+- 결과의 ops_per_sec = 초당 처리 요청 수
+
+실행 예시:
+    python -m benchmark.db_concurrency_benchmark --output bench_db.json
+    python -m benchmark.db_concurrency_benchmark --latency-ms 2 --baseline bench_db.json
+"""
+
+import asyncio
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from benchmark.bench_runner import BenchmarkRunner, build_arg_parser, finish
+from config.database.db_executor import DB_EXECUTOR_WORKERS, db_offload, shutdown_db_executor
+from config.database.session import session_scope
+
+CONCURRENCY_LEVELS = [1, 10, 50]
+
+
+class _SyntheticRepository:
+    """쿼리 1회 = latency 만큼 블로킹되는 합성 Repository"""
+
+    def __init__(self, latency_sec: float):
+        self.latency_sec = latency_sec
+
+    def _query(self) -> int:
+        time.sleep(self.latency_sec)
+        return 1
+
+    async def get_inline(self) -> int:
+        # 기존 방식: async def 안에서 동기 쿼리 실행 → 이벤트 루프 블로킹
+        return self._query()
+
+    @db_offload
+    def get_offload(self) -> int:
+        return self._query()
+
+
+async def _handle_request(method) -> int:
+    # DBSessionMiddleware와 동일하게 요청 1건 = session_scope 1개
+    with session_scope():
+        return await method()
+
+
+async def _run_batch(method, concurrency: int) -> int:
+    start = time.perf_counter_ns()
+    await asyncio.gather(*(_handle_request(method) for _ in range(concurrency)))
+    return time.perf_counter_ns() - start
+
+
+async def _measure(runner: BenchmarkRunner, name: str, method, concurrency: int, batches: int):
+    await _run_batch(method, concurrency)  # warmup (스레드 풀 생성 포함)
+
+    # 배치 소요 시간을 요청 수로 나눠 기록 → ops_per_sec가 처리량(req/s)이 된다
+    samples = []
+    for _ in range(batches):
+        samples.append(await _run_batch(method, concurrency) // concurrency)
+    runner.record(name, samples, params={"concurrency": concurrency})
+
+
+async def _run(args) -> BenchmarkRunner:
+    runner = BenchmarkRunner("db_concurrency")
+    repository = _SyntheticRepository(args.latency_ms / 1000)
+    batches = max(5, args.iterations // 100)
+
+    print(f"DB latency={args.latency_ms}ms, db executor workers={DB_EXECUTOR_WORKERS}, batches={batches}")
+    for concurrency in CONCURRENCY_LEVELS:
+        await _measure(runner, "repository.inline", repository.get_inline, concurrency, batches)
+        await _measure(runner, "repository.offload", repository.get_offload, concurrency, batches)
+
+    return runner
+
+
+def run(args) -> BenchmarkRunner:
+    try:
+        return asyncio.run(_run(args))
+    finally:
+        shutdown_db_executor()
+
+
+if __name__ == "__main__":
+    parser = build_arg_parser("Repository DB 호출 동시 처리량 벤치마크 (inline vs DB 스레드 풀)")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="모사할 DB 왕복 지연(ms)")
+    args = parser.parse_args()
+    sys.exit(finish(run(args), args))
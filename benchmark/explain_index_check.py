@@ -0,0 +1,127 @@
+"""
+일자/월 조회 쿼리 인덱스 사용 여부 점검 (MySQL EXPLAIN)
+
+Repository 조회 메서드를 실제로 실행하면서 발생한 SELECT를 가로채
+그 SELECT를 실행한 엔진(primary / 읽기 복제본)에서 EXPLAIN을 수행하고, 풀스캔(type=ALL)이거나 인덱스를 쓰지 않으면 실패 처리한다.
+
+- 대상: get_etf/fund/bond_data_by_date, get_exchange/interest_rate_by_date
+- --create-missing: 기존 DB에 ORM에 선언된 인덱스가 없으면 생성 (create_all은 기존 테이블을 변경하지 않음)
+- 행이 거의 없는 테이블은 옵티마이저가 풀스캔을 선택할 수 있으므로 데이터가 적재된 DB에서 실행할 것
+
+실행 예시:
+    python -m benchmark.explain_index_check --day 20250102 --month 202501
+    python -m benchmark.explain_index_check --create-missing
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from sqlalchemy.engine import Engine
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import event, text
+
+from config.database.session import engine, read_engine, session_scope
+from ecos.infrastructure.orm.exchange_rate import ExchangeRateORM
+from ecos.infrastructure.orm.interest_rate import InterestRateORM
+from ecos.infrastructure.repository.ecos_repository_impl import EcosRepositoryImpl
+from product.infrastructure.orm.product_bond import ProductBondORM
+from product.infrastructure.orm.product_etf import ProductETFORM
+from product.infrastructure.orm.product_fund import ProductFundORM
+from product.infrastructure.repository.product_repository_impl import ProductRepositoryImpl
+
+INDEXED_MODELS = [ProductETFORM, ProductFundORM, ProductBondORM, ExchangeRateORM, InterestRateORM]
+
+# 조회는 read_db(MYSQL_READ_HOST 설정 시 복제본)로 가므로 두 엔진 모두 감시
+ENGINES = (engine,) if read_engine is engine else (engine, read_engine)
+
+
+def create_missing_indexes():
+    """ORM __table_args__에 선언된 인덱스 중 DB에 없는 것만 생성"""
+    for model in INDEXED_MODELS:
+        for index in model.__table__.indexes:
+            index.create(bind=engine, checkfirst=True)
+            print(f"✅ {model.__tablename__}.{index.name}")
+
+
+def _capture_selects(call: Callable[[], object]) -> List[Tuple[Engine, str, object]]:
+    """call 실행 중 발생한 SELECT 문과 파라미터, 실행한 엔진 수집"""
+    captured = []
+
+    def _listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((conn.engine, statement, parameters))
+
+    for target in ENGINES:
+        event.listen(target, "before_cursor_execute", _listener)
+    try:
+        call()
+    finally:
+        for target in ENGINES:
+            event.remove(target, "before_cursor_execute", _listener)
+    return captured
+
+
+def _explain(target: Engine, statement: str, parameters) -> List[dict]:
+    with target.connect() as conn:
+        result = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        return [dict(row._mapping) for row in result]
+
+
+def check(day: str, month: str) -> bool:
+    product_repository = ProductRepositoryImpl()
+    ecos_repository = EcosRepositoryImpl()
+
+    targets = [
+        ("get_etf_data_by_date", lambda: asyncio.run(product_repository.get_etf_data_by_date(day))),
+        ("get_fund_data_by_date", lambda: asyncio.run(product_repository.get_fund_data_by_date(day))),
+        ("get_bond_data_by_date", lambda: asyncio.run(product_repository.get_bond_data_by_date(day))),
+        ("get_exchange_rate_by_date", lambda: ecos_repository.get_exchange_rate_by_date(month)),
+        ("get_interest_rate_by_date", lambda: ecos_repository.get_interest_rate_by_date(month)),
+    ]
+
+    ok = True
+    for name, call in targets:
+        with session_scope():
+            statements = _capture_selects(call)
+
+        if not statements:
+            print(f"⚠️  {name}: 실행된 SELECT가 없습니다.")
+            ok = False
+            continue
+
+        for target, statement, parameters in statements:
+            source = "primary" if target is engine else "replica"
+            for row in _explain(target, statement, parameters):
+                access_type, key = row.get("type"), row.get("key")
+                passed = access_type != "ALL" and key is not None
+                ok = ok and passed
+                marker = "✅" if passed else "❌"
+                print(
+                    f"{marker} {name:<28} [{source}] table={row.get('table')} "
+                    f"type={access_type} key={key} rows={row.get('rows')}"
+                )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="일자/월 조회 쿼리 EXPLAIN 인덱스 사용 점검")
+    parser.add_argument("--day", default=datetime.now().strftime("%Y%m%d"), help="조회 기준일 (YYYYMMDD)")
+    parser.add_argument("--month", default=datetime.now().strftime("%Y%m"), help="조회 기준월 (YYYYMM)")
+    parser.add_argument("--create-missing", action="store_true", help="누락된 인덱스 생성 후 점검")
+    args = parser.parse_args()
+
+    if args.create_missing:
+        create_missing_indexes()
+
+    return 0 if check(args.day, args.month) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
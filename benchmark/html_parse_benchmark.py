@@ -0,0 +1,197 @@
+"""
+HTML 파싱 벤치마크
+
+측정 대상:
+- 페이지 1건 파싱: 전체 트리 파싱(full, 기존 방식) vs 필요한 영역만 파싱(strainer)
+  - 네이버 뉴스 기사 본문 (#dic_area)
+  - 팍스넷 게시판 목록 (ul#comm-list) / 게시글 본문 (#bbsWrtCntn)
+- 기사 40건 동시 파싱 처리량: 이벤트 루프에서 직접(inline) vs 파싱 프로세스 풀(pool)
+  - 결과의 ops_per_sec = 초당 처리 페이지 수
+  - event_loop.max_lag = 파싱 중 다른 요청(코루틴)이 기다린 최대 시간
+
+합성 페이지: 실제 페이지처럼 헤더 / 메뉴 / 스크립트 / 추천 기사 / 댓글 영역이 본문보다 훨씬 큼
+
+실행 예시:
+    python -m benchmark.html_parse_benchmark --output bench_html.json
+    python -m benchmark.html_parse_benchmark --pages 40 --baseline bench_html.json
+"""
+
+import asyncio
+import sys
+import time
+from typing import Callable, Optional
+
+from bs4 import BeautifulSoup
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from benchmark.bench_runner import BenchmarkRunner, build_arg_parser, finish
+from community.infrastructure.parser.paxnet_parser import extract_post_body, parse_board_list
+from config.parse_executor import PARSE_EXECUTOR_WORKERS, run_in_parse_executor, shutdown_parse_executor
+from news_info.infrastructure.parser.naver_article_parser import extract_article_text
+
+
+def _page_chrome(seed: int) -> str:
+    """본문 외 영역 (메뉴 / 스크립트 / 추천 기사 / 댓글)"""
+    menu = "".join(f"<li><a href='/section/{i}'>섹션 {i}</a></li>" for i in range(80))
+    scripts = "".join(f"<script>var cfg{i} = {{'id': {i}, 'seed': {seed}}};</script>" for i in range(30))
+    related = "".join(
+        f"<div class='related'><a href='/article/{seed}/{i}'><strong>추천 기사 {i}</strong>"
+        f"<span class='press'>언론사</span><em>{i}분 전</em></a></div>"
+        for i in range(120)
+    )
+    comments = "".join(
+        f"<div class='comment'><span class='nick'>user{i}</span><p>댓글 내용 {i} 코스피 환율 금리</p>"
+        f"<button>좋아요 {i}</button></div>"
+        for i in range(200)
+    )
+    return f"<header><ul class='menu'>{menu}</ul></header>{scripts}<aside>{related}</aside><section>{comments}</section>"
+
+
+def _naver_article_html(seed: int) -> str:
+    body = "".join(f"<p>코스피가 {seed}일 외국인 매수에 상승 마감했다. 문단 {i}.</p><br>" for i in range(25))
+    return (
+        "<html><head><title>기사</title></head><body>"
+        f"{_page_chrome(seed)}"
+        f"<div id='newsct_article'><article id='dic_area'>{body}</article></div>"
+        f"{_page_chrome(seed + 1)}"
+        "</body></html>"
+    )
+
+
+def _paxnet_list_html(seed: int) -> str:
+    items = "".join(
+        "<li>"
+        f"<div class='type' data-seq='{seed * 1000 + i}'></div>"
+        f"<div class='title'><p class='tit'><a class='best-title'>게시글 {i}</a></p><b class='comment-num'>[{i}]</b></div>"
+        f"<div class='write'><a>작성자{i}</a></div>"
+        f"<div class='viewer'>조회 {i * 10:,}</div><div class='like'>추천 {i}</div>"
+        f"<div class='date'><span class='data-date-format' data-date-format='20251211194332'></span></div>"
+        "</li>"
+        for i in range(30)
+    )
+    return f"<html><body>{_page_chrome(seed)}<ul id='comm-list'>{items}</ul>{_page_chrome(seed + 1)}</body></html>"
+
+
+def _paxnet_post_html(seed: int) -> str:
+    body = "".join(f"<p>게시글 본문 {i} 삼성전자 반도체</p>" for i in range(15))
+    return (
+        f"<html><body>{_page_chrome(seed)}"
+        f"<div id='bbsWrtCntn'>{body}<script>track({seed})</script></div>"
+        f"{_page_chrome(seed + 1)}</body></html>"
+    )
+
+
+# ------------------------------------------------------
+# 기존 방식 (전체 트리 파싱)
+# ------------------------------------------------------
+
+def _full_parse_article(page_html: str) -> Optional[str]:
+    soup = BeautifulSoup(page_html, "html.parser")
+    node = soup.select_one("#dic_area") or soup.select_one("#newsct_article") or soup.select_one("#articleBodyContents")
+    return node.get_text(" ", strip=True) if node else None
+
+
+def _full_parse_list(html: str) -> int:
+    soup = BeautifulSoup(html, "html.parser")
+    ul = soup.select_one("ul#comm-list")
+    return len(ul.find_all("li", recursive=False)) if ul else 0
+
+
+def _full_parse_body(html: str) -> str:
+    soup = BeautifulSoup(html, "html.parser")
+    root = soup.select_one("#bbsWrtCntn")
+    return root.get_text(" ", strip=True) if root else ""
+
+
+# ------------------------------------------------------
+# 동시 파싱 처리량
+# ------------------------------------------------------
+
+async def _inline(func: Callable, html: str):
+    return func(html)
+
+
+async def _pooled(func: Callable, html: str):
+    return await run_in_parse_executor(func, html)
+
+
+async def _run_batch(parse, pages: list) -> tuple:
+    """페이지를 동시에 파싱하는 동안 이벤트 루프 지연(1ms 주기 코루틴의 최대 대기)도 함께 측정"""
+    max_lag = 0
+    done = False
+
+    async def _probe():
+        nonlocal max_lag
+        while not done:
+            expected = time.perf_counter_ns() + 1_000_000
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, time.perf_counter_ns() - expected)
+
+    probe = asyncio.create_task(_probe())
+    await asyncio.sleep(0)
+    start = time.perf_counter_ns()
+    await asyncio.gather(*(parse(extract_article_text, page) for page in pages))
+    elapsed = time.perf_counter_ns() - start
+    done = True
+    await probe
+    return elapsed, max_lag
+
+
+async def _measure_concurrent(runner: BenchmarkRunner, name: str, parse, pages: list, batches: int):
+    await _run_batch(parse, pages)  # warmup (프로세스 생성 / 모듈 import 포함)
+
+    # 배치 소요 시간을 페이지 수로 나눠 기록 → ops_per_sec가 처리량(pages/s)이 된다
+    samples, lags = [], []
+    for _ in range(batches):
+        elapsed, lag = await _run_batch(parse, pages)
+        samples.append(elapsed // len(pages))
+        lags.append(lag)
+    params = {"pages": len(pages)}
+    runner.record(name, samples, params=params)
+    runner.record(f"{name}.event_loop.max_lag", lags, params=params)
+
+
+async def _run_concurrent(runner: BenchmarkRunner, pages: list, batches: int):
+    await _measure_concurrent(runner, "naver.article.inline", _inline, pages, batches)
+    await _measure_concurrent(runner, "naver.article.pool", _pooled, pages, batches)
+
+
+def run(args) -> BenchmarkRunner:
+    runner = BenchmarkRunner("html_parse")
+    iterations = max(10, args.iterations // 20)
+
+    article = _naver_article_html(1)
+    board = _paxnet_list_html(1)
+    post = _paxnet_post_html(1)
+    assert _full_parse_article(article) == extract_article_text(article)
+    assert _full_parse_list(board) == len(parse_board_list(board, "N00801", max_posts=100))
+    assert _full_parse_body(post) == extract_post_body(post)
+
+    print(f"page size: article={len(article) // 1024}KB list={len(board) // 1024}KB post={len(post) // 1024}KB")
+
+    # 1) 페이지 1건 파싱
+    runner.measure("naver.article.full", lambda: _full_parse_article(article), iterations=iterations, warmup=3)
+    runner.measure("naver.article.strainer", lambda: extract_article_text(article), iterations=iterations, warmup=3)
+    runner.measure("paxnet.list.full", lambda: _full_parse_list(board), iterations=iterations, warmup=3)
+    runner.measure("paxnet.list.strainer", lambda: parse_board_list(board, "N00801"), iterations=iterations, warmup=3)
+    runner.measure("paxnet.post.full", lambda: _full_parse_body(post), iterations=iterations, warmup=3)
+    runner.measure("paxnet.post.strainer", lambda: extract_post_body(post), iterations=iterations, warmup=3)
+
+    # 2) 동시 파싱 처리량 (브리핑 1회 = 최대 limit*4 건)
+    print(f"parse executor workers={PARSE_EXECUTOR_WORKERS}, pages={args.pages}")
+    pages = [_naver_article_html(seed) for seed in range(args.pages)]
+    try:
+        asyncio.run(_run_concurrent(runner, pages, batches=max(3, iterations // 10)))
+    finally:
+        shutdown_parse_executor()
+
+    return runner
+
+
+if __name__ == "__main__":
+    parser = build_arg_parser("HTML 파싱 벤치마크 (전체 파싱 vs SoupStrainer, 이벤트 루프 vs 프로세스 풀)")
+    parser.add_argument("--pages", type=int, default=40, help="동시 파싱할 기사 수")
+    args = parser.parse_args()
+    sys.exit(finish(run(args), args))
@@ -1,10 +1,11 @@
 from community.adapter.output.paxnet.community_api_adapter import PaxnetCommunityAdapter
 from community.application.usecase.fetch_community_usecase import FetchCommunityUsecase
 from community.infrastructure.repository.community_repository_impl import CommunityRepositoryImpl
+from ingestion.application.factory.ingestion_state_usecase_factory import IngestionStateUsecaseFactory
 
 class FetchCommunityUsecaseFactory:
     @staticmethod
     def create():
         adapter = PaxnetCommunityAdapter()
         repo = CommunityRepositoryImpl.get_instance()
-        return FetchCommunityUsecase(adapter, repo)
\ No newline at end of file
+        return FetchCommunityUsecase(adapter, repo, IngestionStateUsecaseFactory.create())
\ No newline at end of file
@@ -1,13 +1,22 @@
+import time
+from datetime import date
 from typing import List
 from community.adapter.output.paxnet.community_api_adapter import PaxnetCommunityAdapter
 from community.application.port.community_repository_port import CommunityRepositoryPort
 from community.domain.value_object.community_post import CommunityPost
+from config.database.db_executor import run_in_db_executor
+from ingestion.application.usecase.ingestion_state_usecase import IngestionStateUseCase
+from ingestion.infrastructure.orm.ingestion_state import IngestionStatus
+
+# 적재 상태 데이터셋 이름 (게시판별)
+DATASET_COMMUNITY = "community_paxnet"
 
 
 class FetchCommunityUsecase:
-    def __init__(self, adapter: PaxnetCommunityAdapter, repository: CommunityRepositoryPort):
+    def __init__(self, adapter: PaxnetCommunityAdapter, repository: CommunityRepositoryPort, ingestion: IngestionStateUseCase):
         self.adapter = adapter
         self.repository = repository
+        self.ingestion = ingestion
 
     async def fetch_latest(self, board_id: str, page: int = 1, limit: int = 50) -> List[CommunityPost]:
         posts = await self.adapter.fetch_latest(
@@ -18,11 +27,23 @@ class FetchCommunityUsecase:
         return posts
 
     async def fetch_and_save_latest(self, board_id: str, page: int = 1, limit: int = 50) -> List[CommunityPost]:
-        posts = await self.adapter.fetch_latest(
-            board_id=board_id,
-            page=page,
-            max_posts=limit,
-        )
-        if posts:
-            self.repository.save_post_batch(posts)
+        dataset = f"{DATASET_COMMUNITY}.{board_id}"
+        started = time.perf_counter()
+        try:
+            posts = await self.adapter.fetch_latest(
+                board_id=board_id,
+                page=page,
+                max_posts=limit,
+            )
+            if posts:
+                await run_in_db_executor(self.repository.save_post_batch, posts)
+        except Exception as e:
+            await self.ingestion.record(
+                dataset, None, 0, (time.perf_counter() - started) * 1000, IngestionStatus.FAILED, str(e)
+            )
+            raise
+
+        # 최신 목록 수집이므로 수집한 날짜를 적재 완료 일자로 기록
+        today = date.today()
+        await self.ingestion.record(dataset, (today, today), len(posts), (time.perf_counter() - started) * 1000)
         return posts
\ No newline at end of file
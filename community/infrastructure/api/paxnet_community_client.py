@@ -1,10 +1,14 @@
-import aiohttp
 from typing import Optional
 
+from config.http_client import HttpClientRegistry
+
 
 class PaxnetCommunityClient:
     BASE_URL = "https://www.paxnet.co.kr"
 
+    def __init__(self, http: Optional[HttpClientRegistry] = None):
+        self.http = http or HttpClientRegistry.get_instance()
+
     async def fetch_board_html(
         self,
         board_id: str,
@@ -21,10 +25,9 @@ class PaxnetCommunityClient:
         }
         url = f"{self.BASE_URL}/tbbs/list"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as resp:
-                resp.raise_for_status()
-                return await resp.text()
+        async with self.http.session().get(url, params=params) as resp:
+            resp.raise_for_status()
+            return await resp.text()
 
     async def fetch_post_html(self, board_id: str, seq: str) -> str:
         """
@@ -37,7 +40,6 @@ class PaxnetCommunityClient:
         }
         url = f"{self.BASE_URL}/tbbs/view"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as resp:
-                resp.raise_for_status()
-                return await resp.text()
\ No newline at end of file
+        async with self.http.session().get(url, params=params) as resp:
+            resp.raise_for_status()
+            return await resp.text()
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+팍스넷 게시판 목록 / 게시글 본문 파서
+
+파싱 프로세스 풀(config.parse_executor)에서 실행되므로 bs4와 도메인 값 객체 외에는 가져오지 않는다.
+"""
+
+import re
+from datetime import datetime
+from typing import List
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from community.domain.value_object.community_post import CommunityPost
+
+PROVIDER = "PAXNET_COMMUNITY"
+
+# 필요한 영역만 트리로 만듦 (목록: ul#comm-list / 본문: #bbsWrtCntn)
+_LIST_STRAINER = SoupStrainer("ul", id="comm-list")
+_BODY_STRAINER = SoupStrainer(id="bbsWrtCntn")
+
+
+def parse_board_list(html: str, board_id: str, max_posts: int = 20) -> List[CommunityPost]:
+    """게시판 목록 HTML → 게시글 목록 (본문은 빈 값, 상세에서 채움)"""
+    soup = BeautifulSoup(html, "html.parser", parse_only=_LIST_STRAINER)
+
+    ul = soup.find("ul", id="comm-list")
+    if not ul:
+        return []
+
+    posts: list[CommunityPost] = []
+
+    for li in ul.find_all("li", recursive=False):
+        type_div = li.select_one("div.type")
+        if not type_div:
+            continue
+
+        seq = type_div.get("data-seq")
+        if not seq:
+            continue
+
+        external_post_id = seq
+
+        title_a = li.select_one("div.title p.tit a.best-title")
+        if not title_a:
+            continue
+
+        title = title_a.get_text(strip=True)
+
+        author_tag = li.select_one("div.write a")
+        author = author_tag.get_text(strip=True) if author_tag else ""
+
+        view_el = li.select_one("div.viewer")
+        view_count = _extract_first_int(view_el.get_text()) if view_el else None
+
+        like_el = li.select_one("div.like")
+        recommend_count = _extract_first_int(like_el.get_text()) if like_el else None
+
+        comment_b = li.select_one("b.comment-num")
+        comment_count = _extract_first_int(comment_b.get_text()) if comment_b else 0
+
+        date_span = li.select_one("div.date span.data-date-format")
+        posted_at = _parse_paxnet_datetime(date_span)
+
+        url = f"https://www.paxnet.co.kr/tbbs/view?id={board_id}&seq={seq}"
+
+        posts.append(
+            CommunityPost(
+                provider=PROVIDER,
+                board_id=board_id,
+                external_post_id=str(external_post_id),
+                title=title,
+                author=author,
+                content="",  # 상세에서 채움
+                url=url,
+                view_count=view_count,
+                recommend_count=recommend_count,
+                comment_count=comment_count,
+                posted_at=posted_at,
+                fetched_at=datetime.now(),
+            )
+        )
+
+        if len(posts) >= max_posts:
+            break
+
+    return posts
+
+
+def extract_post_body(html: str) -> str:
+    """게시글 상세 HTML → 본문 텍스트"""
+    soup = BeautifulSoup(html, "html.parser", parse_only=_BODY_STRAINER)
+
+    root = soup.find(id="bbsWrtCntn")
+    if not root:
+        return ""
+
+    # script/style 제거
+    for t in root(["script", "style"]):
+        t.decompose()
+
+    return root.get_text(" ", strip=True)
+
+
+def _extract_first_int(text: str) -> int | None:
+    """문자열 내 첫 번째 숫자를 int로 반환"""
+    if not text:
+        return None
+
+    m = re.search(r"(\d+)", text.replace(",", ""))
+    if not m:
+        return None
+
+    try:
+        return int(m.group(1))
+    except:
+        return None
+
+
+def _parse_paxnet_datetime(span) -> datetime:
+    if not span:
+        return datetime.now()
+
+    raw = (span.get("data-date-format") or span.get_text(strip=True)).strip()
+
+    # case 1 : "20251211194332"
+    if raw.isdigit() and len(raw) == 14:
+        return datetime.strptime(raw, "%Y%m%d%H%M%S")
+
+    # case 2 : "Thu Dec 11 21:48:07 KST 2025"
+    weekdays = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+    if raw.startswith(weekdays):
+        raw2 = raw.replace(" KST", "")
+        return datetime.strptime(raw2, "%a %b %d %H:%M:%S %Y")
+
+    # fallback
+    return datetime.now()
@@ -1,9 +1,12 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
 
+from sqlalchemy import func
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
-from config.database.session import get_db_session
+from config.database.bulk_upsert import insert_ignore_duplicates
+from config.database.keyset import stream_keyset
+from config.database.session import get_current_read_session, get_current_session
 from community.application.port.community_repository_port import CommunityRepositoryPort
 from community.domain.value_object.community_post import CommunityPost
 from community.infrastructure.orm.community_post_orm import CommunityPostORM
@@ -12,95 +15,87 @@ from datetime import datetime, timedelta
 class CommunityRepositoryImpl(CommunityRepositoryPort):
     __instance = None
 
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-        return cls.__instance
-
     @classmethod
     def get_instance(cls) -> "CommunityRepositoryImpl":
         if cls.__instance is None:
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, "db"):
-            self.db: Session = get_db_session()
+    def __init__(self, session: Optional[Session] = None):
+        # session을 주입하지 않으면 현재 Unit of Work(요청/스케줄 작업)의 세션을 사용
+        self._session = session
+
+    @property
+    def db(self) -> Session:
+        return self._session or get_current_session()
+
+    @property
+    def read_db(self) -> Session:
+        # 조회 전용: 복제본으로 라우팅 (같은 Unit of Work에서 쓰기 이후에는 primary)
+        return self._session or get_current_read_session()
 
     def save_post_batch(self, posts: List[CommunityPost]) -> List[CommunityPost]:
 
-        try:
-            """
-            provider + board_id + external_post_id 기준으로
-            이미 DB에 있는 글은 건너뛰고, 새로운 글만 insert
-            """
-            if not posts:
-                return []
-
-            new_list: List[CommunityPost] = []
-
-            for p in posts:
-                existing = (
-                    self.db.query(CommunityPostORM)
-                    .filter(
-                        and_(
-                            CommunityPostORM.provider == p.provider,
-                            CommunityPostORM.board_id == p.board_id,
-                            CommunityPostORM.external_post_id == p.external_post_id,
-                        )
-                    )
-                    .first()
-                )
-
-                if not existing:
-                    new_list.append(p)
-
-            # 전부 중복이면 그냥 원본 리스트 리턴
-            if not new_list:
-                return posts
-
-            orm_list: List[CommunityPostORM] = []
-            for p in new_list:
-                orm_list.append(
-                    CommunityPostORM(
-                        provider=p.provider,
-                        board_id=p.board_id,
-                        external_post_id=p.external_post_id,
-                        title=p.title,
-                        author=p.author,
-                        content=p.content,
-                        url=p.url,
-                        view_count=p.view_count,
-                        recommend_count=p.recommend_count,
-                        comment_count=p.comment_count,
-                        posted_at=p.posted_at,
-                        fetched_at=p.fetched_at,
-                    )
-                )
-
-            self.db.add_all(orm_list)
-            self.db.commit()
-
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
-
-            return posts
-        finally:
-            self.db.close()
-
-    async def get_three_month_community_for_card_news(self) -> List[CommunityPostORM]:
-
-        three_months_ago = datetime.utcnow() - timedelta(days=90)
-
-        try:
-            rows = (
-                self.db.query(CommunityPostORM)
-                .filter(CommunityPostORM.posted_at >= three_months_ago)
-                .order_by(CommunityPostORM.posted_at.desc())
-                .all()
-            )
-
-            return rows
-
-        finally:
-            self.db.close()
\ No newline at end of file
+        """
+        provider + board_id + external_post_id 기준으로
+        이미 DB에 있는 글은 건너뛰고, 새로운 글만 insert
+        """
+        if not posts:
+            return []
+
+        rows = [
+            {
+                "provider": p.provider,
+                "board_id": p.board_id,
+                "external_post_id": p.external_post_id,
+                "title": p.title,
+                "author": p.author,
+                "content": p.content,
+                "url": p.url,
+                "view_count": p.view_count,
+                "recommend_count": p.recommend_count,
+                "comment_count": p.comment_count,
+                "posted_at": p.posted_at,
+                "fetched_at": p.fetched_at,
+            }
+            for p in posts
+        ]
+
+        # (provider, board_id, external_post_id) 유니크 제약으로 중복 글은 DB가 건너뜀
+        insert_ignore_duplicates(self.db, CommunityPostORM, rows)
+        self.db.commit()
+
+        return posts
+
+    def stream_recent_community_for_card_news(
+            self, days: int = 90, limit: Optional[int] = None, content_length: int = 50
+    ) -> AsyncIterator[Row]:
+        """
+        최근 days일 커뮤니티 글을 최신순으로 한 행씩 반환 (카드뉴스용 컬럼만 조회)
+
+        본문은 DB에서 앞 content_length자만 잘라 가져오며, posted_at 키셋 페이지 단위로 조회한다.
+
+        Args:
+            days: 조회 기간 (일)
+            limit: 최대 건수 (None이면 기간 내 전체)
+            content_length: 본문 미리보기 길이
+
+        Returns:
+            Row(title, provider, content, url, posted_at) 비동기 이터레이터
+        """
+        since = datetime.utcnow() - timedelta(days=days)
+
+        return stream_keyset(
+            lambda: self.read_db,
+            columns=(
+                CommunityPostORM.title,
+                CommunityPostORM.provider,
+                func.substr(CommunityPostORM.content, 1, content_length).label("content"),
+                CommunityPostORM.url,
+                CommunityPostORM.posted_at,
+            ),
+            sort_column=CommunityPostORM.posted_at,
+            id_column=CommunityPostORM.id,
+            where=(CommunityPostORM.posted_at >= since,),
+            limit=limit,
+        )
@@ -0,0 +1,200 @@
+import os
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+# IN 목록 / 다건 INSERT 한 번에 보낼 최대 건수 (max_allowed_packet, 바인드 파라미터 수 제한 고려)
+BULK_CHUNK_SIZE = int(os.getenv("DB_BULK_CHUNK_SIZE", "1000"))
+
+
+def _chunks(items: Sequence[T], size: int) -> Iterable[Sequence[T]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def fetch_existing_keys(
+        session: Session,
+        key_columns: Sequence[Any],
+        keys: Iterable[Tuple],
+        normalize: Optional[Callable[[Tuple], Tuple]] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+) -> Set[Tuple]:
+    """
+    자연키 목록 중 이미 DB에 있는 키를 청크 단위 IN 조회로 한 번에 확인
+
+    Args:
+        session: DB 세션
+        key_columns: 자연키 컬럼 (예: (ExchangeRateORM.exchange_type, ExchangeRateORM.erm_date))
+        keys: 조회할 키 튜플 목록 (key_columns 순서)
+        normalize: 조회된 행을 비교용 키로 변환하는 함수 (기본값: tuple 그대로)
+        chunk_size: IN 목록 최대 길이
+
+    Returns:
+        DB에 존재하는 키 집합
+    """
+    unique_keys = list(dict.fromkeys(keys))
+    if not unique_keys:
+        return set()
+
+    normalize = normalize or tuple
+    single = len(key_columns) == 1
+    existing: Set[Tuple] = set()
+
+    for chunk in _chunks(unique_keys, chunk_size):
+        if single:
+            condition = key_columns[0].in_([k[0] for k in chunk])
+        else:
+            condition = tuple_(*key_columns).in_(chunk)
+
+        stmt = select(*key_columns).where(condition)
+        if single:
+            # 단일 컬럼 자연키는 중복 행이 많을 수 있으므로 (예: 기준일자) DISTINCT로 전송량 축소
+            stmt = stmt.distinct()
+
+        for row in session.execute(stmt):
+            existing.add(normalize(tuple(row)))
+
+    return existing
+
+
+def filter_new(
+        session: Session,
+        items: Sequence[T],
+        key_columns: Sequence[Any],
+        key_of: Callable[[T], Tuple[Hashable, ...]],
+        normalize: Optional[Callable[[Tuple], Tuple]] = None,
+        dedupe_batch: bool = True,
+        chunk_size: int = BULK_CHUNK_SIZE,
+) -> List[T]:
+    """
+    items 중 DB에 자연키가 없는 항목만 반환 (행마다 SELECT 하지 않고 집합 단위로 비교)
+
+    Args:
+        items: 저장할 항목 목록
+        key_columns: 자연키 컬럼
+        key_of: 항목 → 자연키 튜플 (DB 조회값과 같은 형태여야 함)
+        normalize: 조회된 DB 행 → 자연키 튜플 변환 함수
+        dedupe_batch: True면 같은 배치 안의 중복 키도 첫 항목만 남김
+            (기준일자처럼 여러 행이 같은 키를 공유하는 경우 False)
+
+    Returns:
+        신규 항목 목록 (입력 순서 유지)
+    """
+    if not items:
+        return []
+
+    item_keys = [key_of(item) for item in items]
+    existing = fetch_existing_keys(session, key_columns, item_keys, normalize=normalize, chunk_size=chunk_size)
+
+    new_items: List[T] = []
+    seen: Set[Tuple] = set()
+    for item, key in zip(items, item_keys):
+        if key in existing:
+            continue
+        if dedupe_batch:
+            if key in seen:
+                continue
+            seen.add(key)
+        new_items.append(item)
+
+    return new_items
+
+
+def bulk_insert(
+        session: Session,
+        model,
+        rows: List[Dict[str, Any]],
+        with_ids: bool = False,
+        chunk_size: int = BULK_CHUNK_SIZE,
+) -> List[Any]:
+    """
+    다건 INSERT (Core insert + executemany, 청크 단위)
+
+    ORM add_all + 행마다 refresh 하던 방식과 달리 ORM 객체를 만들지 않고
+    드라이버의 다건 INSERT로 전송한다. commit은 호출한 Repository가 수행한다.
+
+    Args:
+        model: ORM 클래스
+        rows: 컬럼명 → 값 딕셔너리 목록
+        with_ids: True면 PK가 채워진 ORM 객체 목록 반환
+            (MySQL은 RETURNING이 없어 행 단위 INSERT가 되므로 id가 꼭 필요할 때만 사용)
+
+    Returns:
+        with_ids=True: PK가 채워진 ORM 객체 목록 / False: 빈 리스트
+    """
+    if not rows:
+        return []
+
+    if with_ids:
+        # flush 시 ORM이 lastrowid로 PK를 채운다 (expire_on_commit=False라 commit 후 재조회 없음)
+        objects = [model(**row) for row in rows]
+        session.add_all(objects)
+        session.flush()
+        return objects
+
+    stmt = insert(model.__table__)
+    for chunk in _chunks(rows, chunk_size):
+        session.execute(stmt, list(chunk))
+    return []
+
+
+def insert_ignore_duplicates(
+        session: Session,
+        model,
+        rows: List[Dict[str, Any]],
+        update_columns: Sequence[str] = (),
+        chunk_size: int = BULK_CHUNK_SIZE,
+) -> int:
+    """
+    유니크 제약이 있는 테이블에 다건 INSERT (중복 키는 건너뛰거나 update_columns만 갱신)
+
+    MySQL: INSERT ... ON DUPLICATE KEY UPDATE
+    SQLite: INSERT ... ON CONFLICT DO NOTHING / DO UPDATE (벤치마크/로컬 용)
+
+    commit은 호출한 Repository가 수행한다.
+
+    Args:
+        model: ORM 클래스
+        rows: 컬럼명 → 값 딕셔너리 목록
+        update_columns: 중복 시 새 값으로 갱신할 컬럼 (비어 있으면 기존 행 유지)
+
+    Returns:
+        실행한 행 수 (드라이버가 보고한 rowcount 합계)
+    """
+    if not rows:
+        return 0
+
+    table = model.__table__
+    dialect = session.get_bind().dialect.name
+
+    if dialect == "mysql":
+        stmt = mysql_insert(table)
+        if update_columns:
+            stmt = stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in update_columns})
+        else:
+            # 변경 없는 갱신 = 중복 무시 (INSERT IGNORE는 다른 오류까지 삼키므로 사용하지 않음)
+            pk = table.primary_key.columns.values()[0].name
+            stmt = stmt.on_duplicate_key_update({pk: table.c[pk]})
+    elif dialect == "sqlite":
+        stmt = sqlite_insert(table)
+        if update_columns:
+            unique_index = next(ix for ix in table.indexes if ix.unique)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[c.name for c in unique_index.columns],
+                set_={c: stmt.excluded[c] for c in update_columns},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing()
+    else:
+        raise NotImplementedError(f"insert_ignore_duplicates: 지원하지 않는 DB입니다. ({dialect})")
+
+    affected = 0
+    for chunk in _chunks(rows, chunk_size):
+        result = session.execute(stmt, list(chunk))
+        affected += max(result.rowcount or 0, 0)
+    return affected
@@ -0,0 +1,87 @@
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from config.database.session import DB_MAX_OVERFLOW, DB_POOL_SIZE, _current_session
+
+T = TypeVar("T")
+
+# DB 전용 스레드 풀 크기 (기본값: 커넥션 풀 최대치와 동일 → 스레드가 커넥션을 기다리며 쌓이지 않도록)
+DB_EXECUTOR_WORKERS = int(os.getenv("DB_EXECUTOR_WORKERS", str(DB_POOL_SIZE + DB_MAX_OVERFLOW)))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Session.info에 보관하는 세션 전용 락 키
+_SESSION_LOCK_KEY = "_db_executor_lock"
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """DB 호출 전용 스레드 풀 (최초 호출 시 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="db")
+    return _executor
+
+
+def shutdown_db_executor():
+    """애플리케이션 종료 시 스레드 풀 정리"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+def _call_with_session_lock(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    현재 Unit of Work 세션 단위로 직렬화하여 실행
+
+    Session은 스레드 안전하지 않으므로, 같은 요청 안에서 asyncio.gather 등으로
+    Repository를 동시에 호출해도 한 세션은 한 번에 한 스레드만 사용한다.
+    """
+    session = _current_session.get()
+    if session is None:
+        return func(*args, **kwargs)
+
+    lock = session.info.setdefault(_SESSION_LOCK_KEY, threading.Lock())
+    with lock:
+        return func(*args, **kwargs)
+
+
+async def run_in_db_executor(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    동기 DB 작업을 DB 전용 스레드 풀에서 실행하고 결과를 await
+
+    contextvars를 복사해서 넘기므로 워커 스레드에서도
+    get_current_session()이 현재 요청/스케줄 작업의 세션을 반환한다.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, _call_with_session_lock, func, *args, **kwargs)
+    return await loop.run_in_executor(get_db_executor(), call)
+
+
+def db_offload(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    동기 Repository 메서드를 이벤트 루프를 막지 않는 코루틴으로 변환하는 데코레이터
+
+    사용 예시:
+        @db_offload
+        def save_etf_batch(self, etf_list):
+            ...  # 동기 SQLAlchemy 코드
+
+        await repository.save_etf_batch(etf_list)
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs) -> Any:
+        return await run_in_db_executor(func, *args, **kwargs)
+
+    return wrapper
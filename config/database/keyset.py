@@ -0,0 +1,73 @@
+import os
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from config.database.db_executor import run_in_db_executor
+
+# 스트리밍 조회 시 한 번에 가져올 행 수
+DB_STREAM_PAGE_SIZE = int(os.getenv("DB_STREAM_PAGE_SIZE", "500"))
+
+
+def _after(sort_column, id_column, last_row: Row):
+    """(sort, id) 내림차순 기준으로 마지막 행 이후 조건 (OR 전개형 → 인덱스 범위 스캔 가능)"""
+    last_sort, last_id = last_row._mapping["_keyset_sort"], last_row._mapping["_keyset_id"]
+    return or_(
+        sort_column < last_sort,
+        and_(sort_column == last_sort, id_column < last_id),
+    )
+
+
+async def stream_keyset(
+        session_getter: Callable[[], Session],
+        columns: Sequence[Any],
+        sort_column: Any,
+        id_column: Any,
+        where: Sequence[Any] = (),
+        limit: Optional[int] = None,
+        page_size: int = DB_STREAM_PAGE_SIZE,
+) -> AsyncIterator[Row]:
+    """
+    필요한 컬럼만 (sort_column DESC, id_column DESC) 키셋 페이지 단위로 조회하여 한 행씩 반환
+
+    OFFSET 없이 마지막 행의 (sort, id) 다음부터 읽으므로 뒤 페이지도 비용이 같고,
+    메모리에는 한 페이지만 유지된다. 각 페이지 조회는 DB 스레드 풀에서 실행한다.
+
+    Args:
+        session_getter: 페이지 조회 시점의 세션을 반환하는 함수 (예: lambda: repo.read_db)
+        columns: 조회할 컬럼 (ORM 전체 대신 필요한 컬럼만)
+        sort_column: 정렬 기준 컬럼 (예: published_at)
+        id_column: 동일 정렬값 구분용 유일 컬럼 (예: id)
+        where: 추가 조건
+        limit: 최대 반환 행 수 (None이면 조건에 맞는 전체)
+        page_size: 페이지당 행 수
+
+    Returns:
+        조회 행 (Row, 컬럼명으로 속성 접근)
+    """
+    base = (
+        select(*columns, sort_column.label("_keyset_sort"), id_column.label("_keyset_id"))
+        .where(*where)
+        .order_by(sort_column.desc(), id_column.desc())
+    )
+
+    def fetch_page(last_row: Optional[Row], size: int) -> List[Row]:
+        stmt = base if last_row is None else base.where(_after(sort_column, id_column, last_row))
+        return session_getter().execute(stmt.limit(size)).all()
+
+    remaining = limit
+    last_row: Optional[Row] = None
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        rows = await run_in_db_executor(fetch_page, last_row, size)
+
+        for row in rows:
+            yield row
+
+        if len(rows) < size:
+            return
+        last_row = rows[-1]
+        if remaining is not None:
+            remaining -= len(rows)
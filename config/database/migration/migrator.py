@@ -0,0 +1,146 @@
+import importlib
+import os
+import pkgutil
+from datetime import datetime
+from types import ModuleType
+from typing import List, Optional
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 여러 워커가 동시에 기동해도 마이그레이션은 한 프로세스만 수행 (MySQL GET_LOCK)
+MIGRATION_LOCK_NAME = os.getenv("DB_MIGRATION_LOCK_NAME", "nawsol_schema_migration")
+MIGRATION_LOCK_TIMEOUT = int(os.getenv("DB_MIGRATION_LOCK_TIMEOUT", "60"))  # 초
+
+VERSIONS_PACKAGE = "config.database.migration.versions"
+
+_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", String(32), primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class Migrator:
+    """
+    버전 관리 스키마 마이그레이션
+
+    - config/database/migration/versions/V{번호}_{설명}.py 를 번호 순으로 적용
+    - 각 모듈은 VERSION, DESCRIPTION, upgrade(conn) 를 정의
+    - 적용 이력은 schema_migrations 테이블에 기록하며, 이미 적용된 버전은 건너뜀
+    """
+
+    def __init__(self, engine: Engine, versions_package: str = VERSIONS_PACKAGE):
+        self.engine = engine
+        self.versions_package = versions_package
+
+    def discover(self) -> List[ModuleType]:
+        """versions 패키지의 마이그레이션 모듈을 버전 순으로 로드"""
+        package = importlib.import_module(self.versions_package)
+        modules = []
+        for info in pkgutil.iter_modules(package.__path__):
+            if not info.name.startswith("V"):
+                continue
+            module = importlib.import_module(f"{self.versions_package}.{info.name}")
+            modules.append(module)
+
+        modules.sort(key=lambda m: m.VERSION)
+        versions = [m.VERSION for m in modules]
+        if len(versions) != len(set(versions)):
+            raise RuntimeError(f"마이그레이션 버전이 중복되었습니다: {versions}")
+        return modules
+
+    def applied_versions(self, conn: Connection) -> set:
+        return {row.version for row in conn.execute(select(schema_migrations.c.version))}
+
+    def pending(self, conn: Connection) -> List[ModuleType]:
+        applied = self.applied_versions(conn)
+        return [m for m in self.discover() if m.VERSION not in applied]
+
+    def run(self) -> List[str]:
+        """
+        미적용 마이그레이션 실행
+
+        Returns:
+            이번에 적용한 버전 목록
+        """
+        with self.engine.connect() as conn:
+            self._acquire_lock(conn)
+            try:
+                schema_migrations.create(conn, checkfirst=True)
+                conn.commit()
+
+                # 락을 잡은 뒤 다시 조회 → 먼저 기동한 워커가 적용한 버전은 건너뜀
+                pending = self.pending(conn)
+                if not pending:
+                    logger.info("스키마 최신 상태 (적용할 마이그레이션 없음)")
+                    return []
+
+                applied = []
+                for module in pending:
+                    logger.info(f"마이그레이션 적용: {module.VERSION} - {module.DESCRIPTION}")
+                    try:
+                        module.upgrade(conn)
+                        conn.execute(schema_migrations.insert().values(
+                            version=module.VERSION,
+                            description=module.DESCRIPTION,
+                            applied_at=datetime.utcnow(),
+                        ))
+                        conn.commit()
+                    except Exception:
+                        # MySQL DDL은 암묵적으로 커밋되므로 upgrade는 재실행해도 안전하게(checkfirst) 작성할 것
+                        conn.rollback()
+                        logger.error(f"마이그레이션 실패: {module.VERSION}")
+                        raise
+                    applied.append(module.VERSION)
+
+                logger.info(f"마이그레이션 완료: {applied}")
+                return applied
+            finally:
+                self._release_lock(conn)
+
+    def _acquire_lock(self, conn: Connection):
+        if conn.dialect.name != "mysql":
+            return
+        acquired = conn.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": MIGRATION_LOCK_NAME, "timeout": MIGRATION_LOCK_TIMEOUT},
+        ).scalar()
+        if acquired != 1:
+            raise RuntimeError(
+                f"마이그레이션 락 획득 실패 ({MIGRATION_LOCK_NAME}, {MIGRATION_LOCK_TIMEOUT}초 대기)"
+            )
+
+    def _release_lock(self, conn: Connection):
+        if conn.dialect.name != "mysql":
+            return
+        try:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": MIGRATION_LOCK_NAME})
+            conn.commit()
+        except Exception as e:
+            # 커넥션이 닫히면 MySQL이 락을 자동 해제
+            logger.warning(f"마이그레이션 락 해제 실패: {str(e)}")
+
+
+def run_migrations(engine: Optional[Engine] = None) -> List[str]:
+    """기본 엔진으로 미적용 마이그레이션 실행 (앱 기동 시 호출)"""
+    if engine is None:
+        from config.database.session import engine as default_engine
+        engine = default_engine
+    return Migrator(engine).run()
+
+
+if __name__ == "__main__":
+    # 배포 파이프라인에서 앱 기동 전에 단독 실행: python -m config.database.migration.migrator
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    run_migrations()
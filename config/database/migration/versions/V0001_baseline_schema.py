@@ -0,0 +1,215 @@
+"""
+기준 스키마 - 기존 drop_all/create_all 로 만들던 전체 테이블 (12개)
+
+이미 운영 중인 DB는 테이블이 있으므로 없는 테이블만 생성한다 (checkfirst).
+이후 버전에서 추가 / 변경한 테이블·컬럼·인덱스가 섞이지 않도록 현재 ORM 모델이 아니라
+기준 시점의 스키마를 여기에 고정해 둔다 (ORM을 바꾸면 새 버전 파일로 반영).
+"""
+
+from sqlalchemy import (
+    BigInteger, Column, DateTime, DECIMAL, Enum, Float, ForeignKey, Index, Integer, JSON, MetaData, String, Table,
+    Text,
+)
+from sqlalchemy.engine import Connection
+
+VERSION = "0001"
+DESCRIPTION = "baseline schema"
+
+metadata = MetaData()
+
+# Enum 컬럼은 ORM(SAEnum + 파이썬 Enum)과 같이 멤버 이름을 값으로, 소문자 클래스명을 타입명으로 사용
+_OAUTH_PROVIDER = Enum("GOOGLE", "NAVER", "KAKAO", name="oauthprovider")
+_YN = Enum("Y", "N", name="yn")
+_EXCHANGE_TYPE = Enum("DOLLAR", "YEN", "EURO", name="exchangetype")
+_FINANCE_TYPE = Enum("INCOME", "EXPENSE", "TANGIBLE_ASSETS", "ETF", "FUND", "BOND", name="financetype")
+_IE_TYPE = Enum("INCOME", "EXPENSE", "TOTAL_INCOME", "TOTAL_EXPENSE", name="ietype")
+_NEWS_PROVIDER = Enum("NAVER_NEWS", name="newsprovider")
+
+Table(
+    "account", metadata,
+    Column("session_id", String(255), primary_key=True, nullable=False),
+    Column("oauth_id", String(255), nullable=False),
+    Column("oauth_type", _OAUTH_PROVIDER, nullable=False, index=True),
+    Column("nickname", String(1000), nullable=True),
+    Column("name", String(1000), nullable=True),
+    Column("email", String(1000), nullable=True),
+    Column("phone_number", String(1000), nullable=True),
+    Column("profile_image", String(255), nullable=True),
+    Column("active_status", _YN, nullable=False),
+    Column("role_id", String(255), nullable=True),
+    Column("automatic_analysis_cycle", Integer, nullable=True),
+    Column("target_period", Integer, nullable=True),
+    Column("target_amount", Integer, nullable=True),
+    Column("created_at", DateTime),
+    Column("updated_at", DateTime),
+)
+
+Table(
+    "ANALYZE_HISTORY", metadata,
+    Column("ANALYZE_ID", Integer, primary_key=True, autoincrement=True),
+    Column("MONTHLY_INCOME", Integer, nullable=False, index=True),
+    Column("MONTHLY_EXPENSE", Integer, nullable=False, index=True),
+    Column("MONTHLY_SURPLUS", Integer, nullable=False),
+    Column("EXPENSE_RATIO", DECIMAL(5, 2), nullable=False, index=True),
+    Column("SAVINGS_RATIO", DECIMAL(5, 2), nullable=False),
+    Column("ESSENTIAL_RATIO", DECIMAL(5, 2)),
+    Column("LEISURE_RATIO", DECIMAL(5, 2)),
+    Column("INVESTMENT_RATIO", DECIMAL(5, 2)),
+    Column("OTHER_RATIO", DECIMAL(5, 2)),
+    Column("ASSET_LEVEL", String(20), nullable=False, index=True),
+    Column("GPT_ADVICE", Text, nullable=False),
+    Column("USE_COUNT", Integer),
+    Column("CREATED_AT", DateTime, nullable=False),
+    Column("LAST_USED_AT", DateTime),
+    Index("idx_pattern", "MONTHLY_INCOME", "MONTHLY_EXPENSE", "EXPENSE_RATIO"),
+    Index("idx_asset_level", "ASSET_LEVEL"),
+    Index("idx_created_at", "CREATED_AT"),
+)
+
+Table(
+    "community_post", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("provider", String(64), nullable=False),
+    Column("board_id", String(64), nullable=False),
+    Column("external_post_id", String(64), nullable=False),
+    Column("title", String(512), nullable=False),
+    Column("author", String(128), nullable=True),
+    Column("content", Text, nullable=True),
+    Column("url", String(2048), nullable=False),
+    Column("view_count", Integer, nullable=True),
+    Column("recommend_count", Integer, nullable=True),
+    Column("comment_count", Integer, nullable=True),
+    Column("posted_at", DateTime, nullable=True),
+    Column("fetched_at", DateTime, nullable=False),
+    Index("uq_community_provider_board_post", "provider", "board_id", "external_post_id", unique=True),
+    Index("idx_community_posted_at", "posted_at"),
+)
+
+Table(
+    "exchange_rate", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("exchange_type", _EXCHANGE_TYPE, nullable=False),
+    Column("exchange_rate", Float, nullable=False),
+    Column("erm_date", DateTime, nullable=False),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "interest_rate", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("interest_type", String(255), nullable=False),
+    Column("interest_rate", Float, nullable=False),
+    Column("erm_date", DateTime, nullable=False),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "finance", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("user_id", String(255), ForeignKey("account.session_id"), nullable=False),
+    Column("type", _FINANCE_TYPE, nullable=False),
+    Column("base_dt", DateTime),
+    Column("key", String(255), nullable=False),
+    Column("value", String(255), nullable=False),
+)
+
+Table(
+    "ie_info", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("session_id", String(255), ForeignKey("account.session_id"), nullable=False, index=True),
+    Column("ie_type", _IE_TYPE, nullable=False, index=True),
+    Column("key", String(1000), nullable=False),
+    Column("value", String(1000), nullable=False),
+    Column("year", Integer, nullable=False, index=True),
+    Column("month", Integer, nullable=False, index=True),
+    Column("created_at", DateTime),
+    Column("modified_at", DateTime),
+)
+
+Table(
+    "ie_rule", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True, index=True),
+    Column("ie_type", _IE_TYPE, nullable=False, index=True),
+    Column("keyword", String(100), nullable=False, unique=True, index=True),
+    Column("created_at", DateTime, nullable=False),
+    Index("idx_ie_type_keyword", "ie_type", "keyword"),
+)
+
+Table(
+    "news_info", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("provider", _NEWS_PROVIDER, nullable=False),
+    Column("title", String(512), nullable=False),
+    Column("description", Text, nullable=True),
+    Column("content", Text, nullable=True),
+    Column("link", String(2048), nullable=False),
+    Column("originallink", String(2048), nullable=True),
+    Column("canonical_url", String(2048), nullable=False),
+    Column("canonical_url_hash", String(32), nullable=False),
+    Column("published_at", DateTime, nullable=True),
+    Column("fetched_at", DateTime, nullable=False),
+    Column("raw_json", JSON, nullable=False),
+    Index("uq_news_info_provider_urlhash", "provider", "canonical_url_hash", unique=True),
+    Index("idx_news_info_published_at", "published_at"),
+)
+
+Table(
+    "product_bond", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("basDt", DateTime),
+    Column("crno", String(255), nullable=True),
+    Column("bondIsurNm", String(255), nullable=True),
+    Column("bondIssuDt", DateTime),
+    Column("scrsItmsKcd", String(255), nullable=True),
+    Column("scrsItmsKcdNm", String(255), nullable=True),
+    Column("isinCd", String(255), nullable=True),
+    Column("isinCdNm", String(255), nullable=True),
+    Column("bondIssuFrmtNm", String(255), nullable=True),
+    Column("bondExprDt", DateTime),
+    Column("bondIssuCurCd", String(255), nullable=True),
+    Column("bondIssuCurCdNm", String(255), nullable=True),
+    Column("bondPymtAmt", BigInteger, nullable=True),
+    Column("bondIssuAmt", BigInteger, nullable=True),
+    Column("bondSrfcInrt", Float, nullable=True),
+    Column("irtChngDcd", String(255), nullable=True),
+    Column("irtChngDcdNm", String(255), nullable=True),
+    Column("bondIntTcd", String(255), nullable=True),
+    Column("bondIntTcdNm", String(255), nullable=True),
+)
+
+Table(
+    "product_etf", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("fltRt", Float, nullable=True),
+    Column("nav", Float, nullable=True),
+    Column("mkp", Integer, nullable=True),
+    Column("hipr", Integer, nullable=True),
+    Column("lopr", Integer, nullable=True),
+    Column("trqu", Integer, nullable=True),
+    Column("trPrc", BigInteger, nullable=True),
+    Column("mrktTotAmt", BigInteger, nullable=True),
+    Column("nPptTotAmt", BigInteger, nullable=True),
+    Column("stLstgCnt", BigInteger, nullable=True),
+    Column("bssIdxIdxNm", String(255), nullable=True),
+    Column("bssIdxClpr", Float, nullable=True),
+    Column("basDt", DateTime),
+    Column("clpr", Integer, nullable=True),
+    Column("vs", Integer, nullable=True),
+)
+
+Table(
+    "product_fund", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("basDt", DateTime),
+    Column("srtnCd", String(255), nullable=True),
+    Column("fndNm", String(255), nullable=True),
+    Column("ctg", String(255), nullable=True),
+    Column("setpDt", DateTime, nullable=True),
+    Column("fndTp", String(255), nullable=True),
+    Column("prdClsfCd", String(255), nullable=True),
+    Column("asoStdCd", String(255), nullable=True),
+)
+
+
+def upgrade(conn: Connection):
+    metadata.create_all(bind=conn, checkfirst=True)
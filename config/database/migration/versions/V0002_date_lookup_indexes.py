@@ -0,0 +1,35 @@
+"""
+일자/월 조회용 복합 인덱스 (기존 DB에는 create_all로 추가되지 않으므로 별도 적용)
+
+V0001과 마찬가지로 현재 ORM 모델이 아니라 이 버전에서 추가하는 인덱스만 명시한다.
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, MetaData, String, Table
+from sqlalchemy.engine import Connection
+
+VERSION = "0002"
+DESCRIPTION = "date lookup indexes on product and rate tables"
+
+metadata = MetaData()
+
+# 인덱스 생성에 필요한 컬럼만 선언 (테이블은 V0001에서 생성)
+_product_etf = Table("product_etf", metadata, Column("basDt", DateTime), Column("mrktTotAmt", BigInteger))
+_product_fund = Table("product_fund", metadata, Column("basDt", DateTime))
+_product_bond = Table("product_bond", metadata, Column("basDt", DateTime), Column("bondIssuAmt", BigInteger))
+_exchange_rate = Table("exchange_rate", metadata, Column("exchange_type", String(16)), Column("erm_date", DateTime))
+_interest_rate = Table("interest_rate", metadata, Column("interest_type", String(255)), Column("erm_date", DateTime))
+
+INDEXES = (
+    Index("ix_product_etf_basdt_mrkttotamt", _product_etf.c.basDt, _product_etf.c.mrktTotAmt),
+    Index("ix_product_fund_basdt", _product_fund.c.basDt),
+    Index("ix_product_bond_basdt_bondissuamt", _product_bond.c.basDt, _product_bond.c.bondIssuAmt),
+    Index("ix_exchange_rate_type_erm_date", _exchange_rate.c.exchange_type, _exchange_rate.c.erm_date),
+    Index("ix_exchange_rate_erm_date", _exchange_rate.c.erm_date),
+    Index("ix_interest_rate_type_erm_date", _interest_rate.c.interest_type, _interest_rate.c.erm_date),
+    Index("ix_interest_rate_erm_date", _interest_rate.c.erm_date),
+)
+
+
+def upgrade(conn: Connection):
+    for index in INDEXES:
+        index.create(bind=conn, checkfirst=True)
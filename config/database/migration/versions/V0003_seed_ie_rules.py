@@ -0,0 +1,47 @@
+"""
+IE_RULE 초기 키워드 (데이터 마이그레이션)
+
+기존에는 기동할 때마다 IE_RULE을 백업 → 전체 테이블 재생성 → 복구/삽입 했다.
+이미 있는 키워드(유니크)는 건너뛰므로 운영 DB에 재실행해도 안전하다.
+"""
+
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Connection
+
+VERSION = "0003"
+DESCRIPTION = "seed initial ie_rule keywords"
+
+# 초기 소득 키워드
+INITIAL_INCOME_KEYWORDS = [
+    "급여", "월급", "연봉", "봉급", "임금",
+    "상여", "상여금", "보너스", "성과급", "인센티브",
+    "수당", "식대", "교통비", "주거수당",
+    "이자", "배당", "배당금", "이자소득"
+]
+
+# 초기 지출 키워드
+INITIAL_EXPENSE_KEYWORDS = [
+    "보험료", "국민연금", "건강보험", "고용보험", "산재보험",
+    "세금", "소득세", "지방소득세", "주민세",
+    "카드", "신용카드", "체크카드", "카드사용액",
+    "공제", "공제액", "차감"
+]
+
+
+def upgrade(conn: Connection):
+    from ieinfo.infrastructure.orm.ie_info import IEType
+    from ieinfo.infrastructure.orm.ie_rule import IERule
+
+    table = IERule.__table__
+    existing = {row.keyword for row in conn.execute(select(table.c.keyword))}
+
+    rows = [
+        {"keyword": keyword, "ie_type": IEType.INCOME}
+        for keyword in INITIAL_INCOME_KEYWORDS if keyword not in existing
+    ] + [
+        {"keyword": keyword, "ie_type": IEType.EXPENSE}
+        for keyword in INITIAL_EXPENSE_KEYWORDS if keyword not in existing
+    ]
+
+    if rows:
+        conn.execute(insert(table), rows)
@@ -0,0 +1,14 @@
+"""
+데이터셋별 적재 상태 테이블 (수집 계획의 기준)
+"""
+
+from sqlalchemy.engine import Connection
+
+VERSION = "0004"
+DESCRIPTION = "ingestion state table"
+
+
+def upgrade(conn: Connection):
+    from ingestion.infrastructure.orm.ingestion_state import IngestionStateORM
+
+    IngestionStateORM.__table__.create(bind=conn, checkfirst=True)
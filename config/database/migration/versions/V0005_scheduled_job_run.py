@@ -0,0 +1,14 @@
+"""
+스케줄 작업 실행 이력 테이블 (작업별 실행 소유자 / 펜싱 토큰 / 소요 시간)
+"""
+
+from sqlalchemy.engine import Connection
+
+VERSION = "0005"
+DESCRIPTION = "scheduled job run history table"
+
+
+def upgrade(conn: Connection):
+    from ingestion.infrastructure.orm.job_run import JobRunORM
+
+    JobRunORM.__table__.create(bind=conn, checkfirst=True)
@@ -0,0 +1,14 @@
+"""
+USE_COUNT flush 배치 반영 기록 테이블 (flush 재시도 시 중복 반영 방지)
+"""
+
+from sqlalchemy.engine import Connection
+
+VERSION = "0006"
+DESCRIPTION = "analyze use count flush table"
+
+
+def upgrade(conn: Connection):
+    from asset_allocation.infrastructure.orm.analyze_use_count_flush import AnalyzeUseCountFlush
+
+    AnalyzeUseCountFlush.__table__.create(bind=conn, checkfirst=True)
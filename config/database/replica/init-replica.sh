@@ -0,0 +1,20 @@
+#!/bin/bash
+# 로컬 복제본 초기화: primary(mysql)에서 GTID 기반 복제 시작
+# docker-compose.replica.yml 의 mysql-replica 컨테이너 최초 기동 시 실행된다.
+# 로컬 테스트 전용이므로 primary root 계정으로 복제한다.
+set -e
+
+mysql -uroot -p"${MYSQL_ROOT_PASSWORD}" <<SQL
+RESET MASTER;
+CHANGE REPLICATION SOURCE TO
+    SOURCE_HOST = 'mysql',
+    SOURCE_PORT = 3306,
+    SOURCE_USER = 'root',
+    SOURCE_PASSWORD = '${MYSQL_ROOT_PASSWORD}',
+    SOURCE_AUTO_POSITION = 1,
+    GET_SOURCE_PUBLIC_KEY = 1;
+START REPLICA;
+-- 초기화가 끝난 뒤 읽기 전용으로 전환 (재시작 후에도 유지)
+SET PERSIST read_only = ON;
+SET PERSIST super_read_only = ON;
+SQL
@@ -1,9 +1,14 @@
 import os
 import urllib.parse
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional, Tuple
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+
+from config.database.sql_trace import SqlTrace
 
 load_dotenv()
 
@@ -14,15 +19,215 @@ DATABASE_URL = (
     f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
 )
 
+# 읽기 전용 복제본 (MYSQL_READ_HOST 미설정 시 읽기도 primary 사용)
+# 호스트 외 항목은 지정하지 않으면 primary 설정을 그대로 사용
+READ_REPLICA_ENABLED = bool(os.getenv("MYSQL_READ_HOST"))
+
+READ_DATABASE_URL = (
+    f"mysql+pymysql://{os.getenv('MYSQL_READ_USER', os.getenv('MYSQL_USER'))}:"
+    f"{urllib.parse.quote_plus(os.getenv('MYSQL_READ_PASSWORD', os.getenv('MYSQL_PASSWORD')))}"
+    f"@{os.getenv('MYSQL_READ_HOST')}:{os.getenv('MYSQL_READ_PORT', os.getenv('MYSQL_PORT'))}"
+    f"/{os.getenv('MYSQL_READ_DATABASE', os.getenv('MYSQL_DATABASE'))}"
+) if READ_REPLICA_ENABLED else DATABASE_URL
+
+# 커넥션 풀 설정 (동시 요청 수에 맞춰 조정)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # MySQL wait_timeout 이전에 재연결 (초)
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))    # 풀 고갈 시 대기 시간 (초)
+
+# 모든 SQL을 stdout으로 출력 (개발용, 운영에서는 SQL_TRACE_MODE 사용)
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() == "true"
+
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
-    pool_pre_ping=True
+    echo=SQL_ECHO,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_timeout=DB_POOL_TIMEOUT,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if READ_REPLICA_ENABLED:
+    read_engine = create_engine(
+        READ_DATABASE_URL,
+        echo=SQL_ECHO,
+        pool_pre_ping=True,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_timeout=DB_POOL_TIMEOUT,
+    )
+else:
+    read_engine = engine
+
+# 느린 쿼리 / 샘플링 SQL 기록 (config.database.sql_trace)
+SqlTrace.get_instance().install(engine)
+if read_engine is not engine:
+    SqlTrace.get_instance().install(read_engine)
+
+# expire_on_commit=False: 같은 Unit of Work 안에서 commit 이후에도 조회한 객체를 다시 SELECT 하지 않도록
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=read_engine)
+
+# Session.info 키
+_HAS_WRITES_KEY = "has_writes"       # 이번 Unit of Work에서 primary에 쓰기 발생 여부
+_READ_SESSION_KEY = "read_session"   # Unit of Work에 딸린 복제본 세션
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _mark_has_writes(session, flush_context):
+    # 쓰기 이후의 조회는 복제 지연 없이 primary에서 (read-your-writes)
+    session.info[_HAS_WRITES_KEY] = True
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _mark_has_writes_on_execute(orm_execute_state):
+    # session.execute(insert/update/delete)는 flush를 거치지 않으므로 별도 표시
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_HAS_WRITES_KEY] = True
+
+# commit 직전에 확인할 조건 (commit_guard): 예외를 던지면 commit하지 않음
+_commit_guards: ContextVar[Tuple[Callable[[], None], ...]] = ContextVar("db_commit_guards", default=())
+
+
+@event.listens_for(SessionLocal, "before_commit")
+def _check_commit_guards(session):
+    for check in _commit_guards.get():
+        check()
+
+
+@contextmanager
+def commit_guard(check: Callable[[], None]) -> Iterator[None]:
+    """
+    블록 안(하위 태스크 / DB 스레드 풀 호출 포함)의 primary commit 직전에 check() 실행
+
+    예: 스케줄 작업이 임대를 잃은 뒤 이미 DB 스레드에서 진행 중이던 쓰기가 commit되지 않도록
+    임대 보유 여부를 확인하고, 잃었으면 예외로 commit을 막음
+
+    사용 예시:
+        with commit_guard(lease.ensure_held):
+            await repository.save_etf_batch(etf_list)
+    """
+    token = _commit_guards.set(_commit_guards.get() + (check,))
+    try:
+        yield
+    finally:
+        _commit_guards.reset(token)
+
+
+@contextmanager
+def without_commit_guards() -> Iterator[None]:
+    """블록 안의 commit은 commit_guard 확인 없이 진행 (임대를 잃은 실행의 이력 기록 등)"""
+    token = _commit_guards.set(())
+    try:
+        yield
+    finally:
+        _commit_guards.reset(token)
+
 
 Base = declarative_base()
 
+# 현재 Unit of Work(요청 1건 / 스케줄 작업 1건)에 바인딩된 세션
+_current_session: ContextVar[Optional[Session]] = ContextVar("current_db_session", default=None)
+
+# use_primary() 블록 안에서는 읽기도 primary 사용
+_force_primary: ContextVar[bool] = ContextVar("db_force_primary", default=False)
+
+
 def get_db_session():
     return SessionLocal()
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Unit of Work 단위 세션 제공
+
+    - 이미 활성화된 세션이 있으면 그대로 재사용 (중첩 호출 허용)
+    - 예외 발생 시 rollback, 종료 시 close 하여 커넥션을 풀에 반납
+    - commit은 Repository가 명시적으로 수행
+
+    사용 예시:
+        with session_scope():
+            await usecase.fetch_and_save_etf_data(start, end)
+    """
+    existing = _current_session.get()
+    if existing is not None:
+        yield existing
+        return
+
+    session = SessionLocal()
+    token = _current_session.set(session)
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _current_session.reset(token)
+        read_session = session.info.pop(_READ_SESSION_KEY, None)
+        if read_session is not None:
+            read_session.close()
+        session.close()
+
+
+def get_current_session() -> Session:
+    """현재 Unit of Work의 세션 반환 (session_scope 밖에서 호출하면 에러)"""
+    session = _current_session.get()
+    if session is None:
+        raise RuntimeError(
+            "활성화된 DB 세션이 없습니다. "
+            "요청 처리(DBSessionMiddleware) 또는 session_scope() 안에서 호출해주세요."
+        )
+    return session
+
+
+def get_current_read_session() -> Session:
+    """
+    현재 Unit of Work의 읽기용 세션 반환
+
+    다음 경우에는 primary 세션을 그대로 반환한다.
+    - 복제본 미설정 (MYSQL_READ_HOST 없음)
+    - use_primary() 블록 안
+    - 이번 Unit of Work에서 이미 쓰기(flush/commit)가 발생한 경우 (read-your-writes)
+    """
+    session = get_current_session()
+    if not READ_REPLICA_ENABLED or _force_primary.get() or session.info.get(_HAS_WRITES_KEY):
+        return session
+
+    read_session = session.info.get(_READ_SESSION_KEY)
+    if read_session is None:
+        read_session = ReadSessionLocal()
+        session.info[_READ_SESSION_KEY] = read_session
+    return read_session
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """
+    블록 안의 읽기를 primary로 강제 (복제 지연을 허용할 수 없는 조회용)
+
+    사용 예시:
+        with use_primary():
+            accounts = repository.get_account_by_session_id(session_id)
+    """
+    token = _force_primary.set(True)
+    try:
+        yield
+    finally:
+        _force_primary.reset(token)
+
+
+def get_request_session() -> Iterator[Session]:
+    """
+    FastAPI 의존성 주입용 세션
+
+    사용 예시:
+        @router.get("/items")
+        def get_items(db: Session = Depends(get_request_session)):
+            ...
+    """
+    with session_scope() as session:
+        yield session
@@ -0,0 +1,21 @@
+from config.database.session import session_scope
+
+
+class DBSessionMiddleware:
+    """
+    HTTP 요청 1건마다 DB 세션 1개를 열고 요청 종료 시 반납하는 ASGI 미들웨어
+
+    Repository는 get_current_session()으로 이 세션을 사용하므로
+    동시 요청끼리 세션(커넥션)을 공유하지 않는다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with session_scope():
+            await self.app(scope, receive, send)
@@ -0,0 +1,170 @@
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# SQL 로깅 모드
+#   off     : 기록하지 않음
+#   sampled : SQL_TRACE_SAMPLE_RATE 비율만 기록 (느린 쿼리는 항상 기록)
+#   slow    : SQL_SLOW_QUERY_MS 이상 걸린 쿼리만 기록
+#   all     : 전부 기록 (개발용)
+SQL_TRACE_MODES = ("off", "sampled", "slow", "all")
+
+SQL_TRACE_MODE = os.getenv("SQL_TRACE_MODE", "slow").lower()
+SQL_TRACE_SAMPLE_RATE = float(os.getenv("SQL_TRACE_SAMPLE_RATE", "0.01"))
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+SQL_TRACE_BUFFER_SIZE = int(os.getenv("SQL_TRACE_BUFFER_SIZE", "500"))
+
+_STATEMENT_MAX_LEN = 1000
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s)(?:\s*,\s*(?:\?|%s|%\(\w+\)s))*\s*\)")
+_VALUES_REPEAT = re.compile(r"(VALUES\s*\(\?\))(?:\s*,\s*\(\?\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    SQL 문장을 정규화하여 같은 형태의 쿼리를 하나로 묶는 지문 생성
+
+    예: SELECT * FROM t WHERE id IN (%(id_1)s, %(id_2)s) AND name = 'a'
+      → SELECT * FROM t WHERE id IN (?) AND name = ?
+    """
+    fp = _STRING_LITERAL.sub("?", statement)
+    fp = _NUMBER_LITERAL.sub("?", fp)
+    fp = _PLACEHOLDER_LIST.sub("(?)", fp)
+    fp = _VALUES_REPEAT.sub(r"\1", fp)
+    fp = _WHITESPACE.sub(" ", fp).strip()
+    return fp
+
+
+class SqlTrace:
+    """
+    엔진 이벤트로 SQL 실행 시간/행 수를 수집하는 링 버퍼
+
+    - 최근 SQL_TRACE_BUFFER_SIZE 건만 메모리에 보관 (오래된 항목은 자동 폐기)
+    - 느린 쿼리는 모드와 관계없이 WARNING 로그로 남김 (off 제외)
+    """
+
+    __instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(
+        self,
+        mode: str = SQL_TRACE_MODE,
+        sample_rate: float = SQL_TRACE_SAMPLE_RATE,
+        slow_query_ms: float = SQL_SLOW_QUERY_MS,
+        buffer_size: int = SQL_TRACE_BUFFER_SIZE,
+    ):
+        try:
+            self.set_mode(mode)
+        except ValueError as e:
+            # 잘못된 SQL_TRACE_MODE로 기동이 실패하지 않도록 기록만 끔
+            logger.error(f"{e} → off로 동작합니다.")
+            self.mode = "off"
+        self.sample_rate = sample_rate
+        self.slow_query_ms = slow_query_ms
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    def set_mode(self, mode: str):
+        mode = (mode or "off").lower()
+        if mode not in SQL_TRACE_MODES:
+            raise ValueError(f"지원하지 않는 SQL 로깅 모드입니다: {mode} (허용: {', '.join(SQL_TRACE_MODES)})")
+        self.mode = mode
+
+    def install(self, engine: Engine):
+        """엔진에 실행 시간 측정 이벤트 등록"""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self.mode == "off" or context is None:
+            return
+        # 실행 단위 컨텍스트에 보관 → 오류로 after 이벤트가 오지 않아도 남는 값이 없음
+        context._sql_trace_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_sql_trace_start", None)
+        if start is None:
+            return
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        is_slow = duration_ms >= self.slow_query_ms
+        if self.mode == "slow" and not is_slow:
+            return
+        if self.mode == "sampled" and not is_slow and random.random() >= self.sample_rate:
+            return
+
+        entry = {
+            "at": datetime.now().isoformat(timespec="milliseconds"),
+            "fingerprint": fingerprint(statement),
+            "statement": statement[:_STATEMENT_MAX_LEN],
+            "duration_ms": round(duration_ms, 3),
+            "rowcount": getattr(cursor, "rowcount", None),
+            "executemany": executemany,
+            "slow": is_slow,
+        }
+        with self._lock:
+            self._buffer.append(entry)
+
+        if is_slow:
+            logger.warning(
+                f"[SLOW SQL] {entry['duration_ms']}ms rows={entry['rowcount']} :: {entry['fingerprint'][:300]}"
+            )
+
+    def entries(self, limit: Optional[int] = None, slow_only: bool = False) -> List[Dict[str, Any]]:
+        """최근 기록 (최신순)"""
+        with self._lock:
+            items = list(self._buffer)
+        items.reverse()
+        if slow_only:
+            items = [e for e in items if e["slow"]]
+        return items[:limit] if limit else items
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """버퍼 내 기록을 지문별로 집계 (총 소요 시간 내림차순)"""
+        stats: Dict[str, Dict[str, Any]] = {}
+        for e in self.entries():
+            s = stats.setdefault(e["fingerprint"], {
+                "fingerprint": e["fingerprint"], "count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0,
+            })
+            s["count"] += 1
+            s["total_ms"] += e["duration_ms"]
+            s["max_ms"] = max(s["max_ms"], e["duration_ms"])
+            s["rows"] += e["rowcount"] if e["rowcount"] and e["rowcount"] > 0 else 0
+
+        result = sorted(stats.values(), key=lambda s: s["total_ms"], reverse=True)
+        for s in result:
+            s["total_ms"] = round(s["total_ms"], 3)
+            s["avg_ms"] = round(s["total_ms"] / s["count"], 3)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._buffer.clear()
+
+    def settings(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "sample_rate": self.sample_rate,
+            "slow_query_ms": self.slow_query_ms,
+            "buffer_size": self._buffer.maxlen,
+        }
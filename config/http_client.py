@@ -0,0 +1,113 @@
+import asyncio
+import os
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+from dotenv import load_dotenv
+
+from util.log.log import Log
+
+load_dotenv()
+
+logger = Log.get_logger()
+
+# 외부 API 공통 커넥션 풀 설정
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))                     # 전체 동시 연결 수
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))    # 호스트당 동시 연결 수
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))      # 유휴 연결 유지 시간 (초)
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))               # DNS 캐시 (초)
+HTTP_DEFAULT_TIMEOUT = float(os.getenv("HTTP_DEFAULT_TIMEOUT", "30"))          # 요청 전체 기본 타임아웃 (초)
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))          # 연결 수립 타임아웃 (초)
+
+
+class HttpClientRegistry:
+    """
+    외부 API 호출용 aiohttp 세션 레지스트리
+
+    - 이름별로 ClientSession 하나를 만들어 애플리케이션 전체에서 재사용
+      (keep-alive 연결 재사용 → 매 호출마다 DNS / TCP / TLS 핸드셰이크 하지 않음)
+    - 호스트당 연결 수 제한, DNS 캐시, 기본 타임아웃 적용
+    - 쿠키는 저장하지 않음 (API 호출과 크롤링이 세션을 같이 쓰므로 한 사이트의 쿠키가 다른 호출에 섞이지 않도록)
+    - 세션은 이벤트 루프에 묶이므로 다른 루프(스크립트의 asyncio.run 등)에서는 새로 생성하고,
+      이전 세션은 원래 루프가 돌고 있으면 그 루프에서 닫고 이미 끝난 루프면 경고만 남김
+    - 애플리케이션 종료 시 close() 호출
+
+    사용 예시:
+        session = HttpClientRegistry.get_instance().session()
+        async with session.get(url) as resp:
+            ...
+    """
+
+    __instance = None
+
+    @classmethod
+    def get_instance(cls) -> "HttpClientRegistry":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        # 이름 → (이벤트 루프, 세션)
+        self._sessions: Dict[str, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+
+    def session(self, name: str = "default", limit_per_host: Optional[int] = None) -> aiohttp.ClientSession:
+        """
+        공유 세션 반환 (코루틴 안에서 호출)
+
+        Args:
+            name: 세션 이름 (용도별로 연결 제한을 나눌 때 사용, 예: "crawler")
+            limit_per_host: 최초 생성 시 적용할 호스트당 연결 수 (기본값: HTTP_POOL_LIMIT_PER_HOST)
+
+        Returns:
+            aiohttp.ClientSession (호출한 쪽에서 닫지 않음)
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(name)
+        if entry is not None:
+            session_loop, session = entry
+            if session_loop is loop and not session.closed:
+                return session
+            self._discard(name, session_loop, session)
+
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=limit_per_host or HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            use_dns_cache=True,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=HTTP_DEFAULT_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        self._sessions[name] = (loop, session)
+        logger.info(f"HTTP session created: {name}")
+        return session
+
+    async def close(self):
+        """현재 이벤트 루프의 세션을 모두 닫음 (애플리케이션 종료 시)"""
+        loop = asyncio.get_running_loop()
+        for name, (session_loop, session) in list(self._sessions.items()):
+            if session_loop is loop:
+                if not session.closed:
+                    await session.close()
+            else:
+                self._discard(name, session_loop, session)
+            self._sessions.pop(name, None)
+        logger.info("HTTP sessions closed")
+
+    @staticmethod
+    def _discard(name: str, session_loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession):
+        """다른 이벤트 루프에 묶인 세션 정리 (세션은 자기 루프에서만 닫을 수 있음)"""
+        if session.closed:
+            return
+        if session_loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            logger.info(f"HTTP session closed on its own event loop: {name}")
+        else:
+            logger.warning(f"HTTP session dropped without close (event loop already finished): {name}")
+
+
+def get_http_session(name: str = "default") -> aiohttp.ClientSession:
+    return HttpClientRegistry.get_instance().session(name)
@@ -0,0 +1,99 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, TypeVar
+
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+T = TypeVar("T")
+
+# HTML 파싱 전용 프로세스 수 (0이면 프로세스 풀 없이 스레드에서 파싱)
+PARSE_EXECUTOR_WORKERS = int(os.getenv("PARSE_EXECUTOR_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> ProcessPoolExecutor:
+    """HTML 파싱 전용 프로세스 풀 (최초 호출 시 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ProcessPoolExecutor(max_workers=PARSE_EXECUTOR_WORKERS, mp_context=_mp_context())
+    return _executor
+
+
+def _mp_context():
+    """
+    작업 프로세스 시작 방식
+
+    - fork: 이미 import한 모듈을 그대로 물려받아 가장 빠르지만, 다른 스레드가 있으면 락 상태까지 복사되므로
+      단일 스레드일 때(기동 직후 start_parse_executor)만 사용
+    - forkserver / spawn: 스레드가 생긴 뒤 (풀 재생성 등)
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        method = "fork"
+    else:
+        method = "forkserver" if "forkserver" in methods else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def start_parse_executor():
+    """
+    기동 시 (다른 스레드가 생기기 전) 프로세스 풀과 작업 프로세스를 미리 생성
+
+    spawn / forkserver 작업 프로세스는 실행 모듈(python -m app.main)을 다시 import하므로
+    앱 전체를 import한 상태를 fork로 물려받게 한다.
+    """
+    if PARSE_EXECUTOR_WORKERS <= 0:
+        return
+    # fork 방식은 첫 작업 제출 시 작업 프로세스를 모두 생성
+    get_parse_executor().submit(int).result()
+
+
+def shutdown_parse_executor():
+    """애플리케이션 종료 시 프로세스 풀 정리"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+
+def _reset_broken_executor(broken: ProcessPoolExecutor):
+    global _executor
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_parse_executor(func: Callable[..., T], *args) -> T:
+    """
+    CPU 작업(HTML 파싱)을 프로세스 풀에서 실행하고 결과를 await
+
+    BeautifulSoup 파싱은 GIL을 잡고 있어 스레드로 옮겨도 다른 요청 처리를 막으므로 별도 프로세스에서 실행한다.
+    func와 인자 / 반환값은 pickle 가능해야 하며, func는 가벼운 모듈(파서 모듈)의 최상위 함수여야 한다.
+    작업 프로세스가 비정상 종료되면 풀을 새로 만들어 한 번 더 시도한다.
+
+    사용 예시:
+        text = await run_in_parse_executor(extract_article_text, page_html)
+    """
+    if PARSE_EXECUTOR_WORKERS <= 0:
+        return await asyncio.to_thread(func, *args)
+
+    loop = asyncio.get_running_loop()
+    executor = get_parse_executor()
+    try:
+        return await loop.run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        logger.warning("HTML parse process pool broken → recreating")
+        _reset_broken_executor(executor)
+        return await loop.run_in_executor(get_parse_executor(), func, *args)
@@ -0,0 +1,20 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# embedded: API 프로세스 안에서 수집 스케줄 작업까지 실행 (개발용 기본값)
+# worker: 수집 작업은 별도 워커 프로세스(python -m jobs.worker)에서 실행, API는 결과 조회만
+SCHEDULER_MODE_EMBEDDED = "embedded"
+SCHEDULER_MODE_WORKER = "worker"
+
+SCHEDULER_MODE = os.getenv("SCHEDULER_MODE", SCHEDULER_MODE_EMBEDDED).lower()
+
+if SCHEDULER_MODE not in (SCHEDULER_MODE_EMBEDDED, SCHEDULER_MODE_WORKER):
+    raise RuntimeError(f"SCHEDULER_MODE must be '{SCHEDULER_MODE_EMBEDDED}' or '{SCHEDULER_MODE_WORKER}': {SCHEDULER_MODE}")
+
+
+def ingestion_in_api() -> bool:
+    """API 프로세스가 외부 데이터 수집까지 하는지 (embedded 모드)"""
+    return SCHEDULER_MODE == SCHEDULER_MODE_EMBEDDED
@@ -9,6 +9,7 @@ from pypdf import PdfReader
 
 from account.adapter.input.web.session_helper import get_current_user
 from config.crypto import Crypto
+from config.database.db_executor import run_in_db_executor
 from config.redis_config import get_redis
 from documents_multi_agents.adapter.input.web.request.insert_income_request import InsertDocumentRequest
 from documents_multi_agents.domain.service.prompt_templates import PromptTemplates
@@ -276,7 +277,8 @@ async def analyze_document(
                     
                     ie_usecase = IEInfoUseCase.get_instance()
                     now = datetime.now()
-                    db_save_result = ie_usecase.save_ie_data_from_redis(
+                    db_save_result = await run_in_db_executor(
+                        ie_usecase.save_ie_data_from_redis,
                         session_id=session_id,
                         year=now.year,
                         month=now.month
@@ -384,7 +386,7 @@ async def future_assets_analysis(session_id: str = Depends(get_current_user)):
             return {"success": False, "message": "소비 패턴 계산에 실패했습니다."}
         
         # 2. 유사 패턴 검색
-        similar_pattern = FutureAssetsLearningService.find_similar_pattern(pattern)
+        similar_pattern = await run_in_db_executor(FutureAssetsLearningService.find_similar_pattern, pattern)
         
         if similar_pattern:
             # 유사 패턴 있음 → 저장된 조언 반환
@@ -430,7 +432,7 @@ async def future_assets_analysis(session_id: str = Depends(get_current_user)):
             gpt_advice = re.sub(r'---.*', '', gpt_advice, flags=re.DOTALL)
             
             # 3. GPT 조언 저장
-            FutureAssetsLearningService.save_gpt_advice(pattern, gpt_advice)
+            await run_in_db_executor(FutureAssetsLearningService.save_gpt_advice, pattern, gpt_advice)
             
             return {
                 "success": True,
@@ -798,7 +800,8 @@ async def insert_document(
                     
                     ie_usecase = IEInfoUseCase.get_instance()
                     now = datetime.now()
-                    db_save_result = ie_usecase.save_ie_data_from_redis(
+                    db_save_result = await run_in_db_executor(
+                        ie_usecase.save_ie_data_from_redis,
                         session_id=session_id,
                         year=now.year,
                         month=now.month
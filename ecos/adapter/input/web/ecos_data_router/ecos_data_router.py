@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Body
 
+from config.database.db_executor import run_in_db_executor
 from ecos.application.factory.fetch_ecos_data_usecase_factory import FetchEcosDataUsecaseFactory
 
 ecos_data_router = APIRouter(tags=["ecos"])
@@ -23,20 +24,21 @@ async def get_exchange_rate():
 @ecos_data_router.get("/exchange_rate_by_date/{date}")
 async def get_exchange_rate_db(date:str):
     usecase = FetchEcosDataUsecaseFactory.create()
-    result = usecase.get_exchange_rate_by_date(date)
+    result = await run_in_db_executor(usecase.get_exchange_rate_by_date, date)
     return result
 
 ## API 호출 횟수 제한이 있으므로, 1년 단위 정도로 제한 할 것
 @ecos_data_router.post("/exchange_rate/save")
 async def fetch_and_save_exchange_rate(
         start:str | None = Body(None),
-        end:str | None = Body(None)
+        end:str | None = Body(None),
+        full_refresh: bool = Body(False)
 ):
     """
     ECOS API에서 환율 데이터를 조회하고 데이터베이스에 저장한다.
     """
     usecase = FetchEcosDataUsecaseFactory.create()
-    saved_entities = await usecase.fetch_and_save_exchange_rate(start, end)
+    saved_entities = await usecase.fetch_and_save_exchange_rate(start, end, full_refresh)
     
     return {
         "message": "환율 데이터가 성공적으로 저장되었습니다.",
@@ -72,20 +74,21 @@ async def get_interest_rate():
 @ecos_data_router.get("/interest_rate_by_date/{date}")
 async def get_interest_rate_db(date:str):
     usecase = FetchEcosDataUsecaseFactory.create()
-    result = usecase.get_interest_rate_by_date(date)
+    result = await run_in_db_executor(usecase.get_interest_rate_by_date, date)
     return result
 
 ## API 호출 횟수 제한이 있으므로, 1년 단위 정도로 제한 할 것
 @ecos_data_router.post("/interest_rate/save")
 async def fetch_and_save_interest_rate(
         start:str | None = Body(None),
-        end:str | None = Body(None)
+        end:str | None = Body(None),
+        full_refresh: bool = Body(False)
 ):
     """
     ECOS API에서 환율 데이터를 조회하고 데이터베이스에 저장합니다.
     """
     usecase = FetchEcosDataUsecaseFactory.create()
-    saved_entities = await usecase.fetch_and_save_interest_rate(start, end)
+    saved_entities = await usecase.fetch_and_save_interest_rate(start, end, full_refresh)
 
     return {
         "message": "금리 데이터가 성공적으로 저장되었습니다.",
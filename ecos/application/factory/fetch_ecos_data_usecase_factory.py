@@ -1,6 +1,7 @@
 from ecos.adapter.output.ecos.ecos_data_api_adapter import EcosDataApiAdapter
 from ecos.application.usecase.ecos_usecase import FetchEcosUseCase
 from ecos.infrastructure.repository.ecos_repository_impl import EcosRepositoryImpl
+from ingestion.application.factory.ingestion_state_usecase_factory import IngestionStateUsecaseFactory
 
 
 class FetchEcosDataUsecaseFactory:
@@ -8,4 +9,4 @@ class FetchEcosDataUsecaseFactory:
     def create() -> FetchEcosUseCase:
         api_adapter = EcosDataApiAdapter()
         repository = EcosRepositoryImpl.get_instance()
-        return FetchEcosUseCase(api_adapter, repository)
\ No newline at end of file
+        return FetchEcosUseCase(api_adapter, repository, IngestionStateUsecaseFactory.create())
\ No newline at end of file
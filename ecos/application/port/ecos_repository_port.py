@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import Dict, List, Optional
 
 from ecos.domain.ecos import Ecos
 from ecos.domain.ecos_interest import EcosInterest
+from ecos.infrastructure.orm.exchange_rate import ExchangeType
 
 
 class EcosRepositoryPort(ABC):
@@ -19,6 +21,10 @@ class EcosRepositoryPort(ABC):
     def get_exchange_rate_by_date(self, date: str) -> List[Ecos]:
         pass
 
+    @abstractmethod
+    async def get_exchange_rate_watermarks(self) -> Dict[ExchangeType, datetime]:
+        pass
+
     @abstractmethod
     async def save_interest_rate(self, ecos: EcosInterest) -> EcosInterest:
         pass
@@ -29,4 +35,8 @@ class EcosRepositoryPort(ABC):
 
     @abstractmethod
     def get_interest_rate_by_date(self, date: str) -> List[EcosInterest]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_interest_rate_watermark(self) -> Optional[datetime]:
+        pass
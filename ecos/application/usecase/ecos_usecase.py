@@ -1,5 +1,7 @@
-from datetime import datetime
-from typing import List
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 
 from ecos.adapter.output.ecos.ecos_data_api_adapter import EcosDataApiAdapter
 from ecos.application.port.ecos_repository_port import EcosRepositoryPort
@@ -7,14 +9,46 @@ from ecos.domain.ecos import Ecos
 from ecos.domain.ecos_data import EcosData
 from ecos.domain.ecos_interest import EcosInterest
 from ecos.infrastructure.orm.exchange_rate import ExchangeType
+from ingestion.application.usecase.ingestion_state_usecase import IngestionStateUseCase
+from ingestion.domain.ingestion_state import IngestionState
+from ingestion.infrastructure.orm.ingestion_state import IngestionStatus
+from util.lock.ingestion_lease import exclusive_ingestion
 from util.log.log import Log
 from ecos.infrastructure.api.ecos_client import EcosClient
 
 logger = Log.get_logger()
+
+# 저장된 데이터가 없는 시리즈의 최초 수집 구간 (일)
+ECOS_SYNC_INITIAL_DAYS = int(os.getenv("ECOS_SYNC_INITIAL_DAYS", "30"))
+
+# 적재 상태 데이터셋 이름
+DATASET_EXCHANGE_RATE = "ecos_exchange_rate"
+DATASET_INTEREST_RATE = "ecos_interest_rate"
+
+
+def exchange_dataset(exchange_type: ExchangeType) -> str:
+    return f"{DATASET_EXCHANGE_RATE}.{exchange_type.name}"
+
+
+def _seed_state(dataset: str, last_date: Optional[datetime]) -> Optional[IngestionState]:
+    """적재 상태 기록 이전에 저장된 데이터: 마지막 저장 일자를 워터마크로 사용"""
+    if last_date is None:
+        return None
+    return IngestionState(dataset, first_complete_date=last_date.date(), last_complete_date=last_date.date())
+
+
+def _covered(window: Tuple[date, date], erm_dates: List[datetime]) -> Optional[Tuple[date, date]]:
+    """조회 구간 시작일 ~ 마지막으로 받은 일자 (그 이후는 아직 공표 전일 수 있으므로 제외)"""
+    if not erm_dates:
+        return None
+    return window[0], max(erm_dates).date()
+
+
 class FetchEcosUseCase:
-    def __init__(self, adapter: EcosDataApiAdapter, repository: EcosRepositoryPort):
+    def __init__(self, adapter: EcosDataApiAdapter, repository: EcosRepositoryPort, ingestion: IngestionStateUseCase):
         self.adapter = adapter
         self.repository = repository
+        self.ingestion = ingestion
 
     async def get_exchange_rate(self) -> EcosData:
         return await self.adapter.get_exchange_rate()
@@ -22,18 +56,62 @@ class FetchEcosUseCase:
     def get_exchange_rate_by_date(self, date: str) -> List[Ecos]:
         return self.repository.get_exchange_rate_by_date(date)
 
-    async def fetch_and_save_exchange_rate(self, start:str, end:str) -> List[Ecos]:
+    async def fetch_and_save_exchange_rate(self, start:str, end:str, full_refresh: bool = False) -> List[Ecos]:
         """
         ECOS API에서 환율 데이터를 조회하고 데이터베이스에 저장한다.
+        통화별 적재 상태 기준으로 빠진 구간만 (통화별 동시에) 조회한다.
+        다른 프로세스가 같은 데이터셋을 적재 중이면 끝날 때까지 기다린다. (적재 임대 ingest:<dataset>)
+
+        Args:
+            start: 시작일 (YYYYMMDD, 비우면 마지막 적재 일자 다음 날부터)
+            end: 종료일 (YYYYMMDD, 비우면 오늘)
+            full_refresh: True면 이미 적재된 구간도 다시 조회
         
         Returns:
             저장된 Ecos 도메인 엔티티 리스트
         """
-        # 1. API에서 raw 데이터 조회
+        async with exclusive_ingestion(DATASET_EXCHANGE_RATE):
+            return await self._fetch_and_save_exchange_rate(start, end, full_refresh)
+
+    async def _fetch_and_save_exchange_rate(self, start: str, end: str, full_refresh: bool) -> List[Ecos]:
+        # 1. 통화별 적재 상태 기준으로 조회 구간 계산 (이미 최신인 통화는 API 호출 생략)
+        states = {state.dataset: state for state in await self.ingestion.get_states(f"{DATASET_EXCHANGE_RATE}.")}
+        if len(states) < len(ExchangeType):
+            # 적재 상태가 없는 통화는 저장된 마지막 일자로 시작
+            watermarks = await self.repository.get_exchange_rate_watermarks()
+            for exchange_type in ExchangeType:
+                dataset = exchange_dataset(exchange_type)
+                if dataset not in states:
+                    states[dataset] = _seed_state(dataset, watermarks.get(exchange_type))
+
+        initial_start = date.today() - timedelta(days=ECOS_SYNC_INITIAL_DAYS)
+        windows: Dict[ExchangeType, Tuple[date, date]] = {}
+        for exchange_type in ExchangeType:
+            state = states.get(exchange_dataset(exchange_type))
+            window = self.ingestion.plan_window(state, start or None, end or None, full_refresh, initial_start)
+            if window is not None:
+                windows[exchange_type] = window
+
+        if not windows:
+            logger.info("ECOS 환율: 모든 통화가 최신 상태라 조회를 생략합니다.")
+            return []
+        logger.info(f"ECOS 환율 조회 구간: { {t.name: f'{s:%Y%m%d}~{e:%Y%m%d}' for t, (s, e) in windows.items()} }")
+
+        # 2. API에서 raw 데이터 조회
+        started = time.perf_counter()
         client = EcosClient()
-        raw_items = await client.get_exchange_rate(start, end)
+        try:
+            raw_items = await client.get_exchange_rate_windows({
+                exchange_type: (s.strftime("%Y%m%d"), e.strftime("%Y%m%d"))
+                for exchange_type, (s, e) in windows.items()
+            })
+        except Exception as e:
+            for exchange_type in windows:
+                dataset = exchange_dataset(exchange_type)
+                await self.ingestion.record(dataset, None, 0, 0.0, IngestionStatus.FAILED, str(e), states.get(dataset))
+            raise
         
-        # 2. Raw 데이터를 Domain Entity로 변환
+        # 3. Raw 데이터를 Domain Entity로 변환
         ecos_entities = []
         for item in raw_items:
             # ITEM_CODE1을 ExchangeType으로 변환
@@ -69,9 +147,18 @@ class FetchEcosUseCase:
             )
             ecos_entities.append(ecos)
         
-        # 3. Repository를 통해 배치 저장
+        # 4. Repository를 통해 배치 저장
         if ecos_entities:
             await self.repository.save_exchange_rates_batch(ecos_entities)
+
+        # 5. 통화별 적재 상태 기록
+        duration_ms = (time.perf_counter() - started) * 1000
+        for exchange_type, window in windows.items():
+            dataset = exchange_dataset(exchange_type)
+            erm_dates = [e.erm_date for e in ecos_entities if e.exchange_type == exchange_type]
+            await self.ingestion.record(
+                dataset, _covered(window, erm_dates), len(erm_dates), duration_ms, state=states.get(dataset)
+            )
         
         return ecos_entities
 
@@ -81,18 +168,45 @@ class FetchEcosUseCase:
     def get_interest_rate_by_date(self, date: str) -> List[EcosInterest]:
         return self.repository.get_interest_rate_by_date(date)
 
-    async def fetch_and_save_interest_rate(self, start:str, end:str) -> List[EcosInterest]:
+    async def fetch_and_save_interest_rate(self, start:str, end:str, full_refresh: bool = False) -> List[EcosInterest]:
         """
         ECOS API에서 금리 데이터를 조회하고 데이터베이스에 저장한다.
+        적재 상태 기준으로 빠진 구간만 조회한다.
+        다른 프로세스가 같은 데이터셋을 적재 중이면 끝날 때까지 기다린다. (적재 임대 ingest:<dataset>)
+
+        Args:
+            start: 시작일 (YYYYMMDD, 비우면 마지막 적재 일자 다음 날부터)
+            end: 종료일 (YYYYMMDD, 비우면 오늘)
+            full_refresh: True면 이미 적재된 구간도 다시 조회
 
         Returns:
             저장된 EcosInterest 도메인 엔티티 리스트
         """
-        # 1. API에서 raw 데이터 조회
+        async with exclusive_ingestion(DATASET_INTEREST_RATE):
+            return await self._fetch_and_save_interest_rate(start, end, full_refresh)
+
+    async def _fetch_and_save_interest_rate(self, start: str, end: str, full_refresh: bool) -> List[EcosInterest]:
+        # 1. 적재 상태 기준으로 조회 구간 계산 (이미 최신이면 생략)
+        state = await self.ingestion.get_state(DATASET_INTEREST_RATE)
+        if state is None:
+            state = _seed_state(DATASET_INTEREST_RATE, await self.repository.get_interest_rate_watermark())
+
+        initial_start = date.today() - timedelta(days=ECOS_SYNC_INITIAL_DAYS)
+        window = self.ingestion.plan_window(state, start or None, end or None, full_refresh, initial_start)
+        if window is None:
+            logger.info("ECOS 금리: 최신 상태라 조회를 생략합니다.")
+            return []
+
+        # 2. API에서 raw 데이터 조회
+        started = time.perf_counter()
         client = EcosClient()
-        raw_items = await client.get_interest_rate(start, end)
+        try:
+            raw_items = await client.get_interest_rate(window[0].strftime("%Y%m%d"), window[1].strftime("%Y%m%d"))
+        except Exception as e:
+            await self.ingestion.record(DATASET_INTEREST_RATE, None, 0, 0.0, IngestionStatus.FAILED, str(e), state)
+            raise
 
-        # 2. Raw 데이터를 Domain Entity로 변환
+        # 3. Raw 데이터를 Domain Entity로 변환
         ecos_entities = []
         for item in raw_items:
             item_code = item.get('ITEM_NAME1')
@@ -120,8 +234,15 @@ class FetchEcosUseCase:
             )
             ecos_entities.append(ecos)
 
-        # 3. Repository를 통해 배치 저장
+        # 4. Repository를 통해 배치 저장
         if ecos_entities:
             await self.repository.save_interest_rates_batch(ecos_entities)
 
+        # 5. 적재 상태 기록
+        erm_dates = [e.erm_date for e in ecos_entities]
+        await self.ingestion.record(
+            DATASET_INTEREST_RATE, _covered(window, erm_dates), len(erm_dates),
+            (time.perf_counter() - started) * 1000, state=state,
+        )
+
         return ecos_entities
\ No newline at end of file
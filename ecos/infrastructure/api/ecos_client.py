@@ -1,12 +1,15 @@
+import asyncio
 import os
 from datetime import datetime, timedelta
-import aiohttp
+from typing import Dict, Iterable, Optional, Tuple
 
+from config.http_client import HttpClientRegistry
 from ecos.infrastructure.orm.exchange_rate import ExchangeType
 
 class EcosClient:
 
-    def __init__(self):
+    def __init__(self, http: Optional[HttpClientRegistry] = None):
+        self.http = http or HttpClientRegistry.get_instance()
         self.base_url = os.getenv("ECOS_BASE_URL")
         self.rate_url = os.getenv("ECOS_RATE_URL")
         self.api_key = os.getenv("ECOS_API_KEY")
@@ -14,7 +17,9 @@ class EcosClient:
         self.interest_key = os.getenv("ECOS_INTEREST_SERVICE_KEY")
 
     ## 환율
-    async def get_exchange_rate(self, start: str = None, end: str = None) -> list[dict]:
+    async def get_exchange_rate(
+            self, start: str = None, end: str = None, types: Optional[Iterable[ExchangeType]] = None
+    ) -> list[dict]:
         if start and end:
             yesterday = datetime.strptime(start, "%Y%m%d").strftime("%Y%m%d")
             today = datetime.strptime(end, "%Y%m%d").strftime("%Y%m%d")
@@ -22,27 +27,37 @@ class EcosClient:
             yesterday = (datetime.today() - timedelta(days=1)).strftime("%Y%m%d")
             today = datetime.today().strftime("%Y%m%d")
 
-        results = []
+        types = list(types) if types is not None else list(ExchangeType)
+        return await self.get_exchange_rate_windows({ex_type: (yesterday, today) for ex_type in types})
+
+    async def get_exchange_rate_windows(self, windows: Dict[ExchangeType, Tuple[str, str]]) -> list[dict]:
+        """
+        통화별 조회 구간을 받아 동시에 조회
 
-        async with aiohttp.ClientSession() as session:
-            base_url = (
-                f"{self.base_url}/{self.rate_url}/"
-                f"{self.api_key}/json/kr/1/100000/"
-                f"{self.exchange_key}/D/"
-                f"{yesterday}/{today}"
-            )
+        Args:
+            windows: 통화 → (시작일, 종료일) (YYYYMMDD)
 
-            for ex_type in [ExchangeType.DOLLAR, ExchangeType.YEN, ExchangeType.EURO]:
-                url = f"{base_url}/{ex_type.value}"
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise Exception(f"Ecos API {ex_type.name} Error {response.status}")
-                    data = await response.json()
-                    stat = data.get("StatisticSearch", {})
-                    rows = stat.get("row", [])
-                    results.extend(rows)
+        Returns:
+            ECOS 행 목록 (windows 순서대로)
+        """
+        rows_per_type = await asyncio.gather(*(
+            self._get_exchange_series(ex_type, start, end) for ex_type, (start, end) in windows.items()
+        ))
+        return [row for rows in rows_per_type for row in rows]
 
-        return results
+    async def _get_exchange_series(self, ex_type: ExchangeType, start: str, end: str) -> list[dict]:
+        url = (
+            f"{self.base_url}/{self.rate_url}/"
+            f"{self.api_key}/json/kr/1/100000/"
+            f"{self.exchange_key}/D/"
+            f"{start}/{end}/{ex_type.value}"
+        )
+        async with self.http.session().get(url) as response:
+            if response.status != 200:
+                raise Exception(f"Ecos API {ex_type.name} Error {response.status}")
+            data = await response.json()
+        stat = data.get("StatisticSearch", {})
+        return stat.get("row", [])
 
     ## 금리
     async def get_interest_rate(self, start:str = None, end:str = None) -> list[dict]:
@@ -55,21 +70,20 @@ class EcosClient:
 
         results = []
 
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{self.base_url}/{self.rate_url}/"
-                f"{self.api_key}/json/kr/1/100000/"
-                f"{self.interest_key}/D/"
-                f"{yesterday}/{today}"
-            )
+        url = (
+            f"{self.base_url}/{self.rate_url}/"
+            f"{self.api_key}/json/kr/1/100000/"
+            f"{self.interest_key}/D/"
+            f"{yesterday}/{today}"
+        )
 
-            async with session.get(f"{url}") as response:
-                if response.status != 200:
-                    raise Exception(f"Ecos API Interest Error {response.status}")
-                data = await response.json()
-                stat = data.get("StatisticSearch", {})
-                rows = stat.get("row", [])
-                results.extend(rows)
+        async with self.http.session().get(f"{url}") as response:
+            if response.status != 200:
+                raise Exception(f"Ecos API Interest Error {response.status}")
+            data = await response.json()
+            stat = data.get("StatisticSearch", {})
+            rows = stat.get("row", [])
+            results.extend(rows)
 
 
         return results
\ No newline at end of file
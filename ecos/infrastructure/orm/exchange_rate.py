@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, DateTime, Enum as SAEnum, Integer, Float
+from sqlalchemy import Column, DateTime, Enum as SAEnum, Integer, Float, Index
 
 from config.database.session import Base
 
@@ -13,6 +13,10 @@ class ExchangeType(PyEnum):
 
 class ExchangeRateORM(Base):
     __tablename__ = "exchange_rate"
+    __table_args__ = (
+        Index("ix_exchange_rate_type_erm_date", "exchange_type", "erm_date"),  # 통화별 일자 중복 체크
+        Index("ix_exchange_rate_erm_date", "erm_date"),  # 월별 조회
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     exchange_type = Column(SAEnum(ExchangeType, native_enum=True), nullable=False)
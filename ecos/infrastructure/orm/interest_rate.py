@@ -1,12 +1,16 @@
 from datetime import datetime
 
-from sqlalchemy import Column, String, DateTime, Integer, Float
+from sqlalchemy import Column, String, DateTime, Integer, Float, Index
 
 from config.database.session import Base
 
 
 class InterestRateORM(Base):
     __tablename__ = "interest_rate"
+    __table_args__ = (
+        Index("ix_interest_rate_type_erm_date", "interest_type", "erm_date"),  # 금리 종류별 일자 중복 체크
+        Index("ix_interest_rate_erm_date", "erm_date"),  # 월별 조회
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     interest_type = Column(String(255), nullable=False)
@@ -1,73 +1,69 @@
-from typing import List
+from typing import List, Optional
 
 from finance.application.port.finance_repository_port import FinanceRepositoryPort
-from finance.infrastructure.orm.finance_orm import FinanceORM
+from finance.infrastructure.orm.finance_orm import FinanceORM, FinanceType
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
-from config.database.session import get_db_session
+from config.database.bulk_upsert import bulk_insert, filter_new
+from config.database.session import get_current_session
+
+
+def _naive(value):
+    # DB(DateTime)에는 타임존 없이 저장되므로 비교 시 tzinfo 제거
+    return value.replace(tzinfo=None) if value is not None and getattr(value, "tzinfo", None) else value
+
+
+def _finance_key(finance: FinanceORM):
+    return (finance.user_id, FinanceType(finance.type), _naive(finance.base_dt), finance.key, finance.value)
+
 
 class FinanceRepositoryImpl(FinanceRepositoryPort):
     __instance = None
 
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-        return cls.__instance
-
     @classmethod
     def get_instance(cls):
         if cls.__instance is None:
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, 'db'):
-            self.db: Session = get_db_session()
+    def __init__(self, session: Optional[Session] = None):
+        # session을 주입하지 않으면 현재 Unit of Work(요청/스케줄 작업)의 세션을 사용
+        self._session = session
+
+    @property
+    def db(self) -> Session:
+        return self._session or get_current_session()
 
     def save_finance_data(self, finance_data: List[FinanceORM]) -> List[FinanceORM]:
 
-        try:
-            if not finance_data:
-                return []
-
-            new_finance_data = []
-
-            for finance in finance_data:
-
-                existing = self.db.query(FinanceORM).filter(
-                    and_(
-                        FinanceORM.user_id == finance.user_id,
-                        FinanceORM.type == finance.type,
-                        FinanceORM.base_dt == finance.base_dt,
-                        FinanceORM.key == finance.key,
-                        FinanceORM.value == finance.value
-                    )
-                ).first()
-
-                if not existing:
-                    new_finance_data.append(finance)
-
-            if not new_finance_data:
-                return []
-
-            orm_list = [
-                FinanceORM(
-                    user_id=finance.user_id,
-                    type=finance.type,
-                    base_dt=finance.base_dt,
-                    key=finance.key,
-                    value=finance.value
-                )
-                for finance in new_finance_data
-            ]
-
-            self.db.add_all(orm_list)
-            self.db.commit()
-
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
-
-            return orm_list
-        finally:
-            self.db.close()
\ No newline at end of file
+        if not finance_data:
+            return []
+
+        # 5개 컬럼 자연키를 한 번에 조회하여 신규 항목만 추림
+        new_finance_data = filter_new(
+            self.db,
+            finance_data,
+            key_columns=(FinanceORM.user_id, FinanceORM.type, FinanceORM.base_dt, FinanceORM.key, FinanceORM.value),
+            key_of=_finance_key,
+            normalize=lambda row: (row[0], FinanceType(row[1]), _naive(row[2]), row[3], row[4]),
+        )
+
+        if not new_finance_data:
+            return []
+
+        rows = [
+            {
+                "user_id": finance.user_id,
+                "type": finance.type,
+                "base_dt": finance.base_dt,
+                "key": finance.key,
+                "value": finance.value,
+            }
+            for finance in new_finance_data
+        ]
+
+        # 응답에 id가 필요하므로 PK가 채워진 객체로 받음
+        orm_list = bulk_insert(self.db, FinanceORM, rows, with_ids=True)
+        self.db.commit()
+
+        return orm_list
\ No newline at end of file
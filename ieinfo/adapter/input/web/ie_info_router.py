@@ -2,6 +2,7 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 
 from account.adapter.input.web.session_helper import get_current_user
+from config.database.db_executor import run_in_db_executor
 from config.redis_config import get_redis
 from ieinfo.application.usecase.ie_info_usecase import IEInfoUseCase
 from util.log.log import Log
@@ -57,7 +58,7 @@ async def save_ie_data_to_db(
             month = now.month
         
         # 데이터 저장
-        result = usecase.save_ie_data_from_redis(session_id, year, month)
+        result = await run_in_db_executor(usecase.save_ie_data_from_redis, session_id, year, month)
         
         if result["success"]:
             return result
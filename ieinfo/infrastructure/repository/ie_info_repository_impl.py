@@ -1,8 +1,8 @@
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
-from config.database.session import get_db_session
+from config.database.session import get_current_session
 from ieinfo.application.port.ie_info_repository_port import IEInfoRepositoryPort
 from ieinfo.infrastructure.orm.ie_info import IEInfo
 from util.log.log import Log
@@ -13,20 +13,19 @@ logger = Log.get_logger()
 class IEInfoRepositoryImpl(IEInfoRepositoryPort):
     __instance = None
 
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-        return cls.__instance
-
     @classmethod
     def get_instance(cls):
         if cls.__instance is None:
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, 'db'):
-            self.db: Session = get_db_session()
+    def __init__(self, session: Optional[Session] = None):
+        # session을 주입하지 않으면 현재 Unit of Work(요청/스케줄 작업)의 세션을 사용
+        self._session = session
+
+    @property
+    def db(self) -> Session:
+        return self._session or get_current_session()
     
     def bulk_insert(self, ie_info_list: List[IEInfo]) -> bool:
         """IE_INFO 데이터 일괄 저장"""
@@ -39,8 +38,6 @@ class IEInfoRepositoryImpl(IEInfoRepositoryPort):
             self.db.rollback()
             logger.error(f"Failed to insert IE_INFO records: {str(e)}")
             raise
-        finally:
-            self.db.close()
 
     def delete_by_session_and_month(self, session_id: str, year: int, month: int) -> bool:
         """특정 세션의 특정 월 데이터 삭제 (중복 방지용)"""
@@ -59,8 +56,6 @@ class IEInfoRepositoryImpl(IEInfoRepositoryPort):
             self.db.rollback()
             logger.error(f"Failed to delete IE_INFO records: {str(e)}")
             raise
-        finally:
-            self.db.close()
 
     def get_by_session(self, session_id: str, year: int = None, month: int = None) -> List[IEInfo]:
         """세션별 데이터 조회"""
@@ -76,5 +71,3 @@ class IEInfoRepositoryImpl(IEInfoRepositoryPort):
         except Exception as e:
             logger.error(f"Failed to fetch IE_INFO records: {str(e)}")
             raise
-        finally:
-            self.db.close()
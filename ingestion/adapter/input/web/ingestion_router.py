@@ -0,0 +1,44 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from admin.adapter.input.web.admin_auth import verify_admin_token
+from ingestion.application.factory.ingestion_state_usecase_factory import IngestionStateUsecaseFactory
+from ingestion.application.factory.job_run_usecase_factory import JobRunUsecaseFactory
+
+ingestion_router = APIRouter(tags=["ingestion"], dependencies=[Depends(verify_admin_token)])
+
+
+@ingestion_router.get("/state")
+async def get_ingestion_states(prefix: Optional[str] = Query(None)):
+    """
+    데이터셋별 적재 상태 (연속 적재 구간, 마지막 실행 결과) 목록
+    """
+    usecase = IngestionStateUsecaseFactory.create()
+    states = await usecase.get_states(prefix)
+    return {"items": [state.to_dict() for state in states]}
+
+
+@ingestion_router.get("/state/{dataset}")
+async def get_ingestion_state(dataset: str):
+    usecase = IngestionStateUsecaseFactory.create()
+    state = await usecase.get_state(dataset)
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"적재 이력이 없는 데이터셋입니다: {dataset}")
+    return state.to_dict()
+
+
+@ingestion_router.get("/jobs")
+async def get_job_runs(job_name: Optional[str] = Query(None), limit: int = Query(50, ge=1, le=500)):
+    """
+    스케줄 작업 실행 이력 (실행 프로세스, 펜싱 토큰, 소요 시간) 최신순
+    """
+    usecase = JobRunUsecaseFactory.create()
+    runs = await usecase.get_runs(job_name, limit)
+    return {"items": [run.to_dict() for run in runs]}
+
+
+@ingestion_router.get("/jobs/{job_name}")
+async def get_job_summary(job_name: str, limit: int = Query(50, ge=1, le=500)):
+    usecase = JobRunUsecaseFactory.create()
+    return await usecase.summary(job_name, limit)
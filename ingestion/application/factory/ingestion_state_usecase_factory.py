@@ -0,0 +1,9 @@
+from ingestion.application.usecase.ingestion_state_usecase import IngestionStateUseCase
+from ingestion.infrastructure.repository.ingestion_state_repository_impl import IngestionStateRepositoryImpl
+
+
+class IngestionStateUsecaseFactory:
+    @staticmethod
+    def create() -> IngestionStateUseCase:
+        repository = IngestionStateRepositoryImpl.get_instance()
+        return IngestionStateUseCase(repository)
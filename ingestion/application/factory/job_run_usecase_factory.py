@@ -0,0 +1,9 @@
+from ingestion.application.usecase.job_run_usecase import JobRunUseCase
+from ingestion.infrastructure.repository.job_run_repository_impl import JobRunRepositoryImpl
+
+
+class JobRunUsecaseFactory:
+    @staticmethod
+    def create() -> JobRunUseCase:
+        repository = JobRunRepositoryImpl.get_instance()
+        return JobRunUseCase(repository)
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
+
+from ingestion.domain.ingestion_state import IngestionState
+
+
+class IngestionStateRepositoryPort(ABC):
+
+    @abstractmethod
+    async def get_state(self, dataset: str) -> Optional[IngestionState]:
+        pass
+
+    @abstractmethod
+    async def get_states(self, prefix: Optional[str] = None) -> List[IngestionState]:
+        pass
+
+    @abstractmethod
+    async def save_state(self, state: IngestionState) -> IngestionState:
+        pass
+
+    @abstractmethod
+    async def update_state(
+            self,
+            dataset: str,
+            update: Callable[[IngestionState], None],
+            default: Optional[IngestionState] = None,
+    ) -> IngestionState:
+        pass
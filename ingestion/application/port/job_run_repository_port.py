@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from ingestion.domain.job_run import JobRun
+
+
+class JobRunRepositoryPort(ABC):
+
+    @abstractmethod
+    async def save_run(self, run: JobRun) -> JobRun:
+        pass
+
+    @abstractmethod
+    async def get_runs(self, job_name: Optional[str] = None, limit: int = 50) -> List[JobRun]:
+        pass
@@ -0,0 +1,184 @@
+import os
+from datetime import date, datetime
+from typing import List, Optional, Tuple, Union
+
+from ingestion.application.port.ingestion_state_repository_port import IngestionStateRepositoryPort
+from ingestion.domain.ingestion_state import IngestionState
+from ingestion.infrastructure.orm.ingestion_state import IngestionStatus
+from util.date.business_day import business_days
+from util.ingestion.range_ingestion import IngestionReport
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 워터마크 이후 한 번에 따라잡을 최대 영업일 수 (초과분은 다음 실행에서 이어서 수집)
+INGESTION_MAX_CATCHUP_DAYS = int(os.getenv("INGESTION_MAX_CATCHUP_DAYS", "31"))
+
+DateLike = Union[str, date, datetime, None]
+
+
+def _to_date(value: DateLike) -> Optional[date]:
+    if value in (None, ""):
+        return None
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y%m%d").date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+class IngestionStateUseCase:
+    """
+    데이터셋 적재 상태 조회 / 수집 계획 / 결과 기록
+
+    수집 파이프라인은 plan_days()로 빠진 일자만 요청하고, 끝나면 record()로 결과를 남긴다.
+    """
+
+    def __init__(self, repository: IngestionStateRepositoryPort):
+        self.repository = repository
+
+    async def get_state(self, dataset: str) -> Optional[IngestionState]:
+        return await self.repository.get_state(dataset)
+
+    async def get_states(self, prefix: Optional[str] = None) -> List[IngestionState]:
+        return await self.repository.get_states(prefix)
+
+    @staticmethod
+    def plan_days(
+            state: Optional[IngestionState],
+            start: DateLike = None,
+            end: DateLike = None,
+            full_refresh: bool = False,
+            initial_start: DateLike = None,
+    ) -> List[date]:
+        """
+        적재 상태 기준으로 수집할 영업일 목록 계산
+
+        - start 지정: [start, end] 영업일 중 이미 적재된 구간을 뺀 나머지 (full_refresh=True면 전체)
+        - start 미지정: 워터마크 다음 날부터 end(기본 오늘)까지 → 중단 기간 자동 보충
+          적재 이력이 없으면 initial_start(기본 end 당일)부터
+          INGESTION_MAX_CATCHUP_DAYS 영업일을 넘으면 오래된 날부터 그만큼만
+
+        Args:
+            state: 데이터셋 적재 상태 (없으면 None)
+            start: 시작일 (YYYYMMDD 또는 date)
+            end: 종료일 (YYYYMMDD 또는 date, 기본 오늘)
+            full_refresh: 이미 적재된 일자도 다시 수집
+            initial_start: 적재 이력이 없을 때의 시작일
+
+        Returns:
+            수집할 영업일 목록 (오름차순)
+        """
+        end_date = _to_date(end) or date.today()
+        start_date = _to_date(start)
+
+        if start_date is not None:
+            days = business_days(start_date, end_date)
+            if state is not None and not full_refresh:
+                days = [day for day in days if not state.covers(day)]
+            return days
+
+        next_date = state.next_date if state is not None else None
+        start_date = next_date or _to_date(initial_start) or end_date
+        return business_days(start_date, end_date)[:INGESTION_MAX_CATCHUP_DAYS]
+
+    @classmethod
+    def plan_window(
+            cls,
+            state: Optional[IngestionState],
+            start: DateLike = None,
+            end: DateLike = None,
+            full_refresh: bool = False,
+            initial_start: DateLike = None,
+    ) -> Optional[Tuple[date, date]]:
+        """구간 단위로 요청하는 API용: plan_days() 결과의 (첫날, 마지막 날), 없으면 None"""
+        days = cls.plan_days(state, start, end, full_refresh, initial_start)
+        return (days[0], days[-1]) if days else None
+
+    @staticmethod
+    def covered_range(report: IngestionReport) -> Optional[Tuple[date, date]]:
+        """
+        일자별 수집 결과에서 빠짐없이 적재된 연속 구간
+
+        첫 실패 일자 이전까지, 데이터가 있었던 마지막 일자까지를 완료로 본다.
+        그 사이 데이터가 없던 일자는 휴장일로 보고, 마지막 데이터 이후의 빈 일자
+        (아직 공시 전일 수 있음)는 완료로 보지 않는다.
+        """
+        if not report.days:
+            return None
+
+        last_with_data = None
+        for result in sorted(report.days, key=lambda r: r.day):
+            if result.error:
+                break
+            if result.saved or result.fetched:
+                last_with_data = result.day
+
+        if last_with_data is None:
+            return None
+        return min(r.day for r in report.days), last_with_data
+
+    async def record(
+            self,
+            dataset: str,
+            covered: Optional[Tuple[date, date]],
+            row_count: int,
+            duration_ms: float,
+            status: IngestionStatus = IngestionStatus.SUCCESS,
+            message: Optional[str] = None,
+            state: Optional[IngestionState] = None,
+    ) -> IngestionState:
+        """
+        수집 결과 기록 (연속 적재 구간 병합 + 마지막 실행 정보)
+
+        Args:
+            dataset: 데이터셋 이름
+            covered: 이번 실행에서 연속 적재한 (시작일, 종료일), 없으면 None
+            row_count: 적재 건수
+            duration_ms: 소요 시간
+            status: 실행 결과
+            message: 실패 일자 / 오류 요약
+            state: 계획 시 읽은 상태 (상태 행이 아직 없을 때의 시작 상태로만 사용)
+        """
+        def apply(current: IngestionState):
+            # 계획 이후 다른 작업(백필 등)이 기록한 구간을 잃지 않도록 최신 상태에 병합
+            if covered is not None:
+                current.merge(*covered)
+            current.status = status
+            current.row_count = row_count
+            current.duration_ms = duration_ms
+            current.message = message
+            current.last_run_at = datetime.utcnow()
+
+        saved = await self.repository.update_state(dataset, apply, default=state)
+        logger.info(f"[ingestion] {dataset} {saved.to_dict()}")
+        return saved
+
+    async def record_report(
+            self,
+            dataset: str,
+            report: IngestionReport,
+            state: Optional[IngestionState] = None,
+    ) -> IngestionState:
+        """RangeIngestionEngine 결과 기록"""
+        failed = report.failed_days
+        if not failed:
+            status = IngestionStatus.SUCCESS
+        elif len(failed) < len(report.days):
+            status = IngestionStatus.PARTIAL
+        else:
+            status = IngestionStatus.FAILED
+
+        message = None
+        if failed:
+            message = ", ".join(f"{d.day:%Y%m%d}: {d.error}" for d in failed)
+
+        return await self.record(
+            dataset,
+            covered=self.covered_range(report),
+            row_count=report.saved,
+            duration_ms=report.elapsed_sec * 1000,
+            status=status,
+            message=message,
+            state=state,
+        )
@@ -0,0 +1,53 @@
+import statistics
+from datetime import datetime
+from typing import List, Optional
+
+from ingestion.application.port.job_run_repository_port import JobRunRepositoryPort
+from ingestion.domain.job_run import JobRun
+from ingestion.infrastructure.orm.job_run import JobRunStatus
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+
+class JobRunUseCase:
+    """스케줄 작업 실행 이력 기록 / 조회"""
+
+    def __init__(self, repository: JobRunRepositoryPort):
+        self.repository = repository
+
+    async def start(self, job_name: str, slot: datetime, owner: str, fence: Optional[int]) -> JobRun:
+        return await self.repository.save_run(JobRun(job_name, slot, owner, fence))
+
+    async def finish(self, run: JobRun, status: JobRunStatus, message: Optional[str] = None) -> JobRun:
+        run.status = status
+        run.finished_at = datetime.utcnow()
+        run.duration_ms = (run.finished_at - run.started_at).total_seconds() * 1000
+        run.message = message
+        saved = await self.repository.save_run(run)
+        logger.info(f"[job] {saved.to_dict()}")
+        return saved
+
+    async def get_runs(self, job_name: Optional[str] = None, limit: int = 50) -> List[JobRun]:
+        return await self.repository.get_runs(job_name, limit)
+
+    async def summary(self, job_name: str, limit: int = 50) -> dict:
+        """
+        최근 실행 요약 (소요 시간 추이 확인용)
+
+        Returns:
+            실행 횟수, 상태별 횟수, 완료된 실행의 평균 / 최대 소요 시간, 최근 실행 목록
+        """
+        runs = await self.repository.get_runs(job_name, limit)
+        durations = [run.duration_ms for run in runs if run.duration_ms is not None]
+        statuses = {}
+        for run in runs:
+            statuses[run.status.value] = statuses.get(run.status.value, 0) + 1
+        return {
+            "job_name": job_name,
+            "runs": len(runs),
+            "statuses": statuses,
+            "avg_duration_ms": round(statistics.fmean(durations), 1) if durations else None,
+            "max_duration_ms": round(max(durations), 1) if durations else None,
+            "items": [run.to_dict() for run in runs],
+        }
@@ -0,0 +1,80 @@
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from ingestion.infrastructure.orm.ingestion_state import IngestionStatus
+from util.date.business_day import business_days
+
+
+class IngestionState:
+    """
+    데이터셋별 적재 상태
+
+    [first_complete_date, last_complete_date] 는 빠짐없이 적재가 끝난 연속 구간이다.
+    수집 계획은 이 구간을 기준으로 빠진 일자만 요청한다.
+    """
+
+    def __init__(
+            self,
+            dataset: str,
+            first_complete_date: Optional[date] = None,
+            last_complete_date: Optional[date] = None,
+            status: Optional[IngestionStatus] = None,
+            row_count: int = 0,
+            duration_ms: float = 0.0,
+            message: Optional[str] = None,
+            last_run_at: Optional[datetime] = None,
+    ):
+        self.dataset = dataset
+        self.first_complete_date = first_complete_date
+        self.last_complete_date = last_complete_date
+        self.status = status
+        self.row_count = row_count
+        self.duration_ms = duration_ms
+        self.message = message
+        self.last_run_at = last_run_at
+
+    @property
+    def next_date(self) -> Optional[date]:
+        """워터마크 다음 날 (적재 이력이 없으면 None)"""
+        return self.last_complete_date + timedelta(days=1) if self.last_complete_date else None
+
+    def covers(self, day: date) -> bool:
+        if self.first_complete_date is None or self.last_complete_date is None:
+            return False
+        return self.first_complete_date <= day <= self.last_complete_date
+
+    def merge(self, start: date, end: date):
+        """
+        이번 실행에서 연속 적재한 [start, end] 구간을 기존 구간에 합침
+
+        두 구간이 겹치거나 사이에 영업일이 없을 때만 합치고,
+        떨어져 있으면 기존 구간을 유지한다 (사이 빈 구간은 다음 실행에서 채움).
+        """
+        if start > end:
+            return
+        if self.first_complete_date is None or self.last_complete_date is None:
+            self.first_complete_date, self.last_complete_date = start, end
+            return
+
+        if _connected(self.last_complete_date, start) and _connected(end, self.first_complete_date):
+            self.first_complete_date = min(self.first_complete_date, start)
+            self.last_complete_date = max(self.last_complete_date, end)
+
+    def to_dict(self) -> dict:
+        return {
+            "dataset": self.dataset,
+            "first_complete_date": self.first_complete_date.isoformat() if self.first_complete_date else None,
+            "last_complete_date": self.last_complete_date.isoformat() if self.last_complete_date else None,
+            "status": self.status.value if self.status else None,
+            "row_count": self.row_count,
+            "duration_ms": round(self.duration_ms, 1),
+            "message": self.message,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+        }
+
+
+def _connected(before: date, after: date) -> bool:
+    """before 구간 끝과 after 구간 시작이 겹치거나 사이에 영업일이 없는지"""
+    if after <= before + timedelta(days=1):
+        return True
+    return not business_days(before + timedelta(days=1), after - timedelta(days=1))
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Optional
+
+from ingestion.infrastructure.orm.job_run import JobRunStatus
+
+
+class JobRun:
+    """스케줄 작업 1회 실행 기록"""
+
+    def __init__(
+            self,
+            job_name: str,
+            slot: datetime,
+            owner: str,
+            fence: Optional[int] = None,
+            status: JobRunStatus = JobRunStatus.RUNNING,
+            started_at: Optional[datetime] = None,
+            finished_at: Optional[datetime] = None,
+            duration_ms: Optional[float] = None,
+            message: Optional[str] = None,
+            id: Optional[int] = None,
+    ):
+        self.id = id
+        self.job_name = job_name
+        self.slot = slot
+        self.owner = owner
+        self.fence = fence
+        self.status = status
+        self.started_at = started_at or datetime.utcnow()
+        self.finished_at = finished_at
+        self.duration_ms = duration_ms
+        self.message = message
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "job_name": self.job_name,
+            "slot": self.slot.isoformat() if self.slot else None,
+            "owner": self.owner,
+            "fence": self.fence,
+            "status": self.status.value if self.status else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_ms": round(self.duration_ms, 1) if self.duration_ms is not None else None,
+            "message": self.message,
+        }
@@ -0,0 +1,29 @@
+from datetime import datetime
+from enum import Enum as PyEnum
+
+from sqlalchemy import Column, DateTime, Enum as SAEnum, Float, Integer, String
+
+from config.database.session import Base
+
+
+class IngestionStatus(str, PyEnum):
+    SUCCESS = "SUCCESS"    # 계획한 구간 전체 적재
+    PARTIAL = "PARTIAL"    # 일부 일자 실패 (실패 일자부터 다음 실행에서 다시 수집)
+    FAILED = "FAILED"      # 적재 실패
+
+
+class IngestionStateORM(Base):
+    __tablename__ = "ingestion_state"
+
+    dataset = Column(String(64), primary_key=True)              # 예: product_etf, ecos_exchange_rate.DOLLAR
+    first_complete_date = Column(DateTime, nullable=True)      # 연속 적재 구간 시작일
+    last_complete_date = Column(DateTime, nullable=True)       # 연속 적재 구간 종료일 (워터마크)
+    status = Column(SAEnum(IngestionStatus, native_enum=True), nullable=False)
+    row_count = Column(Integer, nullable=False, default=0)     # 마지막 실행 적재 건수
+    duration_ms = Column(Float, nullable=False, default=0.0)   # 마지막 실행 소요 시간
+    message = Column(String(512), nullable=True)               # 실패 일자 / 오류 요약
+    last_run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return (f"<IngestionStateORM dataset={self.dataset} "
+                f"range={self.first_complete_date}~{self.last_complete_date} status={self.status}>")
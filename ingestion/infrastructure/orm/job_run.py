@@ -0,0 +1,34 @@
+from datetime import datetime
+from enum import Enum as PyEnum
+
+from sqlalchemy import BigInteger, Column, DateTime, Enum as SAEnum, Float, Index, Integer, String
+
+from config.database.session import Base
+
+
+class JobRunStatus(str, PyEnum):
+    RUNNING = "RUNNING"    # 실행 중 (프로세스가 죽으면 이 상태로 남음)
+    SUCCESS = "SUCCESS"
+    FAILED = "FAILED"
+    LOST = "LOST"          # 실행 중 임대를 잃어 중단
+
+
+class JobRunORM(Base):
+    __tablename__ = "scheduled_job_run"
+    __table_args__ = (
+        Index("ix_scheduled_job_run_job_started", "job_name", "started_at"),  # 작업별 최근 실행 조회
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_name = Column(String(64), nullable=False)
+    slot = Column(DateTime, nullable=False)                     # 스케줄 실행 시각 (같은 시각은 한 번만 실행)
+    owner = Column(String(128), nullable=False)                 # 실행한 프로세스 (호스트:PID)
+    fence = Column(BigInteger, nullable=True)                   # 임대 펜싱 토큰 (Redis 장애로 임대 없이 실행하면 NULL)
+    status = Column(SAEnum(JobRunStatus, native_enum=True), nullable=False)
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    duration_ms = Column(Float, nullable=True)
+    message = Column(String(512), nullable=True)                # 오류 요약
+
+    def __repr__(self):
+        return f"<JobRunORM id={self.id} job={self.job_name} slot={self.slot} status={self.status}>"
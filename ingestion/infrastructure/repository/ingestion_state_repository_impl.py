@@ -0,0 +1,146 @@
+from datetime import date, datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session
+
+from config.database.db_executor import db_offload
+from config.database.session import get_current_session
+from ingestion.application.port.ingestion_state_repository_port import IngestionStateRepositoryPort
+from ingestion.domain.ingestion_state import IngestionState
+from ingestion.infrastructure.orm.ingestion_state import IngestionStateORM
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 상태 행 동시 생성(중복 키) / 교착 상태로 실패했을 때 다시 시도할 횟수
+INGESTION_STATE_UPDATE_RETRIES = 3
+# MySQL 중복 키 / 잠금 대기 시간 초과 / 교착 상태
+_RETRYABLE_DB_ERRORS = (1062, 1205, 1213)
+
+
+def _to_date(value: Optional[datetime]) -> Optional[date]:
+    return value.date() if value is not None else None
+
+
+def _to_datetime(value: Optional[date]) -> Optional[datetime]:
+    return datetime.combine(value, datetime.min.time()) if value is not None else None
+
+
+def _db_error_code(error: Exception) -> Optional[int]:
+    args = getattr(error.orig, "args", ())
+    return args[0] if args and isinstance(args[0], int) else None
+
+
+class IngestionStateRepositoryImpl(IngestionStateRepositoryPort):
+    __instance = None
+
+    @classmethod
+    def get_instance(cls) -> "IngestionStateRepositoryImpl":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, session: Optional[Session] = None):
+        # session을 주입하지 않으면 현재 Unit of Work(요청/스케줄 작업)의 세션을 사용
+        self._session = session
+
+    @property
+    def db(self) -> Session:
+        # 수집 계획은 방금 기록한 상태를 기준으로 해야 하므로 조회도 primary 사용
+        return self._session or get_current_session()
+
+    @db_offload
+    def get_state(self, dataset: str) -> Optional[IngestionState]:
+        row = self.db.get(IngestionStateORM, dataset)
+        return self._to_domain(row) if row is not None else None
+
+    @db_offload
+    def get_states(self, prefix: Optional[str] = None) -> List[IngestionState]:
+        query = self.db.query(IngestionStateORM)
+        if prefix:
+            query = query.filter(IngestionStateORM.dataset.like(f"{prefix}%"))
+        return [self._to_domain(row) for row in query.order_by(IngestionStateORM.dataset).all()]
+
+    @db_offload
+    def save_state(self, state: IngestionState) -> IngestionState:
+        row = self.db.get(IngestionStateORM, state.dataset)
+        self._write(row, state)
+        self.db.commit()
+        return state
+
+    @db_offload
+    def update_state(
+            self,
+            dataset: str,
+            update: Callable[[IngestionState], None],
+            default: Optional[IngestionState] = None,
+    ) -> IngestionState:
+        """
+        현재 상태 행을 잠그고 (SELECT ... FOR UPDATE) 읽은 뒤 update를 적용해 저장
+
+        백필 작업 / 스케줄 작업이 같은 데이터셋 상태를 동시에 기록해도
+        서로의 적재 구간을 덮어쓰지 않도록 읽기-수정-쓰기를 한 트랜잭션에서 수행한다.
+
+        상태 행이 아직 없으면 잠글 행이 없어 동시에 처음 기록하는 작업끼리 중복 키 / 교착 상태
+        (갭 락)로 실패할 수 있으므로, rollback 후 (이제 생긴 행을 잠그고) 다시 시도한다.
+
+        Args:
+            dataset: 데이터셋 이름
+            update: 상태 변경 함수 (다시 시도하면 새로 읽은 상태에 다시 적용)
+            default: 상태 행이 없을 때 시작 상태 (없으면 빈 상태)
+        """
+        for attempt in range(1, INGESTION_STATE_UPDATE_RETRIES + 1):
+            try:
+                return self._update_state(dataset, update, default)
+            except (IntegrityError, OperationalError) as e:
+                self.db.rollback()
+                if _db_error_code(e) not in _RETRYABLE_DB_ERRORS or attempt == INGESTION_STATE_UPDATE_RETRIES:
+                    raise
+                logger.warning(f"[ingestion] {dataset} 상태 기록 충돌 → 다시 시도 ({attempt}): {e.orig}")
+
+    def _update_state(
+            self,
+            dataset: str,
+            update: Callable[[IngestionState], None],
+            default: Optional[IngestionState],
+    ) -> IngestionState:
+        row = (self.db.query(IngestionStateORM).
+               filter(IngestionStateORM.dataset == dataset).
+               with_for_update().
+               one_or_none())
+        if row is not None:
+            state = self._to_domain(row)
+        else:
+            state = default or IngestionState(dataset)
+
+        update(state)
+        self._write(row, state)
+        self.db.commit()
+        return state
+
+    def _write(self, row: Optional[IngestionStateORM], state: IngestionState):
+        if row is None:
+            row = IngestionStateORM(dataset=state.dataset)
+            self.db.add(row)
+
+        row.first_complete_date = _to_datetime(state.first_complete_date)
+        row.last_complete_date = _to_datetime(state.last_complete_date)
+        row.status = state.status
+        row.row_count = state.row_count
+        row.duration_ms = state.duration_ms
+        row.message = (state.message or "")[:512] or None
+        row.last_run_at = state.last_run_at or datetime.utcnow()
+
+    @staticmethod
+    def _to_domain(row: IngestionStateORM) -> IngestionState:
+        return IngestionState(
+            dataset=row.dataset,
+            first_complete_date=_to_date(row.first_complete_date),
+            last_complete_date=_to_date(row.last_complete_date),
+            status=row.status,
+            row_count=row.row_count,
+            duration_ms=row.duration_ms,
+            message=row.message,
+            last_run_at=row.last_run_at,
+        )
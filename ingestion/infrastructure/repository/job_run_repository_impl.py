@@ -0,0 +1,72 @@
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from config.database.db_executor import db_offload
+from config.database.session import get_current_read_session, get_current_session
+from ingestion.application.port.job_run_repository_port import JobRunRepositoryPort
+from ingestion.domain.job_run import JobRun
+from ingestion.infrastructure.orm.job_run import JobRunORM
+
+
+class JobRunRepositoryImpl(JobRunRepositoryPort):
+    __instance = None
+
+    @classmethod
+    def get_instance(cls) -> "JobRunRepositoryImpl":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, session: Optional[Session] = None):
+        # session을 주입하지 않으면 현재 Unit of Work(요청/스케줄 작업)의 세션을 사용
+        self._session = session
+
+    @property
+    def db(self) -> Session:
+        return self._session or get_current_session()
+
+    @property
+    def read_db(self) -> Session:
+        # 조회 전용: 복제본으로 라우팅 (같은 Unit of Work에서 쓰기 이후에는 primary)
+        return self._session or get_current_read_session()
+
+    @db_offload
+    def save_run(self, run: JobRun) -> JobRun:
+        """실행 시작 시 추가, 종료 시 같은 행 갱신"""
+        row = self.db.get(JobRunORM, run.id) if run.id is not None else None
+        if row is None:
+            row = JobRunORM(job_name=run.job_name, slot=run.slot, owner=run.owner, fence=run.fence)
+            self.db.add(row)
+
+        row.status = run.status
+        row.started_at = run.started_at
+        row.finished_at = run.finished_at
+        row.duration_ms = run.duration_ms
+        row.message = (run.message or "")[:512] or None
+        self.db.commit()
+        run.id = row.id
+        return run
+
+    @db_offload
+    def get_runs(self, job_name: Optional[str] = None, limit: int = 50) -> List[JobRun]:
+        query = self.read_db.query(JobRunORM)
+        if job_name:
+            query = query.filter(JobRunORM.job_name == job_name)
+        rows = query.order_by(JobRunORM.started_at.desc()).limit(limit).all()
+        return [self._to_domain(row) for row in rows]
+
+    @staticmethod
+    def _to_domain(row: JobRunORM) -> JobRun:
+        return JobRun(
+            id=row.id,
+            job_name=row.job_name,
+            slot=row.slot,
+            owner=row.owner,
+            fence=row.fence,
+            status=row.status,
+            started_at=row.started_at,
+            finished_at=row.finished_at,
+            duration_ms=row.duration_ms,
+            message=row.message,
+        )
@@ -0,0 +1,327 @@
+"""
+과거 구간 백필 (상품 / ECOS)
+
+웹 워커를 점유하는 POST /product/*/save, /ecos/*/save 대신 별도 프로세스로 실행한다.
+
+- [start, end] 구간을 window_days 단위 구간으로 나눠 workers개까지 동시에 수집
+- 끝난 구간은 체크포인트 파일에 기록 → 같은 명령을 다시 실행하면 남은 구간만 수집
+- 구간별 / 전체 rows/sec 출력, 실패한 구간이 있으면 종료 코드 1
+- 같은 체크포인트로 동시에 두 번 실행되지 않도록 잠금 파일 사용
+- 데이터셋마다 적재 임대(ingest:<dataset>)를 잡고 실행하므로 같은 데이터셋의 스케줄 작업 / 상품 목록 점검 /
+  POST /*/save는 백필이 끝날 때까지 기다리거나 (INGESTION_LEASE_WAIT_SEC 초과 시) 건너뜀
+  → 운영 중에는 window / 기간을 나눠 짧게 실행
+- 종료일 기본값은 어제 (오늘은 아직 공시 전일 수 있고 스케줄 작업이 수집)
+
+사용 예시:
+    python -m jobs.backfill --dataset product_etf product_fund --start 20240101 --end 20241231
+    python -m jobs.backfill --dataset ecos_exchange_rate --start 20200101 --end 20241231 --window-days 90 --workers 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config.database.db_executor import shutdown_db_executor
+from config.database.session import session_scope
+from config.http_client import HttpClientRegistry
+from ecos.application.factory.fetch_ecos_data_usecase_factory import FetchEcosDataUsecaseFactory
+from ecos.application.usecase.ecos_usecase import DATASET_EXCHANGE_RATE, DATASET_INTEREST_RATE, exchange_dataset
+from ecos.infrastructure.orm.exchange_rate import ExchangeType
+from ingestion.application.factory.ingestion_state_usecase_factory import IngestionStateUsecaseFactory
+from product.application.factory.fetch_product_data_usecase_factory import FetchProductDataUsecaseFactory
+from product.application.usecase.product_usecase import DATASET_BOND, DATASET_ETF, DATASET_FUND
+from util.lock.ingestion_lease import IngestionBusyError, exclusive_ingestion
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 구간 길이 (일) / 동시에 수집할 구간 수
+BACKFILL_WINDOW_DAYS = int(os.getenv("BACKFILL_WINDOW_DAYS", "7"))
+BACKFILL_WORKERS = int(os.getenv("BACKFILL_WORKERS", "2"))
+BACKFILL_CHECKPOINT_DIR = os.getenv("BACKFILL_CHECKPOINT_DIR", "backfill_checkpoints")
+
+Window = Tuple[date, date]
+
+
+@dataclass
+class WindowResult:
+    rows: int
+    # 구간 안에 실패한 일자가 있으면 오류 요약
+    error: Optional[str] = None
+
+
+async def _backfill_product(dataset: str, start: str, end: str, full_refresh: bool) -> WindowResult:
+    with session_scope():
+        usecase = FetchProductDataUsecaseFactory.create()
+        report = await usecase.backfill(dataset, start, end, full_refresh)
+    error = None
+    if report.failed_days:
+        error = ", ".join(f"{d.day:%Y%m%d}: {d.error}" for d in report.failed_days)
+    return WindowResult(rows=report.saved, error=error)
+
+
+async def _backfill_exchange_rate(dataset: str, start: str, end: str, full_refresh: bool) -> WindowResult:
+    with session_scope():
+        usecase = FetchEcosDataUsecaseFactory.create()
+        return WindowResult(rows=len(await usecase.fetch_and_save_exchange_rate(start, end, full_refresh)))
+
+
+async def _backfill_interest_rate(dataset: str, start: str, end: str, full_refresh: bool) -> WindowResult:
+    with session_scope():
+        usecase = FetchEcosDataUsecaseFactory.create()
+        return WindowResult(rows=len(await usecase.fetch_and_save_interest_rate(start, end, full_refresh)))
+
+
+# 백필 대상: 데이터셋 → (구간 수집 함수, 적재 상태 데이터셋 목록)
+TARGETS: Dict[str, Tuple[Callable[[str, str, str, bool], Awaitable[WindowResult]], List[str]]] = {
+    DATASET_ETF: (_backfill_product, [DATASET_ETF]),
+    DATASET_FUND: (_backfill_product, [DATASET_FUND]),
+    DATASET_BOND: (_backfill_product, [DATASET_BOND]),
+    DATASET_EXCHANGE_RATE: (_backfill_exchange_rate, [exchange_dataset(t) for t in ExchangeType]),
+    DATASET_INTEREST_RATE: (_backfill_interest_rate, [DATASET_INTEREST_RATE]),
+}
+
+
+def split_windows(start: date, end: date, window_days: int) -> List[Window]:
+    """[start, end] 구간을 window_days일 단위 구간으로 분할 (마지막 구간은 짧을 수 있음)"""
+    windows = []
+    current = start
+    while current <= end:
+        window_end = min(current + timedelta(days=window_days - 1), end)
+        windows.append((current, window_end))
+        current = window_end + timedelta(days=1)
+    return windows
+
+
+def _window_key(window: Window) -> str:
+    return f"{window[0]:%Y%m%d}-{window[1]:%Y%m%d}"
+
+
+class BackfillCheckpoint:
+    """
+    완료 구간 기록 (JSON 파일)
+
+    구간이 끝날 때마다 임시 파일에 쓰고 교체하므로 중간에 종료되어도 파일이 깨지지 않는다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.completed: Dict[str, dict] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.completed = json.load(f).get("completed", {})
+
+    def is_done(self, window: Window) -> bool:
+        return _window_key(window) in self.completed
+
+    def mark_done(self, window: Window, rows: int, elapsed_sec: float):
+        self.completed[_window_key(window)] = {
+            "rows": rows,
+            "elapsed_sec": round(elapsed_sec, 3),
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"completed": self.completed}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def reset(self):
+        self.completed = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def acquire(self):
+        """같은 체크포인트로 실행 중인 백필이 있으면 실패"""
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            raise RuntimeError(
+                f"이미 실행 중인 백필이 있습니다 ({self.lock_path}). 이전 실행이 비정상 종료됐다면 잠금 파일을 삭제하세요."
+            )
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+
+    def release(self):
+        if os.path.exists(self.lock_path):
+            os.remove(self.lock_path)
+
+
+async def backfill_dataset(
+        dataset: str,
+        start: date,
+        end: date,
+        window_days: int = BACKFILL_WINDOW_DAYS,
+        workers: int = BACKFILL_WORKERS,
+        full_refresh: bool = False,
+        restart: bool = False,
+        checkpoint_dir: str = BACKFILL_CHECKPOINT_DIR,
+) -> bool:
+    """
+    데이터셋 하나를 구간별로 나눠 백필
+
+    Args:
+        dataset: TARGETS 키
+        start: 시작일
+        end: 종료일
+        window_days: 구간 길이 (일)
+        workers: 동시에 수집할 구간 수
+        full_refresh: 이미 적재된 일자도 다시 수집
+        restart: 체크포인트를 지우고 처음부터 수집
+        checkpoint_dir: 체크포인트 파일 디렉터리
+
+    Returns:
+        모든 구간이 완료되면 True
+    """
+    run_window, state_datasets = TARGETS[dataset]
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    checkpoint = BackfillCheckpoint(
+        os.path.join(checkpoint_dir, f"{dataset}_{start:%Y%m%d}_{end:%Y%m%d}_{window_days}d.json")
+    )
+    checkpoint.acquire()
+    try:
+        # 구간 작업(하위 태스크)은 같은 임대를 물려받아 동시에 수집
+        async with exclusive_ingestion(dataset):
+            return await _run_windows(dataset, run_window, state_datasets, checkpoint, start, end,
+                                      window_days, workers, full_refresh, restart)
+    except IngestionBusyError as e:
+        print(f"[{dataset}] {e}")
+        return False
+    finally:
+        checkpoint.release()
+
+
+async def _run_windows(
+        dataset: str,
+        run_window: Callable[[str, str, str, bool], Awaitable[WindowResult]],
+        state_datasets: List[str],
+        checkpoint: BackfillCheckpoint,
+        start: date,
+        end: date,
+        window_days: int,
+        workers: int,
+        full_refresh: bool,
+        restart: bool,
+) -> bool:
+    """남은 구간을 workers개까지 동시에 수집하고, 모두 끝나면 전체 구간을 적재 상태에 반영"""
+    if restart:
+        checkpoint.reset()
+
+    windows = split_windows(start, end, window_days)
+    pending = [w for w in windows if not checkpoint.is_done(w)]
+    print(f"[{dataset}] {len(windows)}개 구간 중 {len(windows) - len(pending)}개 완료, {len(pending)}개 수집 시작 "
+          f"(window={window_days}d, workers={workers})")
+
+    semaphore = asyncio.Semaphore(max(1, workers))
+    failed: List[str] = []
+    total_rows = 0
+    started = time.perf_counter()
+
+    async def run(window: Window):
+        nonlocal total_rows
+        async with semaphore:
+            window_started = time.perf_counter()
+            try:
+                result = await run_window(dataset, f"{window[0]:%Y%m%d}", f"{window[1]:%Y%m%d}", full_refresh)
+            except Exception as e:
+                result = WindowResult(rows=0, error=str(e))
+            elapsed = time.perf_counter() - window_started
+
+        total_rows += result.rows
+        rate = result.rows / elapsed if elapsed else 0.0
+        if result.error:
+            failed.append(_window_key(window))
+            print(f"[{dataset}] {_window_key(window)} 실패 rows={result.rows} ({elapsed:.1f}s): {result.error}")
+            return
+        checkpoint.mark_done(window, result.rows, elapsed)
+        print(f"[{dataset}] {_window_key(window)} 완료 rows={result.rows} ({elapsed:.1f}s, {rate:.1f} rows/s)")
+
+    await asyncio.gather(*(run(window) for window in pending))
+
+    elapsed = time.perf_counter() - started
+    rate = total_rows / elapsed if elapsed else 0.0
+    print(f"[{dataset}] 완료 {len(pending) - len(failed)}/{len(pending)}개 구간, rows={total_rows}, "
+          f"{elapsed:.1f}s, {rate:.1f} rows/s")
+    if failed:
+        print(f"[{dataset}] 실패 구간: {', '.join(failed)} → 같은 명령으로 다시 실행하면 이어서 수집합니다.")
+        return False
+
+    await _record_completed(state_datasets, start, end)
+    return True
+
+
+async def _record_completed(state_datasets: List[str], start: date, end: date):
+    """
+    전체 구간 완료를 적재 상태에 반영
+
+    구간은 순서 없이 끝나므로 실행 중에는 기존 적재 구간과 이어진 구간만 병합된다.
+    모두 끝나면 [start, end]를 한 번에 병합한다 (오늘은 아직 공시 전일 수 있어 제외).
+    """
+    covered_end = min(end, date.today() - timedelta(days=1))
+    if covered_end < start:
+        return
+    with session_scope():
+        ingestion = IngestionStateUsecaseFactory.create()
+        for state_dataset in state_datasets:
+            state = await ingestion.get_state(state_dataset)
+            await ingestion.record(
+                state_dataset,
+                (start, covered_end),
+                row_count=state.row_count if state is not None else 0,
+                duration_ms=state.duration_ms if state is not None else 0.0,
+                message=f"backfill {start:%Y%m%d}~{covered_end:%Y%m%d}",
+                state=state,
+            )
+
+
+async def main(args) -> int:
+    start = datetime.strptime(args.start, "%Y%m%d").date()
+    end = datetime.strptime(args.end, "%Y%m%d").date() if args.end else date.today() - timedelta(days=1)
+    if start > end:
+        print("start가 end보다 늦습니다.")
+        return 2
+
+    ok = True
+    try:
+        for dataset in args.dataset:
+            ok = await backfill_dataset(
+                dataset,
+                start,
+                end,
+                window_days=args.window_days,
+                workers=args.workers,
+                full_refresh=args.full_refresh,
+                restart=args.restart,
+                checkpoint_dir=args.checkpoint_dir,
+            ) and ok
+    finally:
+        await HttpClientRegistry.get_instance().close()
+        shutdown_db_executor()
+    return 0 if ok else 1
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="상품 / ECOS 과거 구간 백필 (중단 시 같은 명령으로 이어서 실행)")
+    parser.add_argument("--dataset", nargs="+", required=True, choices=sorted(TARGETS), help="백필할 데이터셋")
+    parser.add_argument("--start", required=True, help="시작일 (YYYYMMDD)")
+    parser.add_argument("--end", help="종료일 (YYYYMMDD, 기본 어제)")
+    parser.add_argument("--window-days", type=int, default=BACKFILL_WINDOW_DAYS, help="구간 길이 (일)")
+    parser.add_argument("--workers", type=int, default=BACKFILL_WORKERS, help="동시에 수집할 구간 수")
+    parser.add_argument("--full-refresh", action="store_true", help="이미 적재된 일자도 다시 수집")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 수집")
+    parser.add_argument("--checkpoint-dir", default=BACKFILL_CHECKPOINT_DIR, help="체크포인트 파일 디렉터리")
+    return parser
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(build_arg_parser().parse_args())))
@@ -0,0 +1,162 @@
+"""
+스케줄 작업 중복 실행 방지
+
+uvicorn 워커 / 레플리카 / 수집 워커마다 같은 스케줄러가 떠 있어도
+스케줄 실행 시각마다 한 프로세스만 실행하고, 실행 이력(소요 시간 포함)을 남긴다.
+
+- 실행 시각 선점: 트리거의 실행 예정 시각(slot)별 키를 처음 잡은 프로세스만 실행
+  (misfire grace 안에서 늦게 실행된 프로세스도 같은 예정 시각 → 같은 키)
+- 실행 임대: 이전 실행이 아직 진행 중이면 (다른 프로세스 포함) 새 실행을 건너뜀
+  임대를 잃으면 (프로세스 정지로 만료 후 다른 프로세스가 잡음) 진행 중인 실행을 중단하고,
+  DB 스레드에서 이미 진행 중이던 쓰기도 commit 직전 확인으로 거부 (RedisLease / commit_guard)
+- 실행 이력: scheduled_job_run 테이블에 소유자 / 펜싱 토큰 / 상태 / 소요 시간 기록
+
+사용 예시:
+    add_exclusive_job(sched, "product_etf", run_product_etf, CronTrigger(hour=3), misfire_grace_time=600)
+"""
+
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional
+
+from apscheduler.schedulers.base import BaseScheduler
+from apscheduler.triggers.base import BaseTrigger
+
+from config.database.session import session_scope, without_commit_guards
+from ingestion.application.factory.job_run_usecase_factory import JobRunUsecaseFactory
+from ingestion.domain.job_run import JobRun
+from ingestion.infrastructure.orm.job_run import JobRunStatus
+from util.lock.redis_lease import LEASE_FAIL_OPEN, LeaseLostError, RedisLease, claim_once, process_owner
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 트리거에서 실행 예정 시각을 찾지 못했을 때(직접 호출 등) 현재 시각을 반올림할 단위 (초)
+JOB_CRON_SLOT_SEC = int(os.getenv("JOB_CRON_SLOT_SEC", "60"))
+
+
+def _slot(slot_sec: int) -> datetime:
+    """현재 시각을 slot_sec 단위로 반올림한 실행 시각"""
+    now = datetime.now().timestamp()
+    return datetime.fromtimestamp(round(now / slot_sec) * slot_sec)
+
+
+def scheduled_run_time(trigger: BaseTrigger, lookback_sec: int, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    트리거 기준으로 now 이전의 마지막 실행 예정 시각 (로컬 시각, lookback_sec 안에 없으면 None)
+
+    APScheduler 3은 작업 함수에 예정 시각을 넘기지 않으므로 트리거로 다시 계산한다.
+    misfire grace 안에서 늦게 실행된 프로세스도 같은 예정 시각을 얻는다.
+    """
+    now = now or datetime.now(trigger.timezone)
+    fire = trigger.get_next_fire_time(None, now - timedelta(seconds=lookback_sec))
+    last = None
+    while fire is not None and fire <= now:
+        last = fire
+        fire = trigger.get_next_fire_time(fire, fire + timedelta(microseconds=1))
+    return datetime.fromtimestamp(last.timestamp()) if last is not None else None
+
+
+def add_exclusive_job(
+        sched: BaseScheduler,
+        job_name: str,
+        func: Callable[[], Awaitable[None]],
+        trigger: BaseTrigger,
+        **options,
+):
+    """
+    실행 예정 시각별로 전체 프로세스 중 한 곳에서만 실행하는 스케줄 작업 등록
+
+    Args:
+        sched: 스케줄러
+        job_name: 작업 이름 (임대 / 이력 / 실행 시각 키)
+        func: 실행할 작업
+        trigger: 크론 트리거 (주기 작업은 프로세스마다 시작 시각이 달라 예정 시각이 맞지 않음)
+        options: add_job 옵션 (misfire_grace_time 등)
+    """
+    lookback_sec = (options.get("misfire_grace_time") or 0) + JOB_CRON_SLOT_SEC
+
+    async def run():
+        slot = scheduled_run_time(trigger, lookback_sec)
+        await run_exclusive(job_name, func, slot=slot, claim_ttl_sec=lookback_sec * 2)
+
+    sched.add_job(run, trigger, id=job_name, name=job_name, **options)
+
+
+async def run_exclusive(
+        job_name: str,
+        func: Callable[[], Awaitable[None]],
+        slot: Optional[datetime] = None,
+        claim_ttl_sec: int = JOB_CRON_SLOT_SEC * 2,
+) -> bool:
+    """
+    실행 시각별로 전체 프로세스 중 한 곳에서만 func 실행
+
+    Args:
+        job_name: 작업 이름 (임대 / 이력 키)
+        func: 실행할 작업
+        slot: 실행 예정 시각 (없으면 현재 시각을 JOB_CRON_SLOT_SEC 단위로 반올림)
+        claim_ttl_sec: 실행 시각 선점 기록 유지 시간
+
+    Returns:
+        이 프로세스에서 실행했으면 True
+    """
+    if slot is None:
+        slot = _slot(JOB_CRON_SLOT_SEC)
+    try:
+        claimed = await asyncio.to_thread(claim_once, f"job:{job_name}:slot:{slot:%Y%m%d%H%M%S}", claim_ttl_sec)
+    except Exception as e:
+        logger.warning(f"[job] {job_name} 실행 시각 선점 확인 실패 (fail_open={LEASE_FAIL_OPEN}): {e}")
+        claimed = LEASE_FAIL_OPEN
+    if not claimed:
+        logger.info(f"[job] {job_name} {slot:%Y-%m-%d %H:%M:%S} 실행은 다른 프로세스가 맡았습니다.")
+        return False
+
+    lease = RedisLease(f"job:{job_name}")
+    async with lease.hold() as held:
+        if not held:
+            logger.warning(f"[job] {job_name} 이전 실행이 아직 진행 중이라 {slot:%Y-%m-%d %H:%M:%S} 실행을 건너뜁니다.")
+            return False
+
+        run = await _record_start(job_name, slot, lease.fence)
+        try:
+            await func()
+        except asyncio.CancelledError:
+            if not lease.lost:
+                await _record_finish(run, JobRunStatus.FAILED, "cancelled")
+                raise
+            # 임대를 잃어 스스로 중단한 경우: 취소를 여기서 끝내고 이력만 남김
+            asyncio.current_task().uncancel()
+            await _record_finish(run, JobRunStatus.LOST, f"lease lost (fence={lease.fence})")
+        except LeaseLostError as e:
+            # 임대를 잃은 뒤의 쓰기를 commit 직전에 거부한 경우 (작업 임대 / 적재 임대)
+            await _record_finish(run, JobRunStatus.LOST, str(e))
+            logger.error(f"[job] {job_name} 중단: {e}")
+        except Exception as e:
+            await _record_finish(run, JobRunStatus.FAILED, str(e))
+            logger.error(f"[job] {job_name} 실패: {e}")
+        else:
+            await _record_finish(run, JobRunStatus.SUCCESS)
+    return True
+
+
+async def _record_start(job_name: str, slot: datetime, fence: Optional[int]) -> Optional[JobRun]:
+    # 이력 기록 실패가 수집 작업을 막지 않도록 별도 세션에서 기록하고 오류는 로그만 남김
+    # 임대를 잃은 실행의 결과(LOST)도 남겨야 하므로 임대 commit 확인 없이 기록
+    try:
+        with session_scope(), without_commit_guards():
+            return await JobRunUsecaseFactory.create().start(job_name, slot, process_owner(), fence)
+    except Exception as e:
+        logger.warning(f"[job] {job_name} 실행 이력 기록 실패: {e}")
+        return None
+
+
+async def _record_finish(run: Optional[JobRun], status: JobRunStatus, message: Optional[str] = None):
+    if run is None:
+        return
+    try:
+        with session_scope(), without_commit_guards():
+            await JobRunUsecaseFactory.create().finish(run, status, message)
+    except Exception as e:
+        logger.warning(f"[job] {run.job_name} 실행 이력 기록 실패: {e}")
@@ -3,9 +3,16 @@ import os
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from dotenv import load_dotenv
 
+from asset_allocation.domain.service.future_assets_learning_service import FutureAssetsLearningService
+from asset_allocation.infrastructure.counter.use_count_buffer import ANALYZE_USE_COUNT_FLUSH_SEC
+from config.database.session import session_scope
+from config.scheduler_mode import SCHEDULER_MODE, ingestion_in_api
+from jobs.job_guard import add_exclusive_job
 from product.application.factory.fetch_product_data_usecase_factory import FetchProductDataUsecaseFactory
+from product.application.service.catalogue_warmup_service import CATALOGUE_WARMUP_INTERVAL_SEC, CatalogueWarmupService
 from util.log.log import Log
 
 logger = Log.get_logger()
@@ -25,28 +32,50 @@ cron_exchange_minute = os.getenv("CRON_EXCHANGE_MINUTE", "30")
 cron_interest_hour = os.getenv("CRON_INTEREST_HOUR", "05")
 cron_interest_minute = os.getenv("CRON_INTEREST_MINUTE", "00")
 
+# 프로세스가 멈춰 있다가 재개됐을 때 이 시간(초) 안의 놓친 실행은 한 번만 실행
+JOB_MISFIRE_GRACE_SEC = int(os.getenv("JOB_MISFIRE_GRACE_SEC", "600"))
+# 한 프로세스 안에서 같은 작업이 겹쳐 실행되지 않도록 / 밀린 실행은 한 번으로 합침
+_INGESTION_JOB_OPTIONS = dict(max_instances=1, coalesce=True, misfire_grace_time=JOB_MISFIRE_GRACE_SEC)
+
 scheduler: AsyncIOScheduler | None = None
 
 
+def add_ingestion_jobs(sched: AsyncIOScheduler):
+    """외부 데이터 수집 작업 (embedded 모드: API 프로세스, worker 모드: jobs/worker.py)"""
+    trigger = CronTrigger(hour=cron_exchange_hour, minute=cron_exchange_minute)
+    add_exclusive_job(sched, "ecos_exchange_rate", run_scheduler_ecos_exchange, trigger, **_INGESTION_JOB_OPTIONS)
+
+    trigger = CronTrigger(hour=cron_interest_hour, minute=cron_interest_minute)
+    add_exclusive_job(sched, "ecos_interest_rate", run_scheduler_ecos_interest, trigger, **_INGESTION_JOB_OPTIONS)
+
+    trigger = CronTrigger(hour=cron_etf_hour, minute=cron_etf_minute)
+    add_exclusive_job(sched, "product_etf", run_scheduler_product_etf, trigger, **_INGESTION_JOB_OPTIONS)
+
+    trigger = CronTrigger(hour=cron_fund_hour, minute=cron_fund_minute)
+    add_exclusive_job(sched, "product_fund", run_scheduler_product_fund, trigger, **_INGESTION_JOB_OPTIONS)
+
+    trigger = CronTrigger(hour=cron_bond_hour, minute=cron_bond_minute)
+    add_exclusive_job(sched, "product_bond", run_scheduler_product_bond, trigger, **_INGESTION_JOB_OPTIONS)
+
+
+def add_catalogue_warmup_job(sched: AsyncIOScheduler):
+    # 수집하는 프로세스에서는 비었거나 오래된 목록을 수집, API(worker 모드)에서는 다시 읽기만 함
+    trigger = IntervalTrigger(seconds=CATALOGUE_WARMUP_INTERVAL_SEC)
+    sched.add_job(run_scheduler_catalogue_warmup, trigger, max_instances=1, coalesce=True)
+
+
 def create_scheduler():
     global scheduler
     if scheduler is None:
         scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
-        trigger = CronTrigger(hour=cron_exchange_hour, minute=cron_exchange_minute)
-        scheduler.add_job(run_scheduler_ecos_exchange, trigger)
-
-        trigger = CronTrigger(hour=cron_interest_hour, minute=cron_interest_minute)
-        scheduler.add_job(run_scheduler_ecos_interest, trigger)
+        if ingestion_in_api():
+            add_ingestion_jobs(scheduler)
 
-        trigger = CronTrigger(hour=cron_etf_hour, minute=cron_etf_minute)
-        scheduler.add_job(run_scheduler_product_etf, trigger)
-
-        trigger = CronTrigger(hour=cron_fund_hour, minute=cron_fund_minute)
-        scheduler.add_job(run_scheduler_product_fund, trigger)
-
-        trigger = CronTrigger(hour=cron_bond_hour, minute=cron_bond_minute)
-        scheduler.add_job(run_scheduler_product_bond, trigger)
+        # 프로세스 메모리 버퍼(Redis 장애 시)를 비워야 하므로 항상 API 프로세스에서 실행
+        trigger = IntervalTrigger(seconds=ANALYZE_USE_COUNT_FLUSH_SEC)
+        scheduler.add_job(run_scheduler_analyze_use_count_flush, trigger, max_instances=1, coalesce=True)
 
+        add_catalogue_warmup_job(scheduler)
     return scheduler
 
 
@@ -54,40 +83,53 @@ def start_scheduler():
     sched = create_scheduler()
     if not sched.running:
         sched.start()
-        logger.info("Scheduler started")
+        logger.info(f"Scheduler started (mode={SCHEDULER_MODE})")
 
 
-def stop_scheduler():
+async def stop_scheduler():
     global scheduler
     if scheduler and scheduler.running:
         scheduler.shutdown(wait=False)
         logger.info("Scheduler stopped")
+    # 종료 전 남은 USE_COUNT 증가분 반영 (특히 Redis 장애로 메모리에 쌓인 분)
+    # DB / Redis 동기 호출이므로 이벤트 루프(다른 종료 처리)를 막지 않도록 스레드에서 실행
+    await asyncio.to_thread(FutureAssetsLearningService.flush_use_counts)
 
 
 ## 환율
 async def run_scheduler_ecos_exchange():
-    usecase = FetchEcosDataUsecaseFactory.create()
-    await usecase.fetch_and_save_exchange_rate("", "")
+    with session_scope():
+        usecase = FetchEcosDataUsecaseFactory.create()
+        await usecase.fetch_and_save_exchange_rate("", "")
 
 ## 환율
 async def run_scheduler_ecos_interest():
-    usecase = FetchEcosDataUsecaseFactory.create()
-    await usecase.fetch_and_save_interest_rate("", "")
+    with session_scope():
+        usecase = FetchEcosDataUsecaseFactory.create()
+        await usecase.fetch_and_save_interest_rate("", "")
 
 ## ETF
 async def run_scheduler_product_etf():
-    usecase = FetchProductDataUsecaseFactory.create()
-    await usecase.fetch_and_save_etf_data("","")
+    with session_scope():
+        usecase = FetchProductDataUsecaseFactory.create()
+        await usecase.fetch_and_save_etf_data("", "", collect=False)
 
 ## 펀드
 async def run_scheduler_product_fund():
-    usecase = FetchProductDataUsecaseFactory.create()
-    await usecase.fetch_and_save_fund_data("","")
+    with session_scope():
+        usecase = FetchProductDataUsecaseFactory.create()
+        await usecase.fetch_and_save_fund_data("", "", collect=False)
 
 ## 채권
 async def run_scheduler_product_bond():
-    usecase = FetchProductDataUsecaseFactory.create()
-    from datetime import datetime
+    with session_scope():
+        usecase = FetchProductDataUsecaseFactory.create()
+        await usecase.fetch_and_save_bond_data("", "", collect=False)
+
+## 분석 이력 사용 횟수 (write-behind flush)
+async def run_scheduler_analyze_use_count_flush():
+    await asyncio.to_thread(FutureAssetsLearningService.flush_use_counts)
 
-    today = datetime.now().strftime("%Y%m%d")
-    await usecase.get_bond_data_by_date(today)
+## 추천용 상품 목록 점검 (비어 있거나 오래되면 백그라운드 수집)
+async def run_scheduler_catalogue_warmup():
+    await CatalogueWarmupService.get_instance().warm_up_all()
@@ -0,0 +1,71 @@
+"""
+수집 전용 워커 프로세스 (SCHEDULER_MODE=worker)
+
+ETF / 펀드 / 채권 / ECOS 수집 스케줄 작업과 상품 목록 점검을 API와 다른 프로세스(이벤트 루프)에서 실행한다.
+API 프로세스는 수집하지 않고 워커가 적재한 결과만 조회하므로
+새벽 수집 시간대의 SQLAlchemy / JSON 처리가 사용자 요청 응답 시간에 영향을 주지 않는다.
+
+사용 예시:
+    SCHEDULER_MODE=worker python -m app.main     # API (조회 + USE_COUNT flush)
+    SCHEDULER_MODE=worker python -m jobs.worker  # 수집
+"""
+
+import asyncio
+import os
+import signal
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from config.database.db_executor import shutdown_db_executor
+from config.database.migration.migrator import run_migrations
+from config.http_client import HttpClientRegistry
+from jobs import scheduler as jobs_scheduler
+from product.application.service.catalogue_warmup_service import CatalogueWarmupService
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+DB_MIGRATE_ON_STARTUP = os.getenv("DB_MIGRATE_ON_STARTUP", "true").lower() == "true"
+
+
+def create_worker_scheduler() -> AsyncIOScheduler:
+    sched = AsyncIOScheduler(timezone="Asia/Seoul")
+    jobs_scheduler.add_ingestion_jobs(sched)
+    jobs_scheduler.add_catalogue_warmup_job(sched)
+    return sched
+
+
+async def main():
+    if DB_MIGRATE_ON_STARTUP:
+        # API와 동시에 기동해도 GET_LOCK으로 직렬화됨
+        await asyncio.to_thread(run_migrations)
+
+    # 이 프로세스가 비었거나 오래된 상품 목록을 수집
+    warmup = CatalogueWarmupService.get_instance()
+    warmup.ingest = True
+
+    sched = create_worker_scheduler()
+    sched.start()
+    warmup.start()
+    logger.info(f"Ingestion worker started (jobs={[job.func.__name__ for job in sched.get_jobs()]})")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await stop.wait()
+    finally:
+        # 진행 중인 수집 작업은 적재 상태에 기록된 지점부터 다음 실행에서 이어서 수집
+        sched.shutdown(wait=False)
+        await HttpClientRegistry.get_instance().close()
+        shutdown_db_executor()
+        logger.info("Ingestion worker stopped")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
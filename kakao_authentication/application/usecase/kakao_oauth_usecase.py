@@ -1,5 +1,6 @@
 from account.adapter.input.web.request.create_account_request import CreateAccountRequest
 from account.application.usecase.account_usecase import AccountUseCase
+from config.database.db_executor import run_in_db_executor
 from config.env import KAKAO_CLIENT_ID, KAKAO_REDIRECT_URI
 from kakao_authentication.domain.kakao_user import KakaoUser
 from kakao_authentication.domain.port.kakao_oauth_port import KakaoOAuthPort
@@ -35,7 +36,7 @@ class KakaoOAuthUseCase:
         if not sso_id:
             raise ValueError("User profile does not contain 'sub' or 'id' field")
 
-        existing_account = account_usecase.get_account_by_oauth_id("KAKAO", sso_id)
+        existing_account = await run_in_db_executor(account_usecase.get_account_by_oauth_id, "KAKAO", sso_id)
 
         print(f"[DEBUG] Existing account: {existing_account}")
         if existing_account:
@@ -1,6 +1,7 @@
 import os
+from typing import Optional
 
-import aiohttp
+from config.http_client import HttpClientRegistry
 from util.cache.ai_cache import logger
 
 
@@ -8,6 +9,9 @@ class NaverShoppingClient:
     NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
     NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
 
+    def __init__(self, http: Optional[HttpClientRegistry] = None):
+        self.http = http or HttpClientRegistry.get_instance()
+
     async def search_items(self, query: str, display: int = 10) -> list[dict]:
         url = f"https://openapi.naver.com/v1/search/shop.json?query={query}&display={display}"
         headers = {
@@ -15,11 +19,10 @@ class NaverShoppingClient:
             "X-Naver-Client-Secret": self.NAVER_CLIENT_SECRET,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    raise Exception(f"Naver API Error {resp.status}")
-                data = await resp.json()
+        async with self.http.session().get(url, headers=headers) as resp:
+            if resp.status != 200:
+                raise Exception(f"Naver API Error {resp.status}")
+            data = await resp.json()
 
         items = data.get("items", [])
 
@@ -1,8 +1,9 @@
 import re
 import html
+import time
 import asyncio
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from email.utils import parsedate_to_datetime
 
 import aiohttp
@@ -12,6 +13,16 @@ from news_info.domain.value_object.news_item import NewsItem
 from news_info.domain.value_object.news_source import NewsSource
 from news_info.domain.value_object.timestamp import Timestamp
 from news_info.infrastructure.api.naver_news_client import NaverNewsClient
+from news_info.infrastructure.parser.naver_article_parser import extract_article_text
+from config.http_client import HttpClientRegistry
+from config.parse_executor import run_in_parse_executor
+from util.cache.article_content_cache import ArticleContent, ArticleContentCache, canonical_article_url
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 기사 본문 HTML 요청 타임아웃 (초)
+_CONTENT_TIMEOUT = aiohttp.ClientTimeout(total=10)
 
 
 _TAG_RE = re.compile(r"<[^>]+>")
@@ -53,49 +64,120 @@ def _is_naver_news_url(url: str) -> bool:
         return False
     return ("n.news.naver.com" in url) or ("news.naver.com" in url)
 
-# 네이버 뉴스 본문 영역 파싱 (레이아웃 변경 대비해 여러 셀렉터 시도)
-def _extract_naver_news_content(page_html: str) -> Optional[str]:
-    try:
-        from bs4 import BeautifulSoup
-    except Exception:
-        # bs4 없으면 본문 파싱 정확도가 떨어져서 None 처리
-        return None
-
-    soup = BeautifulSoup(page_html, "html.parser")
-
-    # 우선순위로 본문 후보 찾기
-    node = soup.select_one("#dic_area") \
-        or soup.select_one("#newsct_article") \
-        or soup.select_one("#articleBodyContents")
-
-    if not node:
-        return None
-
-    text = node.get_text(" ", strip=True)
-    text = text.replace("\u200b", "")
-    text = _WS_RE.sub(" ", text).strip()
-
-    return text or None
-
-async def _fetch_html(session: aiohttp.ClientSession, url: str) -> Optional[str]:
+async def _fetch_article(
+        session: aiohttp.ClientSession,
+        url: str,
+        cached: Optional[ArticleContent] = None,
+) -> Optional[Tuple[int, ArticleContent]]:
+    """
+    기사 HTML을 받아 본문만 추출 (cached가 있으면 ETag / Last-Modified로 조건부 요청)
+
+    Returns:
+        (응답 상태, 새 캐시 항목) — 304면 cached의 본문 유지, 요청 실패 시 None
+    """
     try:
         headers = {
             "User-Agent": "Mozilla/5.0",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         }
-        async with session.get(url, headers=headers) as resp:
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+        async with session.get(url, headers=headers, timeout=_CONTENT_TIMEOUT) as resp:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if resp.status == 304 and cached is not None:
+                return resp.status, ArticleContent(
+                    content=cached.content,
+                    etag=etag or cached.etag,
+                    last_modified=last_modified or cached.last_modified,
+                    checked_at=time.time(),
+                )
             if resp.status != 200:
                 return None
-            return await resp.text()
+            page_html = await resp.text()
+        # 파싱 프로세스 풀 장애도 요청 실패로 처리 (다른 기사 조회 / 캐시 본문 사용은 계속)
+        content = await run_in_parse_executor(extract_article_text, page_html)
     except Exception:
         return None
 
+    return 200, ArticleContent(
+        content=content,
+        etag=etag,
+        last_modified=last_modified,
+        checked_at=time.time(),
+    )
+
 
 class NaverNewsInfoAdapter:
     BRIEFING_QUERIES = ["환율", "금리", "코스피", "주식", "ETF"]
 
-    def __init__(self):
-        self.client = NaverNewsClient()
+    def __init__(self, http: Optional[HttpClientRegistry] = None, cache: Optional[ArticleContentCache] = None):
+        self.http = http or HttpClientRegistry.get_instance()
+        self.client = NaverNewsClient(self.http)
+        self.cache = cache or ArticleContentCache.get_instance()
+
+    async def _fetch_contents(self, items: List[dict]) -> Dict[int, Optional[str]]:
+        """
+        기사 목록의 본문 조회 (네이버 뉴스 URL만)
+
+        - 캐시가 신선하면 요청하지 않고, 오래됐으면 조건부 요청(304면 캐시 본문 유지)
+        - 요청이 실패하면 오래된 캐시 본문이라도 사용
+
+        Returns:
+            items 인덱스 → 본문 (없으면 None)
+        """
+        content_map: Dict[int, Optional[str]] = {}
+        # 정규화 URL → (요청 URL, 해당 인덱스들): 같은 기사는 한 번만 요청
+        targets: Dict[str, tuple] = {}
+        for idx, it in enumerate(items):
+            # 네이버 뉴스 링크 우선, 아니면 originallink가 네이버면 그걸 사용
+            url = it.get("link", "") or ""
+            if not _is_naver_news_url(url):
+                origin = it.get("originallink", "") or ""
+                url = origin if _is_naver_news_url(origin) else ""
+
+            content_map[idx] = None
+            if url:
+                targets.setdefault(canonical_article_url(url), (url, []))[1].append(idx)
+
+        if not targets:
+            return content_map
+
+        cached = await asyncio.to_thread(self.cache.get_many, [url for url, _ in targets.values()])
+        now = time.time()
+        stats = {"cached": 0, "revalidated": 0, "downloaded": 0, "failed": 0}
+
+        sem = asyncio.Semaphore(5)
+        session = self.http.session()
+
+        async def _fetch_one(key: str, url: str) -> Optional[str]:
+            entry = cached.get(key)
+            if entry is not None and entry.is_fresh(now):
+                stats["cached"] += 1
+                return entry.content
+
+            async with sem:
+                fetched = await _fetch_article(session, url, entry)
+            if fetched is None:
+                stats["failed"] += 1
+                return entry.content if entry is not None else None
+
+            status, fresh = fetched
+            stats["revalidated" if status == 304 else "downloaded"] += 1
+            await asyncio.to_thread(self.cache.put, url, fresh)
+            return fresh.content
+
+        keys = list(targets)
+        contents = await asyncio.gather(*(_fetch_one(key, targets[key][0]) for key in keys))
+        for key, content in zip(keys, contents):
+            for idx in targets[key][1]:
+                content_map[idx] = content
+
+        logger.info(
+            f"[news] 기사 본문 {len(keys)}건: 캐시 {stats['cached']} / 재검증(304) {stats['revalidated']} / "
+            f"다운로드 {stats['downloaded']} / 실패 {stats['failed']}"
+        )
+        return content_map
 
     async def fetch_latest_finance_news(
             self,
@@ -149,31 +231,7 @@ class NaverNewsInfoAdapter:
         content_map: dict[int, Optional[str]] = {}
 
         if include_content and candidates:
-            sem = asyncio.Semaphore(5)
-
-            async def _fetch_one(idx: int, url: str, session: aiohttp.ClientSession):
-                async with sem:
-                    page_html = await _fetch_html(session, url)
-                    if not page_html:
-                        content_map[idx] = None
-                        return
-                    content_map[idx] = _extract_naver_news_content(page_html)
-
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                tasks2 = []
-                for idx, it in enumerate(candidates):
-                    url = it.get("link", "") or ""
-                    if not _is_naver_news_url(url):
-                        origin = it.get("originallink", "") or ""
-                        url = origin if _is_naver_news_url(origin) else ""
-
-                    if url:
-                        tasks2.append(_fetch_one(idx, url, session))
-                    else:
-                        content_map[idx] = None
-
-                if tasks2:
-                    await asyncio.gather(*tasks2, return_exceptions=False)
+            content_map = await self._fetch_contents(candidates)
 
         # 6) 도메인 변환 + limit 개수 채우기
         items: List[NewsItem] = []
@@ -231,32 +289,7 @@ class NaverNewsInfoAdapter:
         # 2) 본문 필요하면, 네이버 뉴스 URL만 추가로 HTML 가져와서 파싱
         content_map: dict[int, Optional[str]] = {}
         if include_content and filtered:
-            sem = asyncio.Semaphore(5)
-
-            async def _fetch_one(idx: int, url: str, session: aiohttp.ClientSession):
-                async with sem:
-                    page_html = await _fetch_html(session, url)
-                    if not page_html:
-                        content_map[idx] = None
-                        return
-                    content_map[idx] = _extract_naver_news_content(page_html)
-
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                tasks = []
-                for idx, it in enumerate(filtered):
-                    # 네이버 뉴스 링크 우선, 아니면 originallink가 네이버면 그걸 사용
-                    url = it.get("link", "") or ""
-                    if not _is_naver_news_url(url):
-                        origin = it.get("originallink", "") or ""
-                        url = origin if _is_naver_news_url(origin) else ""
-
-                    if url:
-                        tasks.append(_fetch_one(idx, url, session))
-                    else:
-                        content_map[idx] = None
-
-                if tasks:
-                    await asyncio.gather(*tasks)
+            content_map = await self._fetch_contents(filtered)
 
         # 3) 도메인 변환
         items: List[NewsItem] = []
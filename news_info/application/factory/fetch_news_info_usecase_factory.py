@@ -1,6 +1,7 @@
 from news_info.application.usecase.fetch_news_info_usecase import FetchNewsInfoUsecase
 from news_info.adapter.output.naver.news_info_api_adapter import NaverNewsInfoAdapter
 from news_info.infrastructure.repository.news_info_repository_impl import NewsInfoRepositoryImpl
+from ingestion.application.factory.ingestion_state_usecase_factory import IngestionStateUsecaseFactory
 
 
 class FetchNewsInfoUsecaseFactory:
@@ -8,4 +9,4 @@ class FetchNewsInfoUsecaseFactory:
     def create() -> FetchNewsInfoUsecase:
         api_adapter = NaverNewsInfoAdapter()
         repository = NewsInfoRepositoryImpl.get_instance()
-        return FetchNewsInfoUsecase(api_adapter, repository)
\ No newline at end of file
+        return FetchNewsInfoUsecase(api_adapter, repository, IngestionStateUsecaseFactory.create())
\ No newline at end of file
@@ -1,15 +1,24 @@
+import time
+from datetime import date
 from typing import List
 
+from ingestion.application.usecase.ingestion_state_usecase import IngestionStateUseCase
+from ingestion.infrastructure.orm.ingestion_state import IngestionStatus
 from news_info.application.port.news_info_repository_port import NewsInfoRepositoryPort
 from news_info.domain.value_object.news_info import NewsInfo
 from news_info.domain.value_object.news_item import NewsItem
 from news_info.adapter.output.naver.news_info_api_adapter import NaverNewsInfoAdapter
 
 
+# 적재 상태 데이터셋 이름
+DATASET_NEWS = "news_naver"
+
+
 class FetchNewsInfoUsecase:
-    def __init__(self, adapter: NaverNewsInfoAdapter, repository: NewsInfoRepositoryPort):
+    def __init__(self, adapter: NaverNewsInfoAdapter, repository: NewsInfoRepositoryPort, ingestion: IngestionStateUseCase):
         self.adapter = adapter
         self.repository = repository
+        self.ingestion = ingestion
 
     async def execute(
         self,
@@ -40,16 +49,29 @@ class FetchNewsInfoUsecase:
         include_content: bool = True,
         require_content: bool = True,
     ) -> List[NewsItem]:
-        news_info = await self.adapter.fetch_latest_finance_news(
-            limit=limit,
-            display_per_query=display_per_query,
-            sort=sort,
-            finance_only=finance_only,
-            include_content=include_content,
-            require_content=require_content,
-        )
+        started = time.perf_counter()
+        try:
+            news_info = await self.adapter.fetch_latest_finance_news(
+                limit=limit,
+                display_per_query=display_per_query,
+                sort=sort,
+                finance_only=finance_only,
+                include_content=include_content,
+                require_content=require_content,
+            )
 
-        if news_info.items:
-            await self.repository.save_news_batch(news_info.items)
+            if news_info.items:
+                await self.repository.save_news_batch(news_info.items)
+        except Exception as e:
+            await self.ingestion.record(
+                DATASET_NEWS, None, 0, (time.perf_counter() - started) * 1000, IngestionStatus.FAILED, str(e)
+            )
+            raise
+
+        # 최신 목록 수집이므로 수집한 날짜를 적재 완료 일자로 기록
+        today = date.today()
+        await self.ingestion.record(
+            DATASET_NEWS, (today, today), len(news_info.items), (time.perf_counter() - started) * 1000
+        )
 
         return news_info.items
\ No newline at end of file
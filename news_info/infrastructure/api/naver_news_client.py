@@ -1,14 +1,21 @@
 import os
 import aiohttp
-from typing import Any
+from typing import Any, Optional
 
+from config.http_client import HttpClientRegistry
 from util.cache.ai_cache import logger
 
+# 검색 API 요청 타임아웃 (초)
+_SEARCH_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 
 class NaverNewsClient:
     NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
     NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
 
+    def __init__(self, http: Optional[HttpClientRegistry] = None):
+        self.http = http or HttpClientRegistry.get_instance()
+
     async def search_news(
         self,
         query: str,
@@ -28,13 +35,12 @@ class NaverNewsClient:
             "sort": sort,
         }
 
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, headers=headers, params=params) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    raise Exception(f"Naver News API Error {resp.status}: {body}")
-                data = await resp.json()
+        session = self.http.session()
+        async with session.get(url, headers=headers, params=params, timeout=_SEARCH_TIMEOUT) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                raise Exception(f"Naver News API Error {resp.status}: {body}")
+            data = await resp.json()
 
         items = data.get("items", []) or []
 
@@ -0,0 +1,47 @@
+"""
+네이버 뉴스 기사 본문 파서
+
+파싱 프로세스 풀(config.parse_executor)에서 실행되므로 bs4 외에는 가져오지 않는다.
+"""
+
+import re
+from typing import Optional
+
+_WS_RE = re.compile(r"\s+")
+
+# 본문 영역 후보 (레이아웃 변경 대비, 앞쪽이 우선)
+_CONTENT_IDS = ("dic_area", "newsct_article", "articleBodyContents")
+
+
+def extract_article_text(page_html: str) -> Optional[str]:
+    """
+    네이버 뉴스 HTML에서 본문 텍스트 추출
+
+    본문 후보 영역만 트리로 만들고(SoupStrainer) 나머지(헤더 / 댓글 / 추천 기사 등)는 건너뜀
+
+    Returns:
+        본문 텍스트 (본문 영역이 없거나 bs4가 없으면 None)
+    """
+    try:
+        from bs4 import BeautifulSoup, SoupStrainer
+    except Exception:
+        # bs4 없으면 본문 파싱 정확도가 떨어져서 None 처리
+        return None
+
+    soup = BeautifulSoup(page_html, "html.parser", parse_only=SoupStrainer(id=list(_CONTENT_IDS)))
+
+    # 우선순위로 본문 후보 찾기 (#newsct_article 안에 #dic_area가 있는 레이아웃 포함)
+    node = None
+    for content_id in _CONTENT_IDS:
+        node = soup.find(id=content_id)
+        if node:
+            break
+
+    if not node:
+        return None
+
+    text = node.get_text(" ", strip=True)
+    text = text.replace("\u200b", "")
+    text = _WS_RE.sub(" ", text).strip()
+
+    return text or None
@@ -1,9 +1,12 @@
 import hashlib
-from typing import List
+from typing import AsyncIterator, List, Optional
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
-from config.database.session import get_db_session
+from config.database.bulk_upsert import insert_ignore_duplicates
+from config.database.db_executor import db_offload
+from config.database.keyset import stream_keyset
+from config.database.session import get_current_read_session, get_current_session
 from news_info.application.port.news_info_repository_port import NewsInfoRepositoryPort
 from news_info.domain.value_object.news_item import NewsItem
 from news_info.infrastructure.orm.newsInfo_orm import NewsInfoORM, NewsProvider
@@ -16,101 +19,92 @@ def _md5_hex(value: str) -> str:
 class NewsInfoRepositoryImpl(NewsInfoRepositoryPort):
     __instance = None
 
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-        return cls.__instance
-
     @classmethod
     def get_instance(cls):
         if cls.__instance is None:
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, "db"):
-            self.db: Session = get_db_session()
-
-    async def save_news_batch(self, news_list: List[NewsItem]) -> List[NewsItem]:
-
-        try:
-            if not news_list:
-                return []
-
-            new_list: List[NewsItem] = []
-
-            for item in news_list:
-                canonical_url = (item.originallink or item.link or "").strip()
-                if not canonical_url:
-                    continue
-
-                canonical_url_hash = _md5_hex(canonical_url)
-
-                existing = self.db.query(NewsInfoORM).filter(
-                    and_(
-                        NewsInfoORM.provider == NewsProvider.NAVER_NEWS,
-                        NewsInfoORM.canonical_url_hash == canonical_url_hash,
-                    )
-                ).first()
-
-                if not existing:
-                    new_list.append(item)
-
-            if not new_list:
-                return news_list
-
-            orm_list = []
-            for item in new_list:
-                canonical_url = (item.originallink or item.link or "").strip()
-                canonical_url_hash = _md5_hex(canonical_url)
-
-                orm_list.append(
-                    NewsInfoORM(
-                        provider=NewsProvider.NAVER_NEWS,
-                        title=item.title,
-                        description=item.description,
-                        content=getattr(item, "content", None),
-                        link=item.link,
-                        originallink=item.originallink,
-                        canonical_url=canonical_url,
-                        canonical_url_hash=canonical_url_hash,
-                        published_at=item.published_at.timestamp if item.published_at else None,
-                        raw_json={
-                            "title": item.title,
-                            "description": item.description,
-                            "content": getattr(item, "content", None),
-                            "link": item.link,
-                            "originallink": item.originallink,
-                            "published_at": item.published_at.timestamp.isoformat() if item.published_at else None,
-                        },
-                    )
-                )
-
-            self.db.add_all(orm_list)
-            self.db.commit()
-
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
-
-            return news_list
-        finally:
-            self.db.close()
-
-    async def get_three_month_news_for_card_news(self) -> List[NewsInfoORM]:
-
-        three_months_ago = datetime.utcnow() - timedelta(days=90)
-
-        try:
-            rows = (
-                self.db.query(NewsInfoORM)
-                .filter(NewsInfoORM.published_at >= three_months_ago)
-                .order_by(NewsInfoORM.published_at.desc())
-                .all()
-            )
-
-            return rows
-
-        finally:
-            self.db.close()
-
-
+    def __init__(self, session: Optional[Session] = None):
+        # session을 주입하지 않으면 현재 Unit of Work(요청/스케줄 작업)의 세션을 사용
+        self._session = session
+
+    @property
+    def db(self) -> Session:
+        return self._session or get_current_session()
+
+    @property
+    def read_db(self) -> Session:
+        # 조회 전용: 복제본으로 라우팅 (같은 Unit of Work에서 쓰기 이후에는 primary)
+        return self._session or get_current_read_session()
+
+    @db_offload
+    def save_news_batch(self, news_list: List[NewsItem]) -> List[NewsItem]:
+
+        if not news_list:
+            return []
+
+        rows = []
+        for item in news_list:
+            canonical_url = (item.originallink or item.link or "").strip()
+            if not canonical_url:
+                continue
+
+            rows.append({
+                "provider": NewsProvider.NAVER_NEWS,
+                "title": item.title,
+                "description": item.description,
+                "content": getattr(item, "content", None),
+                "link": item.link,
+                "originallink": item.originallink,
+                "canonical_url": canonical_url,
+                "canonical_url_hash": _md5_hex(canonical_url),
+                "published_at": item.published_at.timestamp if item.published_at else None,
+                "fetched_at": datetime.utcnow(),
+                "raw_json": {
+                    "title": item.title,
+                    "description": item.description,
+                    "content": getattr(item, "content", None),
+                    "link": item.link,
+                    "originallink": item.originallink,
+                    "published_at": item.published_at.timestamp.isoformat() if item.published_at else None,
+                },
+            })
+
+        # (provider, canonical_url_hash) 유니크 제약으로 중복 기사는 DB가 건너뜀 (행마다 SELECT 하지 않음)
+        insert_ignore_duplicates(self.db, NewsInfoORM, rows)
+        self.db.commit()
+
+        return news_list
+
+    def stream_recent_news_for_card_news(
+            self, days: int = 90, limit: Optional[int] = None
+    ) -> AsyncIterator[Row]:
+        """
+        최근 days일 뉴스를 최신순으로 한 행씩 반환 (카드뉴스용 컬럼만 조회)
+
+        content / raw_json 등 큰 컬럼은 읽지 않으며, published_at 키셋 페이지 단위로 조회한다.
+
+        Args:
+            days: 조회 기간 (일)
+            limit: 최대 건수 (None이면 기간 내 전체)
+
+        Returns:
+            Row(title, description, link, provider, published_at) 비동기 이터레이터
+        """
+        since = datetime.utcnow() - timedelta(days=days)
+
+        return stream_keyset(
+            lambda: self.read_db,
+            columns=(
+                NewsInfoORM.title,
+                NewsInfoORM.description,
+                NewsInfoORM.link,
+                NewsInfoORM.provider,
+                NewsInfoORM.published_at,
+            ),
+            sort_column=NewsInfoORM.published_at,
+            id_column=NewsInfoORM.id,
+            where=(NewsInfoORM.published_at >= since,),
+            limit=limit,
+        )
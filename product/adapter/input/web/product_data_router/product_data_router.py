@@ -1,11 +1,20 @@
 from fastapi import APIRouter, Body
 
 from product.application.factory.fetch_product_data_usecase_factory import FetchProductDataUsecaseFactory
+from product.application.service.catalogue_warmup_service import CatalogueWarmupService
 from util.log.log import Log
 
 logger = Log.get_logger()
 
 product_data_router = APIRouter(tags=["product"])
+
+@product_data_router.get("/catalogue/readiness")
+async def get_catalogue_readiness():
+    """
+    ETF / 펀드 / 채권 목록 준비 상태 (추천 가능 여부)
+    """
+    return CatalogueWarmupService.get_instance().readiness()
+
 @product_data_router.get("/etf")
 async def get_etf_info():
     usecase = FetchProductDataUsecaseFactory.create()
@@ -45,11 +54,12 @@ async def get_etf_info(date:str):
 @product_data_router.post("/etf/save")
 async def fetch_and_save_etf(
         start:str | None = Body(None),
-        end:str | None = Body(None)
+        end:str | None = Body(None),
+        full_refresh: bool = Body(False)
 ):
 
     usecase = FetchProductDataUsecaseFactory.create()
-    saved_entities = await usecase.fetch_and_save_etf_data(start, end)
+    saved_entities = await usecase.fetch_and_save_etf_data(start, end, full_refresh)
 
     return {
         "massage": "ETF 정보가 성공적으로 저장되었습니다.",
@@ -85,10 +95,11 @@ async def get_fund_info(date:str):
 @product_data_router.post("/fund/save")
 async def fetch_and_save_fund(
         start:str | None = Body(None),
-        end:str | None = Body(None)
+        end:str | None = Body(None),
+        full_refresh: bool = Body(False)
 ):
     usecase = FetchProductDataUsecaseFactory.create()
-    saved_entities = await usecase.fetch_and_save_fund_data(start, end)
+    saved_entities = await usecase.fetch_and_save_fund_data(start, end, full_refresh)
 
     return {
         "message": "FUND 정보가 성공적으로 저장되었습니다.",
@@ -117,10 +128,11 @@ async def get_bond_info(date:str):
 @product_data_router.post("/bond/save")
 async def fetch_and_save_bond(
         start: str | None = Body(None),
-        end: str | None = Body(None)
+        end: str | None = Body(None),
+        full_refresh: bool = Body(False)
 ):
     usecase = FetchProductDataUsecaseFactory.create()
-    saved_entities = await usecase.fetch_and_save_bond_data(start, end)
+    saved_entities = await usecase.fetch_and_save_bond_data(start, end, full_refresh)
 
     return {
         "message": "BOND 정보가 성공적으로 저장되었습니다.",
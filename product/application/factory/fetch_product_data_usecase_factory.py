@@ -1,6 +1,7 @@
 from product.adapter.output.product.product_data_api_adapter import ProductDataApiAdapter
 from product.application.usecase.product_usecase import FetchProductUseCase
 from product.infrastructure.repository.product_repository_impl import ProductRepositoryImpl
+from ingestion.application.factory.ingestion_state_usecase_factory import IngestionStateUsecaseFactory
 
 
 class FetchProductDataUsecaseFactory:
@@ -8,4 +9,4 @@ class FetchProductDataUsecaseFactory:
     def create() -> FetchProductUseCase:
         api_adapter = ProductDataApiAdapter()
         repository= ProductRepositoryImpl.get_instance()
-        return FetchProductUseCase(api_adapter, repository)
+        return FetchProductUseCase(api_adapter, repository, IngestionStateUsecaseFactory.create())
@@ -11,12 +11,28 @@ from product.infrastructure.orm.product_fund import ProductFundORM
 
 class ProductRepositoryPort(ABC):
 
+    @abstractmethod
+    def day_transaction(self) -> "ProductRepositoryPort":
+        pass
+
+    @abstractmethod
+    async def commit_day(self, catalogue: str):
+        pass
+
+    @abstractmethod
+    async def rollback_day(self):
+        pass
+
     @abstractmethod
     async def get_etf_data_by_date(self, date:str) -> List[ProductETFORM]:
         pass
 
     @abstractmethod
-    async def save_etf_batch(self, etf_list: List[ProductEtf]) -> List[ProductEtf]:
+    async def delete_etf_data_by_date(self, date) -> int:
+        pass
+
+    @abstractmethod
+    async def save_etf_batch(self, etf_list: List[ProductEtf], skip_loaded_days: bool = True, commit: bool = True) -> List[ProductEtf]:
         pass
 
     @abstractmethod
@@ -24,7 +40,11 @@ class ProductRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def save_fund_batch(self, fund_list: List[ProductFund]) -> List[ProductFund]:
+    async def delete_fund_data_by_date(self, date) -> int:
+        pass
+
+    @abstractmethod
+    async def save_fund_batch(self, fund_list: List[ProductFund], skip_loaded_days: bool = True, commit: bool = True) -> List[ProductFund]:
         pass
 
     @abstractmethod
@@ -32,5 +52,9 @@ class ProductRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def save_bond_batch(self, etf_list: List[ProductBond]) -> List[ProductBond]:
+    async def delete_bond_data_by_date(self, date) -> int:
+        pass
+
+    @abstractmethod
+    async def save_bond_batch(self, etf_list: List[ProductBond], skip_loaded_days: bool = True, commit: bool = True) -> List[ProductBond]:
         pass
\ No newline at end of file
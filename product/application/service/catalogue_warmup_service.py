@@ -0,0 +1,201 @@
+import asyncio
+import contextvars
+import os
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Callable, Dict, List, Optional
+
+from config.database.db_executor import run_in_db_executor
+from config.database.session import session_scope
+from config.scheduler_mode import ingestion_in_api
+from product.application.factory.fetch_product_data_usecase_factory import FetchProductDataUsecaseFactory
+from product.application.usecase.product_usecase import DATASET_BOND, DATASET_ETF, DATASET_FUND
+from util.lock.ingestion_lease import ingestion_lease
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 백그라운드 점검 주기 (초)
+CATALOGUE_WARMUP_INTERVAL_SEC = int(os.getenv("CATALOGUE_WARMUP_INTERVAL_SEC", "1800"))
+# 마지막 적재 일자가 이보다 오래되면 빠진 영업일을 따라잡음 (일)
+CATALOGUE_STALE_DAYS = int(os.getenv("CATALOGUE_STALE_DAYS", "3"))
+
+
+class CatalogueStatus(str, Enum):
+    UNKNOWN = "UNKNOWN"    # 아직 점검 전
+    WARMING = "WARMING"    # 데이터가 없어 수집 중
+    READY = "READY"        # 조회 가능
+    STALE = "STALE"        # 조회 가능하지만 마지막 적재가 오래됨 (백그라운드 갱신)
+    EMPTY = "EMPTY"        # 수집했지만 데이터 없음
+    FAILED = "FAILED"      # 점검/수집 실패
+
+
+class CatalogueWarmupService:
+    """
+    상품 목록(ETF/펀드/채권) 준비 상태 관리
+
+    - 기동 시와 주기적으로 백그라운드에서 데이터 유무 / 최신성을 점검하고,
+      비어 있으면 최근 영업일 데이터를, 오래됐으면 빠진 영업일을 수집
+    - 추천 요청은 수집을 기다리지 않고 trigger()만 한 뒤 바로 응답
+    - 마지막으로 조회에 성공한 목록을 보관해 DB 조회가 비거나 실패해도 이전 목록으로 응답
+    - ingest=False (SCHEDULER_MODE=worker의 API 프로세스)면 수집하지 않고 DB 조회만 하며,
+      수집은 워커 프로세스의 같은 서비스(ingest=True)가 맡는다
+    - 수집은 데이터셋 적재 임대(ingest:<dataset>, 스케줄 작업 / 백필과 공유)를 바로 잡은 프로세스만 하고,
+      이미 다른 곳에서 적재 중이면 기다리지 않고 다시 읽기만 함
+
+    사용 예시:
+        warmup = CatalogueWarmupService.get_instance()
+        records = await run_in_db_executor(repository.get_all_etf) or warmup.snapshot(DATASET_ETF)
+        if not records:
+            warmup.trigger(DATASET_ETF)
+    """
+
+    __instance = None
+
+    DATASETS = (DATASET_ETF, DATASET_FUND, DATASET_BOND)
+
+    @classmethod
+    def get_instance(cls) -> "CatalogueWarmupService":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, ingest: Optional[bool] = None):
+        # False면 비었거나 오래돼도 수집하지 않고 워커가 적재한 결과만 다시 읽음
+        self.ingest = ingestion_in_api() if ingest is None else ingest
+        self._status: Dict[str, CatalogueStatus] = {dataset: CatalogueStatus.UNKNOWN for dataset in self.DATASETS}
+        self._snapshots: Dict[str, List[tuple]] = {}
+        self._checked_at: Dict[str, datetime] = {}
+        self._last_complete: Dict[str, Optional[date]] = {}
+        self._errors: Dict[str, str] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    # ---------------------------------------------------
+    # 조회
+    # ---------------------------------------------------
+    def status(self, dataset: str) -> CatalogueStatus:
+        return self._status.get(dataset, CatalogueStatus.UNKNOWN)
+
+    def is_ready(self, dataset: str) -> bool:
+        return self.status(dataset) in (CatalogueStatus.READY, CatalogueStatus.STALE)
+
+    def snapshot(self, dataset: str) -> List[tuple]:
+        """마지막으로 조회에 성공한 목록 (없으면 빈 목록)"""
+        return self._snapshots.get(dataset, [])
+
+    def remember(self, dataset: str, records: List[tuple]):
+        """요청 경로에서 조회한 목록 보관 (비어 있지 않을 때만)"""
+        if records:
+            self._snapshots[dataset] = records
+            if self._status.get(dataset) in (CatalogueStatus.UNKNOWN, CatalogueStatus.EMPTY, CatalogueStatus.FAILED):
+                self._status[dataset] = CatalogueStatus.READY
+
+    def readiness(self) -> dict:
+        datasets = {}
+        for dataset in self.DATASETS:
+            checked_at = self._checked_at.get(dataset)
+            last_complete = self._last_complete.get(dataset)
+            datasets[dataset] = {
+                "status": self.status(dataset).value,
+                "refreshing": self._is_running(dataset),
+                "snapshot_size": len(self.snapshot(dataset)),
+                "last_complete_date": last_complete.isoformat() if last_complete else None,
+                "checked_at": checked_at.isoformat() if checked_at else None,
+                "error": self._errors.get(dataset),
+            }
+        return {
+            "ready": all(self.is_ready(dataset) for dataset in self.DATASETS),
+            "ingest": self.ingest,
+            "datasets": datasets,
+        }
+
+    # ---------------------------------------------------
+    # 백그라운드 점검
+    # ---------------------------------------------------
+    def start(self):
+        """기동 시 전체 점검 시작 (기다리지 않음)"""
+        for dataset in self.DATASETS:
+            self.trigger(dataset)
+
+    def trigger(self, dataset: str) -> bool:
+        """
+        백그라운드 점검 시작 (이미 진행 중이면 무시)
+
+        Returns:
+            새로 시작했으면 True
+        """
+        if self._is_running(dataset):
+            return False
+        # 요청의 DB 세션(contextvar)을 물려받지 않도록 빈 컨텍스트에서 실행
+        self._tasks[dataset] = asyncio.create_task(self._warm_up(dataset), context=contextvars.Context())
+        return True
+
+    async def warm_up_all(self):
+        """전체 점검 후 완료까지 대기 (스케줄 작업용)"""
+        for dataset in self.DATASETS:
+            self.trigger(dataset)
+        await asyncio.gather(*(self._tasks[dataset] for dataset in self.DATASETS), return_exceptions=True)
+
+    def _is_running(self, dataset: str) -> bool:
+        task = self._tasks.get(dataset)
+        return task is not None and not task.done()
+
+    async def _warm_up(self, dataset: str):
+        if not self.ingest:
+            await self._check(dataset, ingest=False)
+            return
+        # 여러 프로세스(uvicorn 워커 / 레플리카)와 스케줄 작업 / 백필이 같은 데이터셋을 동시에 수집하지 않도록
+        # 적재 임대를 바로 잡은 경우만 수집하고 나머지는 다시 읽기만 함
+        async with ingestion_lease(dataset, wait_sec=0) as held:
+            await self._check(dataset, ingest=held)
+
+    async def _check(self, dataset: str, ingest: bool):
+        try:
+            with session_scope():
+                usecase = FetchProductDataUsecaseFactory.create()
+                load = self._loader(usecase.repository, dataset)
+
+                records = await run_in_db_executor(load)
+                # ingest=False면 수집하지 않고 다른 프로세스가 적재한 결과만 다시 읽음
+                if ingest and not records:
+                    # 추천에서 바로 쓸 수 있도록 최근 영업일 하루만 먼저 수집
+                    self._status[dataset] = CatalogueStatus.WARMING
+                    logger.info(f"[catalogue] {dataset} 데이터 없음 → 최근 영업일 수집")
+                    await usecase.fetch_latest_available(dataset)
+                    records = await run_in_db_executor(load)
+                elif ingest:
+                    state = await usecase.ingestion.get_state(dataset)
+                    last_complete = state.last_complete_date if state is not None else None
+                    self._last_complete[dataset] = last_complete
+                    if last_complete is None or last_complete < date.today() - timedelta(days=CATALOGUE_STALE_DAYS):
+                        self._status[dataset] = CatalogueStatus.STALE
+                        self.remember(dataset, records)
+                        logger.info(f"[catalogue] {dataset} 마지막 적재 {last_complete} → 빠진 영업일 수집")
+                        await usecase.catch_up(dataset)
+                        records = await run_in_db_executor(load)
+
+                state = await usecase.ingestion.get_state(dataset)
+                self._last_complete[dataset] = state.last_complete_date if state is not None else None
+
+            if records:
+                self._snapshots[dataset] = records
+                self._status[dataset] = CatalogueStatus.READY
+            else:
+                self._status[dataset] = CatalogueStatus.EMPTY
+            self._errors.pop(dataset, None)
+            logger.info(f"[catalogue] {dataset} {self._status[dataset].value} ({len(records)} rows)")
+        except Exception as e:
+            # 이전 목록이 있으면 그대로 응답에 사용
+            self._status[dataset] = CatalogueStatus.STALE if self.snapshot(dataset) else CatalogueStatus.FAILED
+            self._errors[dataset] = str(e)
+            logger.error(f"[catalogue] {dataset} 점검 실패: {e}")
+        finally:
+            self._checked_at[dataset] = datetime.now()
+
+    @staticmethod
+    def _loader(repository, dataset: str) -> Callable[[], List[tuple]]:
+        if dataset == DATASET_ETF:
+            return repository.get_all_etf
+        if dataset == DATASET_FUND:
+            return repository.get_all_fund
+        return repository.get_all_bond
@@ -1,5 +1,9 @@
-from typing import List
+import os
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
+from ingestion.application.usecase.ingestion_state_usecase import IngestionStateUseCase
+from ingestion.domain.ingestion_state import IngestionState
+from ingestion.infrastructure.orm.ingestion_state import IngestionStatus
 from product.adapter.output.product.product_data_api_adapter import ProductDataApiAdapter
 from product.application.port.product_repository_port import ProductRepositoryPort
 from product.domain.product_bond_data import ProductBondData
@@ -8,18 +12,33 @@ from product.domain.product_fund import ProductFund
 from product.domain.product_fund_data import ProductFundData
 from product.domain.product_bond import ProductBond
 from product.domain.product_etf_data import ProductEtfData
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from product.infrastructure.api.data_go_client import DataGoClient
 from product.infrastructure.orm.product_bond import ProductBondORM
 from product.infrastructure.orm.product_etf import ProductETFORM
 from product.infrastructure.orm.product_fund import ProductFundORM
+from util.date.business_day import business_days
+from util.ingestion.range_ingestion import IngestionReport, RangeIngestionEngine
+from util.lock.ingestion_lease import exclusive_ingestion
 from util.log.log import Log
 
 logger = Log.get_logger()
+
+T = TypeVar("T")
+
+# 적재 상태 데이터셋 이름
+DATASET_ETF = "product_etf"
+DATASET_FUND = "product_fund"
+DATASET_BOND = "product_bond"
+
+# 상품 테이블이 비어 있을 때 최근 데이터를 찾아볼 기간 (일)
+PRODUCT_LATEST_LOOKBACK_DAYS = int(os.getenv("PRODUCT_LATEST_LOOKBACK_DAYS", "7"))
+
 class FetchProductUseCase:
-    def __init__(self, adapter: ProductDataApiAdapter, repository: ProductRepositoryPort):
+    def __init__(self, adapter: ProductDataApiAdapter, repository: ProductRepositoryPort, ingestion: IngestionStateUseCase):
         self.adapter = adapter
         self.repository = repository
+        self.ingestion = ingestion
 
     async def get_etf_data(self) -> ProductEtfData:
         return await self.adapter.get_etf_data()
@@ -27,37 +46,32 @@ class FetchProductUseCase:
     async def get_etf_data_by_date(self, date: str) -> List[ProductETFORM]:
         return await self.repository.get_etf_data_by_date(date)
 
-    async def fetch_and_save_etf_data(self, start:str, end:str) -> List[ProductEtf]:
-
-        client = DataGoClient()
-        raw_items = await client.get_etf_data(start, end)
-        etf_entities = []
-        for item in raw_items:
-            # 필드명 매핑 (API 응답 필드명 -> 모델 필드명)
-            # itmsNm: 종목명, vs: 대비, fltRt: 등락률, mkp: 시가, hipr: 고가, lopr: 저가
-            # clpr: 종가, trqu: 거래량, trPrc: 거래대금, lstgStCnt: 상장주식수, mrktTotAmt: 시가총액
-            etfs = ProductEtf(
-                fltRt=item.get("fltRt"),
-                nav=item.get("nav"),
-                mkp=item.get("mkp"),
-                hipr=item.get("hipr"),
-                lopr=item.get("lopr"),
-                trqu=item.get("trqu"),
-                trPrc=item.get("trPrc"),
-                mrktTotAmt=item.get("mrktTotAmt"),
-                nPptTotAmt=item.get("nPptTotAmt"),
-                stLstgCnt=item.get("stLstgCnt"),
-                bssIdxIdxNm=item.get("bssIdxIdxNm"),
-                bssIdxClpr=item.get("bssIdxClpr"),
-                basDt=item.get("basDt"),
-                clpr=item.get("clpr"),
-                vs=item.get("vs")
-            )
-            etf_entities.append(etfs)
-        if etf_entities:
-            await self.repository.save_etf_batch(etf_entities)
-
-        return etf_entities
+    async def fetch_and_save_etf_data(self, start:str, end:str, full_refresh: bool = False, collect: bool = True) -> List[ProductEtf]:
+        report = await self._ingest_range(DATASET_ETF, start, end, full_refresh, collect)
+        return report.items
+
+    @staticmethod
+    def _to_etf(item: dict) -> ProductEtf:
+        # 필드명 매핑 (API 응답 필드명 -> 모델 필드명)
+        # itmsNm: 종목명, vs: 대비, fltRt: 등락률, mkp: 시가, hipr: 고가, lopr: 저가
+        # clpr: 종가, trqu: 거래량, trPrc: 거래대금, lstgStCnt: 상장주식수, mrktTotAmt: 시가총액
+        return ProductEtf(
+            fltRt=item.get("fltRt"),
+            nav=item.get("nav"),
+            mkp=item.get("mkp"),
+            hipr=item.get("hipr"),
+            lopr=item.get("lopr"),
+            trqu=item.get("trqu"),
+            trPrc=item.get("trPrc"),
+            mrktTotAmt=item.get("mrktTotAmt"),
+            nPptTotAmt=item.get("nPptTotAmt"),
+            stLstgCnt=item.get("stLstgCnt"),
+            bssIdxIdxNm=item.get("bssIdxIdxNm"),
+            bssIdxClpr=item.get("bssIdxClpr"),
+            basDt=item.get("basDt"),
+            clpr=item.get("clpr"),
+            vs=item.get("vs")
+        )
 
     async def get_fund_data(self) -> ProductFundData:
         return await self.adapter.get_fund_data()
@@ -65,62 +79,22 @@ class FetchProductUseCase:
     async def get_fund_data_by_date(self, date:str) -> List[ProductFundORM]:
         return await self.repository.get_fund_data_by_date(date)
 
-    async def fetch_and_save_fund_data(self, start:str = None, end:str = None) -> List[ProductFund]:
-        client = DataGoClient()
-        all_fund_entities = []
-
-        if start not in (None, "") and end not in (None, ""):
-            start_date = datetime.strptime(start, "%Y%m%d")
-            end_date = datetime.strptime(end, "%Y%m%d")
-
-            current_date = start_date
-
-            while current_date <= end_date:
-                today = current_date.strftime("%Y%m%d")
-
-                raw_items = await client.get_fund_data(today)
-                fund_entities = []
-
-                for item in raw_items:
-                    funds = ProductFund(
-                        basDt=item.get("basDt"),
-                        srtnCd=item.get("srtnCd"),
-                        fndNm=item.get("fndNm"),
-                        ctg=item.get("ctg"),
-                        setpDt=item.get("setpDt"),
-                        fndTp=item.get("fndTp"),
-                        prdClsfCd=item.get("prdClsfCd"),
-                        asoStdCd=item.get("asoStdCd")
-                    )
-                    fund_entities.append(funds)
-
-                if fund_entities:
-                    await self.repository.save_fund_batch(fund_entities)
-
-                all_fund_entities.extend(fund_entities)
-                current_date += timedelta(days=1)
-            return all_fund_entities
-        else :
-            raw_items = await client.get_fund_data()
-
-            fund_entities = []
-
-            for item in raw_items:
-                funds = ProductFund(
-                    basDt=item.get("basDt"),
-                    srtnCd=item.get("srtnCd"),
-                    fndNm=item.get("fndNm"),
-                    ctg=item.get("ctg"),
-                    setpDt=item.get("setpDt"),
-                    fndTp=item.get("fndTp"),
-                    prdClsfCd=item.get("prdClsfCd"),
-                    asoStdCd=item.get("asoStdCd")
-                )
-                fund_entities.append(funds)
+    async def fetch_and_save_fund_data(self, start:str = None, end:str = None, full_refresh: bool = False, collect: bool = True) -> List[ProductFund]:
+        report = await self._ingest_range(DATASET_FUND, start, end, full_refresh, collect)
+        return report.items
 
-            if fund_entities:
-                await self.repository.save_fund_batch(fund_entities)
-            return fund_entities
+    @staticmethod
+    def _to_fund(item: dict) -> ProductFund:
+        return ProductFund(
+            basDt=item.get("basDt"),
+            srtnCd=item.get("srtnCd"),
+            fndNm=item.get("fndNm"),
+            ctg=item.get("ctg"),
+            setpDt=item.get("setpDt"),
+            fndTp=item.get("fndTp"),
+            prdClsfCd=item.get("prdClsfCd"),
+            asoStdCd=item.get("asoStdCd")
+        )
 
     async def get_bond_data(self) -> ProductBondData:
         return await self.adapter.get_bond_data()
@@ -129,79 +103,181 @@ class FetchProductUseCase:
 
         return await self.repository.get_bond_data_by_date(date)
 
-    async def fetch_and_save_bond_data(self, start:str, end:str) -> List[ProductBond]:
-        client = DataGoClient()
-        all_bond_entities = []
-
-        if start is not None and end is not None:
-            start_date = datetime.strptime(start, "%Y%m%d")
-            end_date = datetime.strptime(end, "%Y%m%d")
-
-            current_date = start_date
-            while current_date <= end_date:
-                today = current_date.strftime("%Y%m%d")
-
-                raw_items = await client.get_bond_data(today)
-                bond_entities = []
-
-                for item in raw_items:
-                    bonds = ProductBond(
-                        basDt=item.get("basDt"),
-                        crno=item.get("crno"),
-                        bondIsurNm=item.get("bondIsurNm"),
-                        bondIssuDt=item.get("bondIssuDt"),
-                        scrsItmsKcd=item.get("scrsItmsKcd"),
-                        scrsItmsKcdNm=item.get("scrsItmsKcdNm"),
-                        isinCd=item.get("isinCd"),
-                        isinCdNm=item.get("isinCdNm"),
-                        bondIssuFrmtNm=item.get("bondIssuFrmtNm"),
-                        bondExprDt=item.get("bondExprDt"),
-                        bondIssuCurCd=item.get("bondIssuCurCd"),
-                        bondIssuCurCdNm=item.get("bondIssuCurCdNm"),
-                        bondPymtAmt=item.get("bondPymtAmt"),
-                        bondIssuAmt=item.get("bondIssuAmt"),
-                        bondSrfcInrt=item.get("bondSrfcInrt"),
-                        irtChngDcd=item.get("irtChngDcd"),
-                        irtChngDcdNm=item.get("irtChngDcdNm"),
-                        bondIntTcd=item.get("bondIntTcd"),
-                        bondIntTcdNm=item.get("bondIntTcdNm")
-                    )
-                    bond_entities.append(bonds)
-
-                if bond_entities:
-                    await self.repository.save_bond_batch(bond_entities)
-
-                all_bond_entities.extend(bond_entities)
-                current_date += timedelta(days=1)
-            return all_bond_entities
-        else:
-            raw_items = await client.get_bond_data()
-            bond_entities = []
-
-            for item in raw_items:
-                bonds = ProductBond(
-                    basDt=item.get("basDt"),
-                    crno=item.get("crno"),
-                    bondIsurNm=item.get("bondIsurNm"),
-                    bondIssuDt=item.get("bondIssuDt"),
-                    scrsItmsKcd=item.get("scrsItmsKcd"),
-                    scrsItmsKcdNm=item.get("scrsItmsKcdNm"),
-                    isinCd=item.get("isinCd"),
-                    isinCdNm=item.get("isinCdNm"),
-                    bondIssuFrmtNm=item.get("bondIssuFrmtNm"),
-                    bondExprDt=item.get("bondExprDt"),
-                    bondIssuCurCd=item.get("bondIssuCurCd"),
-                    bondIssuCurCdNm=item.get("bondIssuCurCdNm"),
-                    bondPymtAmt=item.get("bondPymtAmt"),
-                    bondIssuAmt=item.get("bondIssuAmt"),
-                    bondSrfcInrt=item.get("bondSrfcInrt"),
-                    irtChngDcd=item.get("irtChngDcd"),
-                    irtChngDcdNm=item.get("irtChngDcdNm"),
-                    bondIntTcd=item.get("bondIntTcd"),
-                    bondIntTcdNm=item.get("bondIntTcdNm")
+    async def fetch_and_save_bond_data(self, start:str, end:str, full_refresh: bool = False, collect: bool = True) -> List[ProductBond]:
+        report = await self._ingest_range(DATASET_BOND, start, end, full_refresh, collect)
+        return report.items
+
+    @staticmethod
+    def _to_bond(item: dict) -> ProductBond:
+        return ProductBond(
+            basDt=item.get("basDt"),
+            crno=item.get("crno"),
+            bondIsurNm=item.get("bondIsurNm"),
+            bondIssuDt=item.get("bondIssuDt"),
+            scrsItmsKcd=item.get("scrsItmsKcd"),
+            scrsItmsKcdNm=item.get("scrsItmsKcdNm"),
+            isinCd=item.get("isinCd"),
+            isinCdNm=item.get("isinCdNm"),
+            bondIssuFrmtNm=item.get("bondIssuFrmtNm"),
+            bondExprDt=item.get("bondExprDt"),
+            bondIssuCurCd=item.get("bondIssuCurCd"),
+            bondIssuCurCdNm=item.get("bondIssuCurCdNm"),
+            bondPymtAmt=item.get("bondPymtAmt"),
+            bondIssuAmt=item.get("bondIssuAmt"),
+            bondSrfcInrt=item.get("bondSrfcInrt"),
+            irtChngDcd=item.get("irtChngDcd"),
+            irtChngDcdNm=item.get("irtChngDcdNm"),
+            bondIntTcd=item.get("bondIntTcd"),
+            bondIntTcdNm=item.get("bondIntTcdNm")
+        )
+
+    async def fetch_latest_available(self, dataset: str) -> list:
+        """
+        상품 테이블이 비어 있을 때 (추천 등) 가장 최근 데이터가 있는 영업일 하루만 수집
+
+        마지막 적재 일자(데이터가 있는 것이 확실한 날)부터 시도하고,
+        없으면 오늘부터 PRODUCT_LATEST_LOOKBACK_DAYS일 전까지 영업일만 최근 순으로 시도한다.
+
+        Args:
+            dataset: DATASET_ETF / DATASET_FUND / DATASET_BOND
+
+        Returns:
+            저장한 엔티티 목록 (찾지 못하면 빈 목록)
+        """
+        async with exclusive_ingestion(dataset):
+            state = await self.ingestion.get_state(dataset)
+            today = date.today()
+            candidates = list(reversed(business_days(today - timedelta(days=PRODUCT_LATEST_LOOKBACK_DAYS), today)))
+            if state is not None and state.last_complete_date is not None:
+                candidates = [state.last_complete_date] + [d for d in candidates if d != state.last_complete_date]
+
+            for day in candidates:
+                try:
+                    report = await self._ingest_days(dataset, [day], state, collect=True)
+                except Exception as e:
+                    logger.warning(f"[{dataset}] {day:%Y%m%d} 수집 실패: {e}")
+                    continue
+                if report.items:
+                    return report.items
+                logger.warning(f"[{dataset}] {day:%Y%m%d} 데이터 없음, 이전 영업일 시도")
+            return []
+
+    async def catch_up(self, dataset: str) -> IngestionReport:
+        """마지막 적재 일자 다음 날부터 오늘까지 빠진 영업일 수집 (스케줄 작업과 동일)"""
+        return await self._ingest_range(dataset, None, None, collect=False)
+
+    async def backfill(self, dataset: str, start: str, end: str, full_refresh: bool = False) -> IngestionReport:
+        """과거 구간 수집 (jobs/backfill.py 용, 저장한 엔티티는 모으지 않음)"""
+        return await self._ingest_range(dataset, start, end, full_refresh, collect=False)
+
+    def _pipeline(
+            self, dataset: str
+    ) -> Tuple[
+        Callable[[DataGoClient, str], AsyncIterator[List[dict]]],
+        Callable[[dict], T],
+        Callable[[ProductRepositoryPort, date], Awaitable[int]],
+        Callable[..., Awaitable[List[T]]],
+    ]:
+        """데이터셋별 (일자 페이지 조회, 엔티티 변환, 일자 삭제, 청크 저장) — 삭제 / 저장은 일자 트랜잭션 Repository로 호출"""
+        if dataset == DATASET_ETF:
+            return (lambda client, day: client.iter_etf_data(day), self._to_etf,
+                    lambda repository, day: repository.delete_etf_data_by_date(day),
+                    lambda repository, items: repository.save_etf_batch(items, skip_loaded_days=False, commit=False))
+        if dataset == DATASET_FUND:
+            return (lambda client, day: client.iter_fund_data(day), self._to_fund,
+                    lambda repository, day: repository.delete_fund_data_by_date(day),
+                    lambda repository, items: repository.save_fund_batch(items, skip_loaded_days=False, commit=False))
+        if dataset == DATASET_BOND:
+            return (lambda client, day: client.iter_bond_data(day), self._to_bond,
+                    lambda repository, day: repository.delete_bond_data_by_date(day),
+                    lambda repository, items: repository.save_bond_batch(items, skip_loaded_days=False, commit=False))
+        raise ValueError(f"Unknown product dataset: {dataset}")
+
+    async def _ingest_range(
+            self,
+            dataset: str,
+            start: Optional[str],
+            end: Optional[str],
+            full_refresh: bool = False,
+            collect: bool = True,
+    ) -> IngestionReport[T]:
+        """
+        적재 상태 기준으로 빠진 영업일만 수집
+
+        start/end가 비어 있으면 마지막 적재 일자 다음 날부터 오늘까지 (이력이 없으면 오늘 하루),
+        지정하면 그 구간 중 이미 적재된 일자를 뺀 나머지를 수집한다. 주말/휴장일은 요청하지 않는다.
+        collect=False면 저장한 엔티티를 모아 두지 않는다 (스케줄 작업 등 결과 목록이 필요 없는 경우).
+        다른 프로세스가 같은 데이터셋을 적재 중이면 끝날 때까지 기다린 뒤 적재 상태를 다시 읽어 계획한다.
+        """
+        async with exclusive_ingestion(dataset):
+            state = await self.ingestion.get_state(dataset)
+            days = self.ingestion.plan_days(state, start or None, end or None, full_refresh)
+            if not days:
+                logger.info(f"[{dataset}] 이미 적재된 구간이라 수집을 생략합니다.")
+                return IngestionReport(name=dataset)
+            return await self._ingest_days(dataset, days, state, collect)
+
+    async def _ingest_days(
+            self,
+            dataset: str,
+            days: Sequence[date],
+            state: Optional[IngestionState],
+            collect: bool = True,
+    ) -> IngestionReport[T]:
+        """
+        일자별로 동시에 페이지를 조회하면서 도착한 페이지부터 변환해 청크 단위로 저장하고 적재 상태 기록
+
+        수집 대상 일자는 적재 완료 구간 밖이므로 (중단된 이전 실행의 일부만 남았을 수 있음)
+        일자마다 별도 트랜잭션에서 기준일자 데이터를 지우고 청크를 저장한 뒤, 일자의 모든 페이지를
+        저장하면 한 번에 commit (상품 목록 캐시 버전도 일자당 한 번 증가)한다.
+        조회 / 저장이 중간에 실패한 일자는 rollback하므로 조회 쪽에는 기존 데이터가 그대로 보이고
+        절반만 적재된 일자는 보이지 않는다. (진행 중인 일자 수만큼 DB 커넥션 사용)
+        데이터셋 적재 임대(ingest:<dataset>)를 잡은 상태에서만 실행한다. (호출한 쪽이 이미 잡았으면 그대로 사용)
+        """
+        async with exclusive_ingestion(dataset):
+            iter_raw, to_entity, delete_day, save_batch = self._pipeline(dataset)
+            client = DataGoClient()
+            # 일자 → 해당 일자 트랜잭션 Repository (첫 청크 저장 시 시작)
+            transactions: Dict[date, ProductRepositoryPort] = {}
+
+            def pages(day: date) -> AsyncIterator[List[dict]]:
+                return iter_raw(client, day.strftime("%Y%m%d"))
+
+            async def save(day: date, entities: List[T]) -> int:
+                repository = transactions.get(day)
+                if repository is None:
+                    repository = transactions[day] = self.repository.day_transaction()
+                    deleted = await delete_day(repository, day)
+                    if deleted:
+                        logger.info(f"[{dataset}] {day:%Y%m%d} 기존 {deleted}건을 다시 적재합니다.")
+                return len(await save_batch(repository, entities))
+
+            async def finish(day: date, ok: bool):
+                repository = transactions.pop(day, None)
+                if repository is None:
+                    return
+                if ok:
+                    # 데이터셋 이름 = 상품 목록 캐시 이름 (product_etf 등)
+                    await repository.commit_day(dataset)
+                else:
+                    await repository.rollback_day()
+                    logger.warning(f"[{dataset}] {day:%Y%m%d} 적재 실패 → 기존 데이터를 유지합니다.")
+
+            try:
+                report = await RangeIngestionEngine(dataset).run_stream(
+                    days, pages, to_entity, save, collect=collect, finish=finish
                 )
-                bond_entities.append(bonds)
+            except Exception as e:
+                await self.ingestion.record(dataset, None, 0, 0.0, IngestionStatus.FAILED, str(e), state)
+                raise
+            finally:
+                # 중단(취소 / 예외)으로 마무리하지 못한 일자 트랜잭션 정리
+                for repository in transactions.values():
+                    try:
+                        await repository.rollback_day()
+                    except Exception as e:
+                        logger.error(f"[{dataset}] 일자 트랜잭션 정리 실패: {e}")
+                transactions.clear()
 
-            if bond_entities:
-                await self.repository.save_bond_batch(bond_entities)
-            return bond_entities
+            await self.ingestion.record_report(dataset, report, state)
+            return report
@@ -1,106 +1,220 @@
+import asyncio
 import os
+import random
 from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional
 
 import aiohttp
 
+from config.http_client import HttpClientRegistry
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 페이지당 행 수 / 동시 요청 수 / 재시도
+DATA_GO_PAGE_SIZE = int(os.getenv("DATA_GO_PAGE_SIZE", "1000"))
+DATA_GO_CONCURRENCY = int(os.getenv("DATA_GO_CONCURRENCY", "4"))
+DATA_GO_MAX_RETRIES = int(os.getenv("DATA_GO_MAX_RETRIES", "3"))
+DATA_GO_BACKOFF_BASE = float(os.getenv("DATA_GO_BACKOFF_BASE", "0.5"))  # 초, 재시도마다 2배
+DATA_GO_TIMEOUT = float(os.getenv("DATA_GO_TIMEOUT", "30"))
+
+_TIMEOUT = aiohttp.ClientTimeout(total=DATA_GO_TIMEOUT)
+
+# 재시도 대상 HTTP 상태 (과부하 / 일시 장애)
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class DataGoApiError(Exception):
+    """DataGo API 오류 (retryable=True면 재시도 대상)"""
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
 
 class DataGoClient:
 
-    def __init__(self):
+    def __init__(self, http: Optional[HttpClientRegistry] = None):
+        self.http = http or HttpClientRegistry.get_instance()
         self.data_go_key = os.getenv("DATA_GO_KEY")
         self.data_go_etf_end_point = os.getenv("DATA_GO_ETF_END_POINT")
         self.data_go_fund_end_point = os.getenv("DATA_GO_FUND_END_POINT")
         self.data_go_bond_end_point = os.getenv("DATA_GO_BOND_END_POINT")
 
-    async def get_etf_data(self, start:str = None, end:str = None) -> list[dict]:
+    # ---------------------------------------------------
+    # ETF
+    # ---------------------------------------------------
+    async def get_etf_data(self, start: str = None, end: str = None) -> list[dict]:
         if start is not None and end is not None:
-            # start와 end를 datetime 객체로 변환
+            # start부터 end까지 모든 날짜
             start_date = datetime.strptime(start, "%Y%m%d")
             end_date = datetime.strptime(end, "%Y%m%d")
-
-            results = []
-            async with aiohttp.ClientSession() as session:
-                # start부터 end까지 모든 날짜에 대해 반복
-                current_date = start_date
-                while current_date <= end_date:
-                    today = current_date.strftime("%Y%m%d")
-
-                    base_url = (
-                        f"{self.data_go_etf_end_point}?serviceKey={self.data_go_key}&"
-                        f"numOfRows=10000&pageNo=1&resultType=json&basDt={today}"
-                    )
-
-                    async with session.get(f"{base_url}") as response:
-                        if response.status != 200:
-                            raise Exception(f"DataGo API Error {response.status}")
-                        data = await response.json()
-                        results.extend(data["response"]["body"]["items"]["item"])
-
-                    # 다음 날짜로 이동
-                    current_date += timedelta(days=1)
-
-            return results
-
         else:
-            today = datetime.today().strftime("%Y%m%d")
+            start_date = end_date = datetime.today()
 
-            results = []
-            async with aiohttp.ClientSession() as session:
-                base_url = (
-                    f"{self.data_go_etf_end_point}?serviceKey={self.data_go_key}&"
-                    f"numOfRows=10000&pageNo=1&resultType=json&basDt={today}"
-                )
+        results = []
+        current_date = start_date
+        while current_date <= end_date:
+            today = current_date.strftime("%Y%m%d")
+            async for items in self.iter_pages(self.data_go_etf_end_point, today):
+                results.extend(items)
 
-            async with session.get(f"{base_url}") as response:
-                if response.status != 200:
-                    raise Exception(f"DataGo API Error {response.status}")
-                data = await response.json()
-                results.extend(data["response"]["body"]["items"]["item"])
+            # 다음 날짜로 이동
+            current_date += timedelta(days=1)
 
         return results
 
-
-
-    async def _fetch(self, url: str) -> list[dict]:
-        results = []
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    raise Exception(f"DataGo API Error {response.status}")
-                data = await response.json()
-
-                items = data["response"]["body"]["items"].get("item", [])
-                if isinstance(items, list):
-                    results.extend(items)
-                else:
-                    results.append(items)
-
-        return results
+    def iter_etf_data(self, date: str = None) -> AsyncIterator[list[dict]]:
+        """기준일자 ETF 시세를 페이지 단위로 반환"""
+        return self.iter_pages(self.data_go_etf_end_point, date or datetime.today().strftime("%Y%m%d"))
 
     # ---------------------------------------------------
     # FUND
     # ---------------------------------------------------
     async def get_fund_data(self, date: str = None) -> list[dict]:
-        basDt = date or datetime.today().strftime("%Y%m%d")
-
-        url = (
-            f"{self.data_go_fund_end_point}"
-            f"?serviceKey={self.data_go_key}"
-            f"&numOfRows=10000&pageNo=1&resultType=json&basDt={basDt}"
-        )
+        return await self._collect(self.iter_fund_data(date))
 
-        return await self._fetch(url)
+    def iter_fund_data(self, date: str = None) -> AsyncIterator[list[dict]]:
+        """기준일자 펀드 정보를 페이지 단위로 반환"""
+        return self.iter_pages(self.data_go_fund_end_point, date or datetime.today().strftime("%Y%m%d"))
 
     # ---------------------------------------------------
     # BOND
     # ---------------------------------------------------
     async def get_bond_data(self, date: str = None) -> list[dict]:
-        basDt = date or datetime.today().strftime("%Y%m%d")
+        return await self._collect(self.iter_bond_data(date))
 
+    def iter_bond_data(self, date: str = None) -> AsyncIterator[list[dict]]:
+        """기준일자 채권 정보를 페이지 단위로 반환"""
+        return self.iter_pages(self.data_go_bond_end_point, date or datetime.today().strftime("%Y%m%d"))
+
+    # ---------------------------------------------------
+    # 공통
+    # ---------------------------------------------------
+    async def iter_pages(
+            self,
+            end_point: str,
+            basDt: str,
+            session: Optional[aiohttp.ClientSession] = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        기준일자 전체 데이터를 페이지 단위로 반환
+
+        1페이지 응답의 totalCount로 남은 페이지 수를 계산하여
+        하나의 세션에서 DATA_GO_CONCURRENCY개까지 동시에 요청하고, 도착한 순서대로 반환한다.
+        한 페이지를 넘겨줄 때마다 다음 페이지 요청을 하나 시작하므로 (슬라이딩 윈도우)
+        소비자가 느리면 요청도 멈추고, 메모리에는 최대 DATA_GO_CONCURRENCY 페이지만 남는다.
+
+        Args:
+            end_point: DataGo API 엔드포인트
+            basDt: 기준일자 (YYYYMMDD)
+            session: 사용할 세션 (없으면 공유 세션)
+
+        Returns:
+            페이지별 item 목록 비동기 이터레이터
+        """
+        session = session or self.http.session()
+
+        total_count, items = await self._fetch_page(session, end_point, basDt, 1)
+        yield items
+
+        last_page = max(1, -(-total_count // DATA_GO_PAGE_SIZE))
+        if last_page == 1:
+            return
+
+        async def fetch(page_no: int) -> list[dict]:
+            _, page_items = await self._fetch_page(session, end_point, basDt, page_no)
+            return page_items
+
+        pages = iter(range(2, last_page + 1))
+        in_flight: set[asyncio.Task] = set()
+
+        def fill():
+            for page_no in pages:
+                in_flight.add(asyncio.create_task(fetch(page_no)))
+                if len(in_flight) >= DATA_GO_CONCURRENCY:
+                    break
+
+        try:
+            fill()
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    in_flight.discard(task)
+                    page_items = task.result()
+                    # 소비자가 이 페이지를 가져간 뒤에 다음 페이지 요청 시작
+                    yield page_items
+                    fill()
+        finally:
+            # 소비자가 중간에 멈추거나 한 페이지가 최종 실패하면 나머지 요청 취소
+            # (같이 끝난 다른 페이지의 예외도 여기서 회수해 "exception was never retrieved" 경고가 남지 않도록)
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        logger.info(f"DataGo 수집 완료 (basDt={basDt}, totalCount={total_count}, pages={last_page})")
+
+    async def _fetch_page(
+            self, session: aiohttp.ClientSession, end_point: str, basDt: str, page_no: int
+    ) -> tuple[int, list[dict]]:
         url = (
-            f"{self.data_go_bond_end_point}"
+            f"{end_point}"
             f"?serviceKey={self.data_go_key}"
-            f"&numOfRows=10000&pageNo=1&resultType=json&basDt={basDt}"
+            f"&numOfRows={DATA_GO_PAGE_SIZE}&pageNo={page_no}&resultType=json&basDt={basDt}"
         )
-
-        return await self._fetch(url)
\ No newline at end of file
+        body = await self._get_json_with_retry(session, url)
+
+        total_count = int(body.get("totalCount") or 0)
+        items = (body.get("items") or {})
+        items = items.get("item", []) if isinstance(items, dict) else []
+        if not isinstance(items, list):
+            # 결과가 1건이면 리스트가 아닌 단일 객체로 내려옴
+            items = [items]
+        return total_count, items
+
+    async def _get_json_with_retry(self, session: aiohttp.ClientSession, url: str) -> dict:
+        for attempt in range(DATA_GO_MAX_RETRIES + 1):
+            try:
+                return await self._get_json(session, url)
+            except (aiohttp.ClientError, asyncio.TimeoutError, DataGoApiError) as e:
+                retryable = not isinstance(e, DataGoApiError) or e.retryable
+                if not retryable or attempt == DATA_GO_MAX_RETRIES:
+                    raise
+
+                # 지수 백오프 + 지터 (동시 요청이 같은 시점에 몰리지 않도록)
+                delay = DATA_GO_BACKOFF_BASE * (2 ** attempt) * (0.5 + random.random())
+                logger.warning(f"DataGo API 재시도 {attempt + 1}/{DATA_GO_MAX_RETRIES} ({delay:.2f}s 후): {e}")
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    async def _get_json(session: aiohttp.ClientSession, url: str) -> dict:
+        async with session.get(url, timeout=_TIMEOUT) as response:
+            if response.status != 200:
+                raise DataGoApiError(f"DataGo API Error {response.status}", retryable=response.status in _RETRY_STATUS)
+
+            try:
+                # 일시 장애 시 JSON 대신 XML 오류 본문이 오는 경우가 있음
+                data = await response.json(content_type=None)
+            except ValueError:
+                raise DataGoApiError("DataGo API Error: invalid JSON body", retryable=True)
+
+        if not isinstance(data, dict) or "response" not in data:
+            raise DataGoApiError("DataGo API Error: unexpected response", retryable=True)
+
+        header = data["response"].get("header") or {}
+        result_code = header.get("resultCode", "00")
+        if result_code != "00":
+            raise DataGoApiError(
+                f"DataGo API Error {result_code}: {header.get('resultMsg')}",
+                # 01(어플리케이션 에러), 04(HTTP 에러), 05(서비스 연결 실패), 22(요청 제한 초과)
+                retryable=result_code in {"01", "04", "05", "22"},
+            )
+        return data["response"].get("body") or {}
+
+    @staticmethod
+    async def _collect(pages: AsyncIterator[list[dict]]) -> list[dict]:
+        results = []
+        async for items in pages:
+            results.extend(items)
+        return results
@@ -1,12 +1,15 @@
 from datetime import datetime
 
-from sqlalchemy import Column, String, BigInteger, DateTime, Integer, Float
+from sqlalchemy import Column, String, BigInteger, DateTime, Integer, Float, Index
 
 from config.database.session import Base
 
 
 class ProductBondORM(Base):
     __tablename__ = "product_bond"
+    __table_args__ = (
+        Index("ix_product_bond_basdt_bondissuamt", "basDt", "bondIssuAmt"),  # 기준일자 조회 + 발행금액 정렬
+    )
     id = Column(Integer, primary_key=True, index=True)
     basDt = Column(DateTime, default=datetime.utcnow)       # 기준일자
     crno = Column(String(255), nullable=True)               # 법인등록번호
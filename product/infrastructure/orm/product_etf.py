@@ -1,12 +1,15 @@
 from datetime import datetime
 
-from sqlalchemy import Column, String, BigInteger, DateTime, Integer, Float
+from sqlalchemy import Column, String, BigInteger, DateTime, Integer, Float, Index
 
 from config.database.session import Base
 
 
 class ProductETFORM(Base):
     __tablename__ = "product_etf"
+    __table_args__ = (
+        Index("ix_product_etf_basdt_mrkttotamt", "basDt", "mrktTotAmt"),  # 기준일자 조회 + 시가총액 정렬
+    )
     id = Column(Integer, primary_key=True, index=True)
     fltRt = Column(Float, nullable=True)               # 등락율
     nav = Column(Float, nullable=True)                 # 순자산가치(NAV)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy import Column, String, Integer, DateTime, Index
 
 
 from config.database.session import Base
@@ -7,6 +7,9 @@ from config.database.session import Base
 
 class ProductFundORM(Base):
     __tablename__ = "product_fund"
+    __table_args__ = (
+        Index("ix_product_fund_basdt", "basDt"),  # 기준일자 조회
+    )
     id = Column(Integer, primary_key=True, index=True)
     basDt = Column(DateTime, default=datetime.utcnow)       # 기준일자
     srtnCd = Column(String(255), nullable=True)             # 단축코드
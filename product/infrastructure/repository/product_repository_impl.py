@@ -1,124 +1,179 @@
-from typing import List
+from typing import List, Optional
 
-from sqlalchemy import and_
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from config.database.session import get_db_session
+from config.database.bulk_upsert import bulk_insert, filter_new
+from config.database.db_executor import db_offload
+from config.database.session import SessionLocal, get_current_read_session, get_current_session
 from product.application.port.product_repository_port import ProductRepositoryPort
 from product.domain.product_etf import ProductEtf
 from product.infrastructure.orm.product_bond import ProductBondORM
 from product.infrastructure.orm.product_etf import ProductETFORM
 from product.infrastructure.orm.product_fund import ProductFundORM
+from util.cache.catalogue_cache import VersionedCatalogueCache
+from util.date.date_range import day_range
+
+# 상품 목록 캐시 데이터셋 이름 (적재 commit 시 버전 증가)
+CATALOGUE_ETF = "product_etf"
+CATALOGUE_FUND = "product_fund"
+CATALOGUE_BOND = "product_bond"
+
+
+def _day_key(value):
+    """기준일자(YYYYMMDD 문자열 또는 datetime) → 해당 날짜 0시 (DB 저장값과 같은 형태)"""
+    if value is None:
+        return None
+    return day_range(value)[0]
 
 
 class ProductRepositoryImpl(ProductRepositoryPort):
     __instance = None
 
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-        return cls.__instance
-
     @classmethod
     def get_instance(cls):
         if cls.__instance is None:
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        if not hasattr(self, 'db'):
-            self.db: Session = get_db_session()
+    def __init__(self, session: Optional[Session] = None):
+        # session을 주입하지 않으면 현재 Unit of Work(요청/스케줄 작업)의 세션을 사용
+        self._session = session
+
+    @property
+    def db(self) -> Session:
+        return self._session or get_current_session()
+
+    @property
+    def read_db(self) -> Session:
+        # 조회 전용: 복제본으로 라우팅 (같은 Unit of Work에서 쓰기 이후에는 primary)
+        return self._session or get_current_read_session()
+
+    def day_transaction(self) -> "ProductRepositoryImpl":
+        """
+        자체 세션(트랜잭션)을 가진 Repository (기준일자 단위 교체 적재용)
+
+        delete_*_data_by_date + save_*_batch(commit=False)를 같은 트랜잭션에 모은 뒤
+        commit_day()로 한 번에 반영하거나 rollback_day()로 되돌린다.
+        """
+        return ProductRepositoryImpl(SessionLocal())
 
-    async def get_etf_data_by_date(self, date:str) -> List[ProductETFORM]:
+    @db_offload
+    def commit_day(self, catalogue: str):
+        """
+        day_transaction() 트랜잭션 commit 후 상품 목록 캐시 버전 증가
 
+        Args:
+            catalogue: CATALOGUE_ETF / CATALOGUE_FUND / CATALOGUE_BOND
+        """
         try:
-            rows = (self.db.query(ProductETFORM).
-                    filter(func.date_format(ProductETFORM.basDt, "%Y%m%d") == date).
-                    all())
-
-            return [
-                ProductETFORM(
-                    id=row.id,
-                    fltRt=row.fltRt,
-                    nav=row.nav,
-                    mkp=row.mkp,
-                    hipr=row.hipr,
-                    lopr=row.lopr,
-                    trqu=row.trqu,
-                    trPrc=row.trPrc,
-                    mrktTotAmt=row.mrktTotAmt,
-                    nPptTotAmt=row.nPptTotAmt,
-                    stLstgCnt=row.stLstgCnt,
-                    bssIdxIdxNm=row.bssIdxIdxNm,
-                    bssIdxClpr=row.bssIdxClpr,
-                    basDt=row.basDt,
-                    clpr=row.clpr,
-                    vs=row.vs
-                )
-                for row in rows
-            ]
+            self.db.commit()
         finally:
             self.db.close()
+        VersionedCatalogueCache.get_instance().bump(catalogue)
 
-    async def save_etf_batch(self, etf_list: List[ProductEtf]) -> List[ProductEtf]:
+    @db_offload
+    def rollback_day(self):
+        """day_transaction() 트랜잭션 취소 (삭제한 기존 데이터도 그대로 남음)"""
         try:
-            if not etf_list:
-                return []
-
-            new_etf_list = []
-
-            for etfs in etf_list:
-
-                etfs_date_only = etfs.basDt.date() if hasattr(etfs.basDt, 'basDt') else etfs.basDt
-
-                existing = self.db.query(ProductETFORM).filter(
-                    and_(
-                        ProductETFORM.basDt == etfs.basDt,
-                        # datetime을 날짜만 비교
-                        func.DATE(ProductETFORM.basDt) == etfs_date_only,
-                    )
-                ).first()
-
-                # 중복이 없으면 추가
-                if not existing:
-                    new_etf_list.append(etfs)
-
-            if not new_etf_list:
-                return etf_list
-
-            orm_list = [
-                ProductETFORM(
-                    fltRt=etf.fltRt,
-                    nav=etf.nav,
-                    mkp=etf.mkp,
-                    hipr=etf.hipr,
-                    lopr=etf.lopr,
-                    trqu=etf.trqu,
-                    trPrc=etf.trPrc,
-                    mrktTotAmt=etf.mrktTotAmt,
-                    nPptTotAmt=etf.nPptTotAmt,
-                    stLstgCnt=etf.stLstgCnt,
-                    bssIdxIdxNm=etf.bssIdxIdxNm,
-                    bssIdxClpr=etf.bssIdxClpr,
-                    basDt=etf.basDt,
-                    clpr=etf.clpr,
-                    vs=etf.vs
-                )
-                for etf in new_etf_list
-            ]
-
-            self.db.add_all(orm_list)
-            self.db.commit()
+            self.db.rollback()
+        finally:
+            self.db.close()
 
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
+    @db_offload
+    def get_etf_data_by_date(self, date:str) -> List[ProductETFORM]:
+        try:
+            start, end = day_range(date)
+        except ValueError:
+            return []
+
+        rows = (self.read_db.query(ProductETFORM).
+                filter(ProductETFORM.basDt >= start, ProductETFORM.basDt < end).
+                all())
+
+        return [
+            ProductETFORM(
+                id=row.id,
+                fltRt=row.fltRt,
+                nav=row.nav,
+                mkp=row.mkp,
+                hipr=row.hipr,
+                lopr=row.lopr,
+                trqu=row.trqu,
+                trPrc=row.trPrc,
+                mrktTotAmt=row.mrktTotAmt,
+                nPptTotAmt=row.nPptTotAmt,
+                stLstgCnt=row.stLstgCnt,
+                bssIdxIdxNm=row.bssIdxIdxNm,
+                bssIdxClpr=row.bssIdxClpr,
+                basDt=row.basDt,
+                clpr=row.clpr,
+                vs=row.vs
+            )
+            for row in rows
+        ]
+
+    @db_offload
+    def delete_etf_data_by_date(self, date) -> int:
+        """
+        기준일자 데이터 삭제 (commit은 day_transaction()의 commit_day()에서 함께 수행)
+
+        Returns:
+            삭제 건수
+        """
+        start, end = day_range(date)
+        return (self.db.query(ProductETFORM).
+                filter(ProductETFORM.basDt >= start, ProductETFORM.basDt < end).
+                delete(synchronize_session=False))
+
+    @db_offload
+    def save_etf_batch(self, etf_list: List[ProductEtf], skip_loaded_days: bool = True, commit: bool = True) -> List[ProductEtf]:
+        if not etf_list:
+            return []
 
+        # 기준일자 단위 중복 체크: 이미 적재된 날짜의 데이터는 건너뜀
+        # (같은 날짜의 여러 상품이 같은 키를 공유하므로 배치 내 중복은 허용)
+        # skip_loaded_days=False: 같은 기준일자를 청크로 나눠 이어서 적재하는 경우 (delete_etf_data_by_date 이후)
+        new_etf_list = etf_list if not skip_loaded_days else filter_new(
+            self.db,
+            etf_list,
+            key_columns=(ProductETFORM.basDt,),
+            key_of=lambda item: (_day_key(item.basDt),),
+            dedupe_batch=False,
+        )
+
+        if not new_etf_list:
             return etf_list
-        finally:
-            self.db.close()
 
-    def get_all_etf(self, limit: int = 50) -> List[ProductETFORM]:
+        rows = [
+            {
+                "fltRt": etf.fltRt,
+                "nav": etf.nav,
+                "mkp": etf.mkp,
+                "hipr": etf.hipr,
+                "lopr": etf.lopr,
+                "trqu": etf.trqu,
+                "trPrc": etf.trPrc,
+                "mrktTotAmt": etf.mrktTotAmt,
+                "nPptTotAmt": etf.nPptTotAmt,
+                "stLstgCnt": etf.stLstgCnt,
+                "bssIdxIdxNm": etf.bssIdxIdxNm,
+                "bssIdxClpr": etf.bssIdxClpr,
+                "basDt": etf.basDt,
+                "clpr": etf.clpr,
+                "vs": etf.vs,
+            }
+            for etf in new_etf_list
+        ]
+
+        bulk_insert(self.db, ProductETFORM, rows)
+        # commit=False: 같은 기준일자의 나머지 청크와 함께 commit_day()에서 반영
+        if commit:
+            self.db.commit()
+            VersionedCatalogueCache.get_instance().bump(CATALOGUE_ETF)
+
+        return etf_list
+
+    def get_all_etf(self, limit: int = 50) -> List[tuple]:
         """
         ETF 상품 목록 조회
         
@@ -128,207 +183,238 @@ class ProductRepositoryImpl(ProductRepositoryPort):
         Returns:
             ETF 상품 리스트
         """
+        cache = VersionedCatalogueCache.get_instance()
+        version = cache.current_version(CATALOGUE_ETF)
+        cached = cache.get(CATALOGUE_ETF, version, limit, ProductETFORM)
+        if cached is not None:
+            return cached
+
         try:
             # 최신 데이터 기준으로 정렬하여 조회
+            # 조회 결과가 현재 버전으로 캐시되므로 복제 지연으로 이전 적재분이 담기지 않도록 primary 사용 (버전당 1회)
             etf_list = self.db.query(ProductETFORM).order_by(
                 ProductETFORM.basDt.desc(),
                 ProductETFORM.mrktTotAmt.desc()  # 시가총액 큰 순서
             ).limit(limit).all()
-            
-            return etf_list
+
+            # 다음 적재(버전 변경) 전까지 DB 조회 없이 재사용
+            return cache.put(CATALOGUE_ETF, version, limit, ProductETFORM, etf_list)
         except Exception as e:
+            self.db.rollback()
             from util.log.log import Log
             logger = Log.get_logger()
             logger.error(f"Failed to get ETF list: {str(e)}")
             return []
-        finally:
-            self.db.close()
-
-    async def get_fund_data_by_date(self, date:str) -> List[ProductFundORM]:
 
+    @db_offload
+    def get_fund_data_by_date(self, date:str) -> List[ProductFundORM]:
         try:
-            rows = (self.db.query(ProductFundORM).
-                    filter(func.date_format(ProductFundORM.basDt, "%Y%m%d") == date).
-                    all())
-            return [
-                ProductFundORM(
-                    id=row.id,
-                    basDt = row.basDt,
-                    srtnCd = row.srtnCd,
-                    fndNm = row.fndNm,
-                    ctg = row.ctg,
-                    setpDt = row.setpDt,
-                    fndTp = row.fndTp,
-                    prdClsfCd = row.prdClsfCd,
-                    asoStdCd = row.asoStdCd,
-                )
-                for row in rows
-            ]
-        finally:
-            self.db.close()
+            start, end = day_range(date)
+        except ValueError:
+            return []
 
-    async def save_fund_batch(self, fund_list: List[ProductFundORM]) -> List[ProductFundORM]:
+        rows = (self.read_db.query(ProductFundORM).
+                filter(ProductFundORM.basDt >= start, ProductFundORM.basDt < end).
+                all())
+        return [
+            ProductFundORM(
+                id=row.id,
+                basDt = row.basDt,
+                srtnCd = row.srtnCd,
+                fndNm = row.fndNm,
+                ctg = row.ctg,
+                setpDt = row.setpDt,
+                fndTp = row.fndTp,
+                prdClsfCd = row.prdClsfCd,
+                asoStdCd = row.asoStdCd,
+            )
+            for row in rows
+        ]
+
+    @db_offload
+    def delete_fund_data_by_date(self, date) -> int:
+        """
+        기준일자 데이터 삭제 (commit은 day_transaction()의 commit_day()에서 함께 수행)
 
-        try:
-            if not fund_list:
-                return []
-
-            new_fund_list = []
-
-            for fund in fund_list:
-
-                fund_date_only = fund.basDt.date() if hasattr(fund.basDt, 'date') else fund.basDt
-
-                existing = self.db.query(ProductFundORM).filter(
-                    and_(
-                        ProductFundORM.basDt == fund.basDt,
-                        func.DATE(ProductFundORM.basDt) == fund_date_only,
-                    )
-                ).first()
-
-                if not existing:
-                    new_fund_list.append(fund)
-
-            # 신규 없으면 입력 필요 없음
-            if not new_fund_list:
-                return fund_list
-
-            orm_list = [
-                ProductFundORM(
-                    basDt=f.basDt,
-                    srtnCd=f.srtnCd,
-                    fndNm=f.fndNm,
-                    ctg=f.ctg,
-                    setpDt=f.setpDt,
-                    fndTp=f.fndTp,
-                    prdClsfCd=f.prdClsfCd,
-                    asoStdCd=f.asoStdCd
-                )
-                for f in new_fund_list
-            ]
-
-            self.db.add_all(orm_list)
-            self.db.commit()
+        Returns:
+            삭제 건수
+        """
+        start, end = day_range(date)
+        return (self.db.query(ProductFundORM).
+                filter(ProductFundORM.basDt >= start, ProductFundORM.basDt < end).
+                delete(synchronize_session=False))
 
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
+    @db_offload
+    def save_fund_batch(self, fund_list: List[ProductFundORM], skip_loaded_days: bool = True, commit: bool = True) -> List[ProductFundORM]:
 
+        if not fund_list:
+            return []
+
+        # 기준일자 단위 중복 체크: 이미 적재된 날짜의 데이터는 건너뜀
+        # (같은 날짜의 여러 상품이 같은 키를 공유하므로 배치 내 중복은 허용)
+        # skip_loaded_days=False: 같은 기준일자를 청크로 나눠 이어서 적재하는 경우 (delete_fund_data_by_date 이후)
+        new_fund_list = fund_list if not skip_loaded_days else filter_new(
+            self.db,
+            fund_list,
+            key_columns=(ProductFundORM.basDt,),
+            key_of=lambda item: (_day_key(item.basDt),),
+            dedupe_batch=False,
+        )
+
+        # 신규 없으면 입력 필요 없음
+        if not new_fund_list:
             return fund_list
-        finally:
-            self.db.close()
+
+        rows = [
+            {
+                "basDt": f.basDt,
+                "srtnCd": f.srtnCd,
+                "fndNm": f.fndNm,
+                "ctg": f.ctg,
+                "setpDt": f.setpDt,
+                "fndTp": f.fndTp,
+                "prdClsfCd": f.prdClsfCd,
+                "asoStdCd": f.asoStdCd,
+            }
+            for f in new_fund_list
+        ]
+
+        bulk_insert(self.db, ProductFundORM, rows)
+        # commit=False: 같은 기준일자의 나머지 청크와 함께 commit_day()에서 반영
+        if commit:
+            self.db.commit()
+            VersionedCatalogueCache.get_instance().bump(CATALOGUE_FUND)
+
+        return fund_list
 
     # fund 상품 목록 조회
-    def get_all_fund(self, limit: int = 50) -> List[ProductFundORM]:
+    def get_all_fund(self, limit: int = 50) -> List[tuple]:
+        cache = VersionedCatalogueCache.get_instance()
+        version = cache.current_version(CATALOGUE_FUND)
+        cached = cache.get(CATALOGUE_FUND, version, limit, ProductFundORM)
+        if cached is not None:
+            return cached
+
         try:
             # 최신 데이터 기준으로 정렬하여 조회
+            # 조회 결과가 현재 버전으로 캐시되므로 복제 지연으로 이전 적재분이 담기지 않도록 primary 사용 (버전당 1회)
             etf_list = self.db.query(ProductFundORM).order_by(
                 ProductFundORM.basDt.desc()
             ).limit(limit).all()
-            
-            return etf_list
+
+            # 다음 적재(버전 변경) 전까지 DB 조회 없이 재사용
+            return cache.put(CATALOGUE_FUND, version, limit, ProductFundORM, etf_list)
         except Exception as e:
+            self.db.rollback()
             from util.log.log import Log
             logger = Log.get_logger()
             logger.error(f"Failed to get Fund list: {str(e)}")
             return []
-        finally:
-            self.db.close()
 
-    async def get_bond_data_by_date(self, date:str) -> List[ProductBondORM]:
+    @db_offload
+    def get_bond_data_by_date(self, date:str) -> List[ProductBondORM]:
         try:
-            rows = (self.db.query(ProductBondORM).
-                    filter(func.date_format(ProductBondORM.basDt, "%Y%m%d") == date).
-                    all())
-
-            return [
-                ProductBondORM(
-                    id = row.id,
-                    basDt = row.basDt,
-                    crno = row.crno,
-                    bondIsurNm = row.bondIsurNm,
-                    bondIssuDt = row.bondIssuDt,
-                    scrsItmsKcd = row.scrsItmsKcd,
-                    scrsItmsKcdNm = row.scrsItmsKcdNm,
-                    isinCd = row.isinCd,
-                    isinCdNm = row.isinCdNm,
-                    bondIssuFrmtNm = row.bondIssuFrmtNm,
-                    bondExprDt = row.bondExprDt,
-                    bondIssuCurCd = row.bondIssuCurCd,
-                    bondIssuCurCdNm = row.bondIssuCurCdNm,
-                    bondPymtAmt = row.bondPymtAmt,
-                    bondIssuAmt = row.bondIssuAmt,
-                    bondSrfcInrt = row.bondSrfcInrt,
-                    irtChngDcd = row.irtChngDcd,
-                    irtChngDcdNm = row.irtChngDcdNm,
-                    bondIntTcd = row.bondIntTcd,
-                    bondIntTcdNm = row.bondIntTcdNm,
-                )
-                for row in rows
-            ]
-        finally:
-            self.db.close()
+            start, end = day_range(date)
+        except ValueError:
+            return []
 
-    async def save_bond_batch(self, bond_list: List[ProductBondORM]) -> List[ProductBondORM]:
+        rows = (self.read_db.query(ProductBondORM).
+                filter(ProductBondORM.basDt >= start, ProductBondORM.basDt < end).
+                all())
+
+        return [
+            ProductBondORM(
+                id = row.id,
+                basDt = row.basDt,
+                crno = row.crno,
+                bondIsurNm = row.bondIsurNm,
+                bondIssuDt = row.bondIssuDt,
+                scrsItmsKcd = row.scrsItmsKcd,
+                scrsItmsKcdNm = row.scrsItmsKcdNm,
+                isinCd = row.isinCd,
+                isinCdNm = row.isinCdNm,
+                bondIssuFrmtNm = row.bondIssuFrmtNm,
+                bondExprDt = row.bondExprDt,
+                bondIssuCurCd = row.bondIssuCurCd,
+                bondIssuCurCdNm = row.bondIssuCurCdNm,
+                bondPymtAmt = row.bondPymtAmt,
+                bondIssuAmt = row.bondIssuAmt,
+                bondSrfcInrt = row.bondSrfcInrt,
+                irtChngDcd = row.irtChngDcd,
+                irtChngDcdNm = row.irtChngDcdNm,
+                bondIntTcd = row.bondIntTcd,
+                bondIntTcdNm = row.bondIntTcdNm,
+            )
+            for row in rows
+        ]
+
+    @db_offload
+    def delete_bond_data_by_date(self, date) -> int:
+        """
+        기준일자 데이터 삭제 (commit은 day_transaction()의 commit_day()에서 함께 수행)
 
-        try:
-            if not bond_list:
-                return []
-
-            new_bond_list = []
-
-            for bond in bond_list:
-
-                bond_date_only = bond.basDt.date() if hasattr(bond.basDt, 'date') else bond.basDt
-
-                existing = self.db.query(ProductBondORM).filter(
-                    and_(
-                        ProductBondORM.basDt == bond.basDt,
-                        func.DATE(ProductBondORM.basDt) == bond_date_only,
-                    )
-                ).first()
-
-                if not existing:
-                    new_bond_list.append(bond)
-
-            if not new_bond_list:
-                return bond_list
-
-            orm_list = [
-                ProductBondORM(
-                    basDt=b.basDt,
-                    crno=b.crno,
-                    bondIsurNm=b.bondIsurNm,
-                    bondIssuDt=b.bondIssuDt,
-                    scrsItmsKcd=b.scrsItmsKcd,
-                    scrsItmsKcdNm=b.scrsItmsKcdNm,
-                    isinCd=b.isinCd,
-                    isinCdNm=b.isinCdNm,
-                    bondIssuFrmtNm=b.bondIssuFrmtNm,
-                    bondExprDt=b.bondExprDt,
-                    bondIssuCurCd=b.bondIssuCurCd,
-                    bondIssuCurCdNm=b.bondIssuCurCdNm,
-                    bondPymtAmt=b.bondPymtAmt,
-                    bondIssuAmt=b.bondIssuAmt,
-                    bondSrfcInrt=b.bondSrfcInrt,
-                    irtChngDcd=b.irtChngDcd,
-                    irtChngDcdNm=b.irtChngDcdNm,
-                    bondIntTcd=b.bondIntTcd,
-                    bondIntTcdNm=b.bondIntTcdNm
-                )
-                for b in new_bond_list
-            ]
-
-            self.db.add_all(orm_list)
-            self.db.commit()
+        Returns:
+            삭제 건수
+        """
+        start, end = day_range(date)
+        return (self.db.query(ProductBondORM).
+                filter(ProductBondORM.basDt >= start, ProductBondORM.basDt < end).
+                delete(synchronize_session=False))
 
-            for orm_item in orm_list:
-                self.db.refresh(orm_item)
+    @db_offload
+    def save_bond_batch(self, bond_list: List[ProductBondORM], skip_loaded_days: bool = True, commit: bool = True) -> List[ProductBondORM]:
+
+        if not bond_list:
+            return []
 
+        # 기준일자 단위 중복 체크: 이미 적재된 날짜의 데이터는 건너뜀
+        # (같은 날짜의 여러 상품이 같은 키를 공유하므로 배치 내 중복은 허용)
+        # skip_loaded_days=False: 같은 기준일자를 청크로 나눠 이어서 적재하는 경우 (delete_bond_data_by_date 이후)
+        new_bond_list = bond_list if not skip_loaded_days else filter_new(
+            self.db,
+            bond_list,
+            key_columns=(ProductBondORM.basDt,),
+            key_of=lambda item: (_day_key(item.basDt),),
+            dedupe_batch=False,
+        )
+
+        if not new_bond_list:
             return bond_list
-        finally:
-            self.db.close()
 
-    def get_all_bond(self, limit: int = 50) -> List[ProductBondORM]:
+        rows = [
+            {
+                "basDt": b.basDt,
+                "crno": b.crno,
+                "bondIsurNm": b.bondIsurNm,
+                "bondIssuDt": b.bondIssuDt,
+                "scrsItmsKcd": b.scrsItmsKcd,
+                "scrsItmsKcdNm": b.scrsItmsKcdNm,
+                "isinCd": b.isinCd,
+                "isinCdNm": b.isinCdNm,
+                "bondIssuFrmtNm": b.bondIssuFrmtNm,
+                "bondExprDt": b.bondExprDt,
+                "bondIssuCurCd": b.bondIssuCurCd,
+                "bondIssuCurCdNm": b.bondIssuCurCdNm,
+                "bondPymtAmt": b.bondPymtAmt,
+                "bondIssuAmt": b.bondIssuAmt,
+                "bondSrfcInrt": b.bondSrfcInrt,
+                "irtChngDcd": b.irtChngDcd,
+                "irtChngDcdNm": b.irtChngDcdNm,
+                "bondIntTcd": b.bondIntTcd,
+                "bondIntTcdNm": b.bondIntTcdNm,
+            }
+            for b in new_bond_list
+        ]
+
+        bulk_insert(self.db, ProductBondORM, rows)
+        # commit=False: 같은 기준일자의 나머지 청크와 함께 commit_day()에서 반영
+        if commit:
+            self.db.commit()
+            VersionedCatalogueCache.get_instance().bump(CATALOGUE_BOND)
+
+        return bond_list
+
+    def get_all_bond(self, limit: int = 50) -> List[tuple]:
         """
         채권 상품 목록 조회
 
@@ -338,18 +424,25 @@ class ProductRepositoryImpl(ProductRepositoryPort):
         Returns:
             ETF 상품 리스트
         """
+        cache = VersionedCatalogueCache.get_instance()
+        version = cache.current_version(CATALOGUE_BOND)
+        cached = cache.get(CATALOGUE_BOND, version, limit, ProductBondORM)
+        if cached is not None:
+            return cached
+
         try:
             # 최신 데이터 기준으로 정렬하여 조회
+            # 조회 결과가 현재 버전으로 캐시되므로 복제 지연으로 이전 적재분이 담기지 않도록 primary 사용 (버전당 1회)
             bond_list = self.db.query(ProductBondORM).order_by(
                 ProductBondORM.basDt.desc(),
                 ProductBondORM.bondIssuAmt.desc()  # 채권발행금액 큰 순서
             ).limit(limit).all()
 
-            return bond_list
+            # 다음 적재(버전 변경) 전까지 DB 조회 없이 재사용
+            return cache.put(CATALOGUE_BOND, version, limit, ProductBondORM, bond_list)
         except Exception as e:
+            self.db.rollback()
             from util.log.log import Log
             logger = Log.get_logger()
             logger.error(f"Failed to get Bond list: {str(e)}")
-            return []
-        finally:
-            self.db.close()
\ No newline at end of file
+            return []
\ No newline at end of file
@@ -74,9 +74,9 @@ async def get_etf_recommendation(
                 "items": result.get("recommended_etfs", [])
             }
         else:
-            # 에러 응답도 동일한 형식으로
+            # 에러 응답도 동일한 형식으로 (상품 데이터 준비 중이면 warming)
             return {
-                "source": "error",
+                "source": "warming" if result.get("warming") else "error",
                 "fetched_at": datetime.utcnow().isoformat(),
                 "total_income": 0,
                 "total_expense": 0,
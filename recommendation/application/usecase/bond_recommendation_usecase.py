@@ -3,11 +3,13 @@
 로그인 여부에 따라 DB 또는 Redis에서 자산 정보를 가져와 채권 추천
 """
 from typing import Dict, List
-from datetime import datetime, timedelta
 from config.crypto import Crypto
+from config.database.db_executor import run_in_db_executor
 from config.redis_config import get_redis
 from ieinfo.infrastructure.repository.ie_info_repository_impl import IEInfoRepositoryImpl
 from ieinfo.infrastructure.orm.ie_info import IEType
+from product.application.service.catalogue_warmup_service import CatalogueWarmupService
+from product.application.usecase.product_usecase import DATASET_BOND
 from product.infrastructure.repository.product_repository_impl import ProductRepositoryImpl
 from recommendation.domain.service.bond_recommendation_service import BondRecommendationService
 from util.log.log import Log
@@ -182,7 +184,7 @@ class BondRecommendationUseCase:
 
             if is_logged_in and year and month:
                 # 로그인 사용자 - DB에서 조회
-                financial_data = self._get_financial_data_from_db(session_id, year, month)
+                financial_data = await run_in_db_executor(self._get_financial_data_from_db, session_id, year, month)
                 if not financial_data:
                     # DB에 데이터가 없으면 Redis 시도
                     logger.warning("No data in DB, trying Redis...")
@@ -198,53 +200,24 @@ class BondRecommendationUseCase:
                 }
 
             # 3. 채권 데이터 가져오기
-            bond_records = self.product_repository.get_all_bond()
+            bond_records = await run_in_db_executor(self.product_repository.get_all_bond)
 
-            # 3-1. 채권 데이터가 없으면 자동으로 외부 API에서 가져와 저장
-            if not bond_records:
-                logger.warning("No Bond data in database. Auto-fetching from external API...")
-                try:
-                    from product.application.factory.fetch_product_data_usecase_factory import \
-                        FetchProductDataUsecaseFactory
-                    fetch_usecase = FetchProductDataUsecaseFactory.create()
-
-                    # 현재 날짜부터 최대 7일 전까지 시도 (주말/공휴일 고려)
-                    today = datetime.now()
-                    bond_entities = None
-
-                    for days_ago in range(7):
-                        target_date = (today - timedelta(days=days_ago)).strftime("%Y%m%d")
-                        logger.info(f"Trying to fetch Bond data for date: {target_date}")
-
-                        try:
-                            # 채권 데이터 가져오기 (start, end 파라미터 전달)
-                            bond_entities = await fetch_usecase.fetch_and_save_bond_data(start=target_date,
-                                                                                       end=target_date)
-
-                            if bond_entities and len(bond_entities) > 0:
-                                logger.info(f"Successfully fetched {len(bond_entities)} Bond records for {target_date}")
-                                break
-                            else:
-                                logger.warning(f"No Bond data found for {target_date}, trying previous day...")
-                        except Exception as date_error:
-                            logger.warning(f"Failed to fetch Bond data for {target_date}: {str(date_error)}")
-                            continue
-
-                    if bond_entities and len(bond_entities) > 0:
-                        logger.info(f"Successfully auto-saved {len(bond_entities)} Bond records")
-                        # 다시 DB에서 조회
-                        bond_records = self.product_repository.get_all_bond()
-                    else:
-                        logger.error("Failed to auto-fetch Bond data - no data found for the past 7 days")
-                except Exception as fetch_error:
-                    logger.error(f"Error auto-fetching Bond data: {str(fetch_error)}")
-                    import traceback
-                    traceback.print_exc()
+            # 3-1. DB에 없으면 마지막으로 조회된 목록 사용, 그것도 없으면 백그라운드 수집만 시작하고 바로 응답 (요청 안에서 외부 API 호출 안 함)
+            warmup = CatalogueWarmupService.get_instance()
+            if bond_records:
+                warmup.remember(DATASET_BOND, bond_records)
+            else:
+                bond_records = warmup.snapshot(DATASET_BOND)
+                if bond_records:
+                    logger.warning("No Bond data in database. Using last loaded snapshot.")
 
             if not bond_records:
+                warmup.trigger(DATASET_BOND)
+                logger.warning("No Bond data available. Warming up in background.")
                 return {
                     "success": False,
-                    "message": "채권 데이터를 불러올 수 없습니다."
+                    "warming": True,
+                    "message": "채권 데이터를 준비하고 있습니다. 잠시 후 다시 시도해주세요."
                 }
 
             # 채권 데이터를 딕셔너리 형태로 변환
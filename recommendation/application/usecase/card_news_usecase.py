@@ -2,11 +2,13 @@
 카드뉴스 추천 UseCase
 로그인 여부에 따라 DB 또는 Redis에서 자산 정보를 가져와 카드뉴스 추천
 """
+import os
 from typing import Dict, List
 from datetime import datetime, timedelta
 
 from community.infrastructure.repository.community_repository_impl import CommunityRepositoryImpl
 from config.crypto import Crypto
+from config.database.db_executor import run_in_db_executor
 from config.redis_config import get_redis
 from ieinfo.infrastructure.repository.ie_info_repository_impl import IEInfoRepositoryImpl
 from ieinfo.infrastructure.orm.ie_info import IEType
@@ -16,6 +18,11 @@ from util.log.log import Log
 
 logger = Log.get_logger()
 
+# 카드뉴스 후보로 읽을 소스별 최신 글 수 (기본값 0: 기존과 같이 90일 전체)
+# 후보는 모두 AI 추천에 넘기므로 요청당 메모리는 이 상한으로만 제한된다.
+# 설정하면 최신순 스트림에서 앞의 N건만 읽어 그보다 오래된 글은 후보에서 빠진다.
+CARD_NEWS_MAX_ITEMS_PER_SOURCE = int(os.getenv("CARD_NEWS_MAX_ITEMS_PER_SOURCE", "0"))
+
 class CardNewsRecommendationUseCase:
     """카드 뉴스 추천 UseCase"""
 
@@ -180,7 +187,7 @@ class CardNewsRecommendationUseCase:
 
             if is_logged_in and year and month:
                 # 로그인 사용자 - DB에서 조회
-                financial_data = self._get_financial_data_from_db(session_id, year, month)
+                financial_data = await run_in_db_executor(self._get_financial_data_from_db, session_id, year, month)
                 if not financial_data:
                     # DB에 데이터가 없으면 Redis 시도
                     logger.warning("No data in DB, trying Redis...")
@@ -196,11 +203,7 @@ class CardNewsRecommendationUseCase:
                 }
 
             logger.debug(f"financial_data {financial_data}")
-            # 3. 뉴스 관련 데이터 가져오기
-            news_records = await self.news_repository.get_three_month_news_for_card_news()
-            community_records = await self.community_repository.get_three_month_community_for_card_news()
-
-            # 4. news와 커뮤니티 게시글 조합
+            # 3. 뉴스 관련 데이터 가져오기 (필요한 컬럼만 최신순 스트리밍 → 공통 dict)
             news_items = [
                 {
                     "type_of_content": "NEWS",
@@ -210,20 +213,24 @@ class CardNewsRecommendationUseCase:
                     "link": n.link,
                     "published_at": n.published_at
                 }
-                for n in news_records
+                async for n in self.news_repository.stream_recent_news_for_card_news(
+                    limit=CARD_NEWS_MAX_ITEMS_PER_SOURCE or None
+                )
             ]
 
-            # 커뮤니티 → 공통 dict
+            # 커뮤니티 → 공통 dict (본문은 DB에서 50자만 잘라 옴)
             community_items = [
                 {
                     "type_of_content": "COMMUNITY",
                     "title": c.title,
                     "provider": c.provider,
-                    "content": c.content[0:50],
+                    "content": c.content or "",
                     "link": c.url,
                     "published_at": c.posted_at
                 }
-                for c in community_records
+                async for c in self.community_repository.stream_recent_community_for_card_news(
+                    limit=CARD_NEWS_MAX_ITEMS_PER_SOURCE or None, content_length=50
+                )
             ]
 
             combined = news_items + community_items
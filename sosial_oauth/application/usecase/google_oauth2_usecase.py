@@ -1,5 +1,6 @@
 from account.adapter.input.web.request.create_account_request import CreateAccountRequest
 from account.application.usecase.account_usecase import AccountUseCase
+from config.database.db_executor import run_in_db_executor
 from sosial_oauth.adapter.input.web.request.get_access_token_request import GetAccessTokenRequest
 from sosial_oauth.adapter.input.web.response.access_token import AccessToken
 from sosial_oauth.infrastructure.service.google_oauth2_service import GoogleOAuth2Service
@@ -56,7 +57,7 @@ class GoogleOAuth2UseCase:
         if not sso_id:
             raise ValueError("User profile does not contain 'sub' or 'id' field")
 
-        existing_account = account_usecase.get_account_by_oauth_id("GOOGLE", sso_id)
+        existing_account = await run_in_db_executor(account_usecase.get_account_by_oauth_id, "GOOGLE", sso_id)
 
         if existing_account:
             # 기존 계정이 있는 경우, 변경된 필드만 업데이트
@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from config.redis_config import get_redis
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 이 시간 안에 저장한 본문은 요청 없이 그대로 사용 (초) → 이후에는 ETag / Last-Modified로 재검증
+ARTICLE_CACHE_FRESH_SEC = int(os.getenv("ARTICLE_CACHE_FRESH_SEC", "21600"))  # 6시간
+# 본문 영역을 찾지 못한 기사(레이아웃이 다른 섹션 등)를 다시 받지 않는 시간 (초)
+ARTICLE_CACHE_NEGATIVE_SEC = int(os.getenv("ARTICLE_CACHE_NEGATIVE_SEC", "3600"))
+# Redis 저장분 만료 (초)
+ARTICLE_CACHE_TTL = int(os.getenv("ARTICLE_CACHE_TTL", "604800"))  # 7일
+# Redis에 보관할 최대 기사 수 (초과하면 가장 오래 전에 저장한 기사부터 삭제)
+ARTICLE_CACHE_MAX_ENTRIES = int(os.getenv("ARTICLE_CACHE_MAX_ENTRIES", "5000"))
+# 프로세스 메모리에 보관할 최대 기사 수 (LRU)
+ARTICLE_CACHE_LOCAL_MAX = int(os.getenv("ARTICLE_CACHE_LOCAL_MAX", "500"))
+
+# 인덱스 정리 (한 번에 실행되므로 동시에 저장해도 초과분만큼만 삭제)
+# - 저장 시각이 TTL보다 오래된 기사(본문 키는 이미 만료)를 인덱스에서 제거
+# - 그래도 최대 건수를 넘으면 가장 오래 전에 저장한 기사부터 본문 키와 함께 삭제
+# KEYS[1]=인덱스, ARGV[1]=최대 건수, ARGV[2]=만료 기준 시각, ARGV[3]=본문 키 접두어 → {만료 제거 수, 삭제 수}
+_TRIM_SCRIPT = """
+local expired = redis.call('zremrangebyscore', KEYS[1], '-inf', '(' .. ARGV[2])
+local overflow = redis.call('zcard', KEYS[1]) - tonumber(ARGV[1])
+if overflow <= 0 then
+    return {expired, 0}
+end
+local evicted = redis.call('zpopmin', KEYS[1], overflow)
+for i = 1, #evicted, 2 do
+    redis.call('del', ARGV[3] .. redis.sha1hex(evicted[i]))
+end
+return {expired, #evicted / 2}
+"""
+
+
+def canonical_article_url(url: str) -> str:
+    """
+    캐시 키용 기사 URL 정규화
+
+    네이버 뉴스는 같은 기사가 여러 형태의 URL로 노출되므로 (언론사 ID, 기사 ID)로 통일
+        https://n.news.naver.com/mnews/article/001/0012345678?sid=101
+        https://news.naver.com/main/read.naver?oid=001&aid=0012345678
+        → n.news.naver.com/article/001/0012345678
+    그 밖의 URL은 scheme / 쿼리 / fragment를 제외한 host + path
+    """
+    parts = urlsplit((url or "").strip())
+    host = parts.netloc.lower()
+    path = parts.path.rstrip("/")
+
+    if host.endswith("news.naver.com"):
+        segments = [s for s in path.split("/") if s]
+        if "article" in segments:
+            i = segments.index("article")
+            if len(segments) >= i + 3:
+                return f"n.news.naver.com/article/{segments[i + 1]}/{segments[i + 2]}"
+        query = parse_qs(parts.query)
+        if "oid" in query and "aid" in query:
+            return f"n.news.naver.com/article/{query['oid'][0]}/{query['aid'][0]}"
+
+    return f"{host}{path}"
+
+
+@dataclass
+class ArticleContent:
+    """캐시된 기사 본문 (원본 HTML은 저장하지 않음)"""
+    content: Optional[str]               # 추출한 본문 텍스트 (본문 영역이 없으면 None)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    checked_at: float = 0.0              # 마지막으로 다운로드 / 재검증한 시각 (epoch)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        ttl = ARTICLE_CACHE_FRESH_SEC if self.content else ARTICLE_CACHE_NEGATIVE_SEC
+        return (now or time.time()) - self.checked_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """재검증 요청 헤더 (검증자가 없으면 빈 dict → 일반 요청)"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ArticleContentCache:
+    """
+    기사 본문 캐시 (정규화한 기사 URL 기준)
+
+    - 1차: 프로세스 메모리 (LRU, ARTICLE_CACHE_LOCAL_MAX) / 2차: Redis (ARTICLE_CACHE_MAX_ENTRIES 초과 시 오래된 기사부터 삭제,
+      만료된 기사는 저장할 때마다 인덱스에서도 제거)
+    - 본문 텍스트와 ETag / Last-Modified만 저장 → 신선도가 지나면 조건부 요청으로 재검증
+    - Redis 오류는 로그만 남기고 캐시 미스로 처리
+
+    사용 예시:
+        cache = ArticleContentCache.get_instance()
+        cached = cache.get_many(urls)
+        entry = cached.get(canonical_article_url(url))
+        if entry is None or not entry.is_fresh():
+            ...  # entry.conditional_headers()로 요청 후 cache.put(url, new_entry)
+    """
+
+    __instance = None
+
+    KEY_PREFIX = "article_content"
+
+    @classmethod
+    def get_instance(cls) -> "ArticleContentCache":
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        self.redis_client = get_redis()
+        self._lock = threading.Lock()
+        self._local: "OrderedDict[str, ArticleContent]" = OrderedDict()
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, ArticleContent]:
+        """
+        여러 기사 본문 조회 (Redis는 한 번에 조회)
+
+        Returns:
+            정규화 URL → ArticleContent (없는 기사는 제외)
+        """
+        found: Dict[str, ArticleContent] = {}
+        missing = []
+        with self._lock:
+            for key in dict.fromkeys(canonical_article_url(url) for url in urls if url):
+                entry = self._local.get(key)
+                if entry is not None:
+                    self._local.move_to_end(key)
+                    found[key] = entry
+                else:
+                    missing.append(key)
+
+        if not missing:
+            return found
+
+        try:
+            payloads = self.redis_client.mget([self._data_key(key) for key in missing])
+        except Exception as e:
+            logger.warning(f"Article cache read error: {e}")
+            return found
+
+        for key, payload in zip(missing, payloads):
+            if payload is None:
+                continue
+            try:
+                entry = ArticleContent(**json.loads(payload))
+            except Exception as e:
+                logger.warning(f"Article cache decode error ({key}): {e}")
+                continue
+            found[key] = entry
+            self._remember(key, entry)
+        return found
+
+    def put(self, url: str, entry: ArticleContent):
+        """본문 저장 (재검증 결과 304인 경우에도 checked_at을 갱신해 다시 저장)"""
+        key = canonical_article_url(url)
+        self._remember(key, entry)
+
+        now = time.time()
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.setex(self._data_key(key), ARTICLE_CACHE_TTL, json.dumps(asdict(entry), ensure_ascii=False))
+            pipe.zadd(self._index_key(), {key: now})
+            pipe.eval(
+                _TRIM_SCRIPT, 1, self._index_key(),
+                ARTICLE_CACHE_MAX_ENTRIES, now - ARTICLE_CACHE_TTL, f"{self.KEY_PREFIX}:",
+            )
+            expired, evicted = pipe.execute()[-1]
+            if expired or evicted:
+                logger.info(f"🗑️ Article cache trimmed: expired={expired} evicted={evicted}")
+        except Exception as e:
+            logger.warning(f"Article cache write error ({key}): {e}")
+
+    def _remember(self, key: str, entry: ArticleContent):
+        with self._lock:
+            self._local[key] = entry
+            self._local.move_to_end(key)
+            while len(self._local) > ARTICLE_CACHE_LOCAL_MAX:
+                self._local.popitem(last=False)
+
+    def _data_key(self, key: str) -> str:
+        # _TRIM_SCRIPT도 같은 규칙(접두어 + sha1)으로 본문 키를 만든다
+        return f"{self.KEY_PREFIX}:{hashlib.sha1(key.encode('utf-8')).hexdigest()}"
+
+    def _index_key(self) -> str:
+        return f"{self.KEY_PREFIX}:index"
@@ -0,0 +1,174 @@
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Date, DateTime
+
+from config.redis_config import get_redis
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 로컬 메모리에 캐시한 버전을 Redis에 다시 확인하기까지의 간격 (초)
+CATALOGUE_VERSION_CHECK_SEC = float(os.getenv("CATALOGUE_VERSION_CHECK_SEC", "5"))
+# Redis 저장분 만료 (버전이 바뀌면 키 자체가 바뀌므로 오래된 버전 정리용)
+CATALOGUE_CACHE_TTL = int(os.getenv("CATALOGUE_CACHE_TTL", "172800"))  # 48시간
+
+
+class VersionedCatalogueCache:
+    """
+    데이터셋 버전 기반 조회 결과 캐시
+
+    - 적재 작업이 commit 후 bump(dataset)로 버전을 올리면 이전 버전 캐시는 더 이상 사용되지 않음
+    - 조회 결과는 namedtuple(컬럼 순서 그대로의 튜플)로 보관 → 속성 접근은 ORM 객체와 동일
+    - 1차: 프로세스 메모리 / 2차: Redis (JSON 배열) / 미스 시 호출자가 DB 조회 후 put()
+      (put()한 결과는 그 버전 동안 계속 쓰이므로 미스 시 조회는 복제본이 아닌 primary에서)
+
+    사용 예시:
+        cache = VersionedCatalogueCache.get_instance()
+        version = cache.current_version("product_etf")
+        records = cache.get("product_etf", version, limit, ProductETFORM)
+        if records is None:
+            records = cache.put("product_etf", version, limit, ProductETFORM, rows)
+    """
+
+    __instance = None
+
+    KEY_PREFIX = "catalogue"
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        self.redis_client = get_redis()
+        self._lock = threading.Lock()
+        # dataset → (version, 확인 시각)
+        self._versions: Dict[str, Tuple[int, float]] = {}
+        # (dataset, version, variant) → records
+        self._local: Dict[Tuple[str, int, Any], List[tuple]] = {}
+        # ORM 클래스 → namedtuple 타입
+        self._record_types: Dict[type, type] = {}
+
+    def current_version(self, dataset: str) -> int:
+        """데이터셋 현재 버전 (CATALOGUE_VERSION_CHECK_SEC 동안은 로컬 값 사용)"""
+        now = time.monotonic()
+        cached = self._versions.get(dataset)
+        if cached and now - cached[1] < CATALOGUE_VERSION_CHECK_SEC:
+            return cached[0]
+
+        try:
+            version = int(self.redis_client.get(self._version_key(dataset)) or 0)
+        except Exception as e:
+            logger.warning(f"Catalogue version read error ({dataset}): {e}")
+            # Redis 장애 시 마지막으로 알던 버전 유지 (없으면 캐시 미사용)
+            return cached[0] if cached else -1
+
+        self._versions[dataset] = (version, now)
+        return version
+
+    def bump(self, dataset: str) -> Optional[int]:
+        """데이터 적재 commit 후 호출 → 모든 프로세스의 해당 데이터셋 캐시 무효화"""
+        try:
+            version = int(self.redis_client.incr(self._version_key(dataset)))
+        except Exception as e:
+            logger.error(f"Catalogue version bump error ({dataset}): {e}")
+            version = None
+
+        with self._lock:
+            self._versions.pop(dataset, None)
+            for key in [k for k in self._local if k[0] == dataset]:
+                del self._local[key]
+        logger.info(f"📦 Catalogue version bumped: {dataset} → {version}")
+        return version
+
+    def get(self, dataset: str, version: int, variant: Any, model) -> Optional[List[tuple]]:
+        """캐시된 조회 결과 (없으면 None)"""
+        if version < 0:
+            return None
+
+        local_key = (dataset, version, variant)
+        records = self._local.get(local_key)
+        if records is not None:
+            return records
+
+        try:
+            payload = self.redis_client.get(self._data_key(dataset, version, variant))
+        except Exception as e:
+            logger.warning(f"Catalogue cache read error ({dataset}): {e}")
+            return None
+        if payload is None:
+            return None
+
+        records = self._decode(model, json.loads(payload))
+        with self._lock:
+            self._local[local_key] = records
+        return records
+
+    def put(self, dataset: str, version: int, variant: Any, model, rows: Sequence[Any]) -> List[tuple]:
+        """DB 조회 결과(ORM 객체)를 튜플로 변환하여 저장 후 반환"""
+        record_type = self.record_type(model)
+        fields = record_type._fields
+        records = [record_type(*(getattr(row, f) for f in fields)) for row in rows]
+
+        # 빈 결과는 캐시하지 않음 (버전 증가 없이 적재된 데이터가 가려지지 않도록)
+        if version < 0 or not records:
+            return records
+
+        with self._lock:
+            # 다른 프로세스가 버전을 올린 경우 이전 버전 로컬 캐시 정리
+            for key in [k for k in self._local if k[0] == dataset and k[1] != version]:
+                del self._local[key]
+            self._local[(dataset, version, variant)] = records
+
+        try:
+            self.redis_client.setex(
+                self._data_key(dataset, version, variant),
+                CATALOGUE_CACHE_TTL,
+                json.dumps([self._encode_row(r) for r in records], ensure_ascii=False, separators=(",", ":")),
+            )
+        except Exception as e:
+            logger.warning(f"Catalogue cache write error ({dataset}): {e}")
+        return records
+
+    def record_type(self, model) -> type:
+        """ORM 클래스의 컬럼 순서를 그대로 따르는 namedtuple 타입"""
+        record_type = self._record_types.get(model)
+        if record_type is None:
+            fields = [c.key for c in model.__table__.columns]
+            record_type = namedtuple(f"{model.__name__}Record", fields)
+            self._record_types[model] = record_type
+        return record_type
+
+    def _decode(self, model, payload: List[list]) -> List[tuple]:
+        record_type = self.record_type(model)
+        columns = list(model.__table__.columns)
+        datetime_idx = [i for i, c in enumerate(columns) if isinstance(c.type, DateTime)]
+        date_idx = [i for i, c in enumerate(columns) if isinstance(c.type, Date) and not isinstance(c.type, DateTime)]
+
+        records = []
+        for values in payload:
+            for i in datetime_idx:
+                if values[i] is not None:
+                    values[i] = datetime.fromisoformat(values[i])
+            for i in date_idx:
+                if values[i] is not None:
+                    values[i] = date.fromisoformat(values[i])
+            records.append(record_type(*values))
+        return records
+
+    @staticmethod
+    def _encode_row(record: tuple) -> list:
+        return [v.isoformat() if isinstance(v, (date, datetime)) else getattr(v, "value", v) for v in record]
+
+    def _version_key(self, dataset: str) -> str:
+        return f"{self.KEY_PREFIX}:{dataset}:version"
+
+    def _data_key(self, dataset: str, version: int, variant: Any) -> str:
+        return f"{self.KEY_PREFIX}:{dataset}:v{version}:{variant}"
@@ -0,0 +1,53 @@
+import os
+from datetime import date, datetime, timedelta
+from typing import List, Set, Union
+
+# 양력 고정 휴장일 (MMDD) - 신정, 삼일절, 어린이날, 현충일, 광복절, 개천절, 한글날, 성탄절, 연말 휴장일
+_FIXED_HOLIDAYS = {"0101", "0301", "0505", "0606", "0815", "1003", "1009", "1225", "1231"}
+
+
+def _extra_holidays() -> Set[str]:
+    # 설/추석 등 음력 휴일, 대체공휴일, 임시공휴일은 환경 변수로 지정 (YYYYMMDD, 쉼표 구분)
+    raw = os.getenv("MARKET_HOLIDAYS", "")
+    return {d.strip() for d in raw.split(",") if d.strip()}
+
+
+def _to_date(day: Union[str, date, datetime]) -> date:
+    if isinstance(day, str):
+        return datetime.strptime(day, "%Y%m%d").date()
+    if isinstance(day, datetime):
+        return day.date()
+    return day
+
+
+def is_business_day(day: Union[str, date, datetime]) -> bool:
+    """주말 / 휴장일이 아닌 날인지 여부"""
+    day = _to_date(day)
+    if day.weekday() >= 5:
+        return False
+    key = day.strftime("%Y%m%d")
+    return key[4:] not in _FIXED_HOLIDAYS and key not in _extra_holidays()
+
+
+def business_days(start: Union[str, date, datetime], end: Union[str, date, datetime]) -> List[date]:
+    """
+    [start, end] 구간의 영업일 목록 (양끝 포함)
+
+    Args:
+        start: 시작일 ("YYYYMMDD" 문자열 또는 date/datetime)
+        end: 종료일
+
+    Returns:
+        영업일 date 목록 (오름차순)
+    """
+    start, end = _to_date(start), _to_date(end)
+    extra = _extra_holidays()
+
+    days = []
+    current = start
+    while current <= end:
+        key = current.strftime("%Y%m%d")
+        if current.weekday() < 5 and key[4:] not in _FIXED_HOLIDAYS and key not in extra:
+            days.append(current)
+        current += timedelta(days=1)
+    return days
@@ -0,0 +1,44 @@
+from datetime import date, datetime, timedelta
+from typing import Tuple, Union
+
+
+def day_range(day: Union[str, date, datetime]) -> Tuple[datetime, datetime]:
+    """
+    하루 구간을 반열림 구간 [시작, 다음날 시작) 으로 반환
+
+    컬럼에 함수(DATE(), DATE_FORMAT())를 씌우지 않고
+    `col >= start AND col < end` 로 비교해야 인덱스를 탈 수 있다.
+
+    Args:
+        day: "YYYYMMDD" 문자열 또는 date/datetime
+
+    Returns:
+        (start, end) datetime 튜플
+    """
+    if isinstance(day, str):
+        start = datetime.strptime(day, "%Y%m%d")
+    else:
+        start = datetime(day.year, day.month, day.day)
+    return start, start + timedelta(days=1)
+
+
+def month_range(month: Union[str, date, datetime]) -> Tuple[datetime, datetime]:
+    """
+    한 달 구간을 반열림 구간 [1일, 다음달 1일) 으로 반환
+
+    Args:
+        month: "YYYYMM" 문자열 또는 date/datetime
+
+    Returns:
+        (start, end) datetime 튜플
+    """
+    if isinstance(month, str):
+        start = datetime.strptime(month, "%Y%m")
+    else:
+        start = datetime(month.year, month.month, 1)
+
+    if start.month == 12:
+        end = datetime(start.year + 1, 1, 1)
+    else:
+        end = datetime(start.year, start.month + 1, 1)
+    return start, end
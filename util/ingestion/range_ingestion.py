@@ -0,0 +1,313 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Iterable, List, Optional, Sequence, TypeVar,
+)
+
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+T = TypeVar("T")
+
+# 동시에 진행할 일자별 외부 API 요청 수
+INGESTION_FETCH_CONCURRENCY = int(os.getenv("INGESTION_FETCH_CONCURRENCY", "4"))
+# 변환은 끝났지만 아직 저장하지 않은 청크 수 상한 (초과 시 조회가 저장을 기다림 → 메모리 상한)
+INGESTION_WRITE_QUEUE_SIZE = int(os.getenv("INGESTION_WRITE_QUEUE_SIZE", "8"))
+# 한 번에 저장할 행 수 (메모리에는 최대 INGESTION_WRITE_QUEUE_SIZE개 청크만 유지)
+INGESTION_CHUNK_SIZE = int(os.getenv("INGESTION_CHUNK_SIZE", "1000"))
+
+# 단계 이름
+STAGE_FETCH = "fetch"
+STAGE_TRANSFORM = "transform"
+STAGE_LOAD = "load"
+
+
+@dataclass
+class StageStats:
+    """단계별 처리 건수 / 실제 작업 시간 (대기 시간 제외)"""
+    items: int = 0
+    seconds: float = 0.0
+
+    @property
+    def items_per_sec(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+    def add(self, items: int, seconds: float):
+        self.items += items
+        self.seconds += seconds
+
+    def summary(self) -> dict:
+        return {
+            "items": self.items,
+            "busy_sec": round(self.seconds, 3),
+            "items_per_sec": round(self.items_per_sec, 1),
+        }
+
+
+@dataclass
+class DayResult:
+    day: date
+    fetched: int = 0
+    saved: int = 0
+    fetch_ms: float = 0.0
+    save_ms: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class IngestionReport(Generic[T]):
+    name: str
+    days: List[DayResult] = field(default_factory=list)
+    items: List[T] = field(default_factory=list)
+    elapsed_sec: float = 0.0
+    stages: Dict[str, StageStats] = field(
+        default_factory=lambda: {stage: StageStats() for stage in (STAGE_FETCH, STAGE_TRANSFORM, STAGE_LOAD)}
+    )
+
+    @property
+    def fetched(self) -> int:
+        return sum(d.fetched for d in self.days)
+
+    @property
+    def saved(self) -> int:
+        return sum(d.saved for d in self.days)
+
+    @property
+    def failed_days(self) -> List[DayResult]:
+        return [d for d in self.days if d.error]
+
+    @property
+    def items_per_sec(self) -> float:
+        return self.fetched / self.elapsed_sec if self.elapsed_sec else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "name": self.name,
+            "days": len(self.days),
+            "failed_days": [d.day.strftime("%Y%m%d") for d in self.failed_days],
+            "fetched": self.fetched,
+            "saved": self.saved,
+            "elapsed_sec": round(self.elapsed_sec, 3),
+            "items_per_sec": round(self.items_per_sec, 1),
+            "stages": {stage: stats.summary() for stage, stats in self.stages.items()},
+        }
+
+
+async def _single_page(items: Awaitable[List[Any]]) -> AsyncIterator[List[Any]]:
+    yield await items
+
+
+async def _close_pages(iterator: Optional[AsyncIterator[Any]]):
+    """페이지 이터레이터 정리 (비동기 제너레이터면 aclose로 진행 중인 요청 취소)"""
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is None:
+        return
+    try:
+        await aclose()
+    except Exception as e:
+        logger.warning(f"page iterator close error: {e}")
+
+
+class RangeIngestionEngine:
+    """
+    일자 구간 수집 엔진 (조회 → 변환 → 청크 저장 스트리밍)
+
+    - 일자별 조회를 INGESTION_FETCH_CONCURRENCY개까지 동시에 실행하고,
+      페이지가 도착하는 대로 변환하여 chunk_size 단위 청크로 저장 큐에 넣음
+    - 저장은 한 번에 하나씩 실행 (DB 세션은 동시 사용 불가) → 조회와 저장이 겹쳐 진행됨
+    - 큐가 차면 조회가 저장을 기다리므로 메모리에는 (큐 크기 × 청크) 정도만 유지
+      (구간 전체 원본 / 도메인 객체 / 저장용 행을 한꺼번에 들고 있지 않음)
+    - 일자별 진행 상황, 단계별(fetch / transform / load) 처리량을 로그/IngestionReport로 보고
+    - 한 일자가 실패해도 나머지 일자는 계속 진행하고 실패 일자를 보고
+    - finish를 주면 일자의 모든 청크를 저장한 뒤 (또는 실패 시) 한 번 호출 → 일자 단위 commit / rollback
+
+    사용 예시:
+        report = await RangeIngestionEngine("etf").run_stream(days, iter_pages, to_entity, save_chunk)
+    """
+
+    def __init__(
+            self,
+            name: str,
+            concurrency: int = INGESTION_FETCH_CONCURRENCY,
+            queue_size: int = INGESTION_WRITE_QUEUE_SIZE,
+            chunk_size: int = INGESTION_CHUNK_SIZE,
+    ):
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.queue_size = max(1, queue_size)
+        self.chunk_size = max(1, chunk_size)
+
+    async def run(
+            self,
+            days: Sequence[date],
+            fetch: Callable[[date], Awaitable[List[T]]],
+            save: Callable[[date, List[T]], Awaitable[int]],
+            collect: bool = True,
+    ) -> IngestionReport[T]:
+        """
+        일자별 전체 목록을 한 번에 반환하는 조회 함수용 (변환 없이 청크 저장)
+
+        Args:
+            days: 수집할 일자 목록
+            fetch: 일자 → 저장할 항목 목록
+            save: (일자, 항목 청크) → 저장 건수
+            collect: True면 저장한 항목을 report.items에 모아 반환
+
+        Returns:
+            IngestionReport
+        """
+        return await self.run_stream(
+            days,
+            pages=lambda day: _single_page(fetch(day)),
+            transform=lambda item: item,
+            save=save,
+            collect=collect,
+        )
+
+    async def run_stream(
+            self,
+            days: Sequence[date],
+            pages: Callable[[date], AsyncIterator[Iterable[Any]]],
+            transform: Callable[[Any], Optional[T]],
+            save: Callable[[date, List[T]], Awaitable[int]],
+            collect: bool = False,
+            finish: Optional[Callable[[date, bool], Awaitable[None]]] = None,
+    ) -> IngestionReport[T]:
+        """
+        Args:
+            days: 수집할 일자 목록
+            pages: 일자 → 원본 페이지 비동기 이터레이터
+            transform: 원본 항목 → 저장할 항목 (None이면 건너뜀)
+            save: (일자, 항목 청크) → 저장 건수
+            collect: True면 저장한 항목을 report.items에 모아 반환 (구간 전체가 메모리에 남음)
+            finish: (일자, 성공 여부) → 일자 마무리 (commit / rollback)
+                    실패하면 그 일자는 저장 건수 0, 실패로 보고
+
+        Returns:
+            IngestionReport
+        """
+        report: IngestionReport[T] = IngestionReport(name=self.name)
+        if not days:
+            return report
+
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        results = {day: DayResult(day=day) for day in days}
+        # finish가 있으면 성공한 일자의 항목만 report.items에 반영
+        pending_items: Dict[date, List[T]] = {}
+        fetch_stats = report.stages[STAGE_FETCH]
+        transform_stats = report.stages[STAGE_TRANSFORM]
+        load_stats = report.stages[STAGE_LOAD]
+
+        async def fetch_day(day: date):
+            result = results[day]
+            async with semaphore:
+                chunk: List[T] = []
+                iterator = None
+                try:
+                    iterator = pages(day).__aiter__()
+                    while True:
+                        start = time.perf_counter()
+                        try:
+                            page = await iterator.__anext__()
+                        except StopAsyncIteration:
+                            break
+                        finally:
+                            elapsed = time.perf_counter() - start
+                            result.fetch_ms += elapsed * 1000
+                        page = list(page or [])
+                        result.fetched += len(page)
+                        fetch_stats.add(len(page), elapsed)
+
+                        start = time.perf_counter()
+                        mapped = [entity for entity in map(transform, page) if entity is not None]
+                        transform_stats.add(len(page), time.perf_counter() - start)
+                        del page
+
+                        chunk.extend(mapped)
+                        while len(chunk) >= self.chunk_size:
+                            # 저장이 밀리면 여기서 대기 (조회 결과가 메모리에 무한히 쌓이지 않도록)
+                            await queue.put((day, chunk[:self.chunk_size]))
+                            chunk = chunk[self.chunk_size:]
+                    if chunk:
+                        await queue.put((day, chunk))
+                except Exception as e:
+                    result.error = f"fetch: {e}"
+                    logger.error(f"[{self.name}] {day:%Y%m%d} 조회 실패: {e}")
+                finally:
+                    # 실패 / 취소로 중간에 빠져나오면 진행 중인 페이지 요청을 바로 정리 (끝까지 읽었으면 아무 일도 없음)
+                    await _close_pages(iterator)
+            # 일자 종료 표시
+            await queue.put((day, None))
+
+        async def finish_day(day: date, result: DayResult):
+            start = time.perf_counter()
+            ok = result.error is None
+            try:
+                await finish(day, ok)
+            except Exception as e:
+                ok = False
+                result.error = f"save: {e}"
+                logger.error(f"[{self.name}] {day:%Y%m%d} 저장 완료 처리 실패: {e}")
+            result.save_ms += (time.perf_counter() - start) * 1000
+            items = pending_items.pop(day, [])
+            if ok:
+                report.items.extend(items)
+            else:
+                # 일자 전체가 반영되지 않았으므로 저장 건수에서 제외
+                result.saved = 0
+
+        async def writer():
+            done = 0
+            while done < len(days):
+                day, chunk = await queue.get()
+                result = results[day]
+                if chunk is None:
+                    if finish is not None:
+                        await finish_day(day, result)
+                    done += 1
+                    elapsed = time.perf_counter() - started
+                    logger.info(
+                        f"[{self.name}] {done}/{len(days)} {day:%Y%m%d} "
+                        f"fetched={result.fetched} saved={result.saved} "
+                        f"fetch={result.fetch_ms:.0f}ms save={result.save_ms:.0f}ms "
+                        f"({done / elapsed:.2f} days/s)"
+                    )
+                    continue
+
+                if result.error and result.error.startswith("save"):
+                    # 같은 일자 이전 청크 저장이 실패했으면 나머지 청크도 건너뜀
+                    continue
+                start = time.perf_counter()
+                try:
+                    result.saved += await save(day, chunk)
+                    if collect:
+                        (pending_items.setdefault(day, []) if finish is not None else report.items).extend(chunk)
+                except Exception as e:
+                    result.error = f"save: {e}"
+                    logger.error(f"[{self.name}] {day:%Y%m%d} 저장 실패: {e}")
+                elapsed = time.perf_counter() - start
+                result.save_ms += elapsed * 1000
+                load_stats.add(len(chunk), elapsed)
+
+        writer_task = asyncio.create_task(writer())
+        fetch_tasks = [asyncio.create_task(fetch_day(day)) for day in days]
+        try:
+            await asyncio.gather(*fetch_tasks)
+            await writer_task
+        finally:
+            tasks = fetch_tasks + [writer_task]
+            for task in tasks:
+                task.cancel()
+            # 취소된 작업의 정리(페이지 요청 취소)가 끝날 때까지 대기
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        report.days = [results[day] for day in days]
+        report.elapsed_sec = time.perf_counter() - started
+        logger.info(f"[{self.name}] 수집 완료 {report.summary()}")
+        return report
@@ -0,0 +1,64 @@
+import contextvars
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, FrozenSet
+
+from util.lock.redis_lease import RedisLease
+
+# 다른 프로세스가 같은 데이터셋을 적재 중일 때 기다릴 최대 시간 (초)
+INGESTION_LEASE_WAIT_SEC = int(os.getenv("INGESTION_LEASE_WAIT_SEC", "600"))
+
+# 현재 작업(과 하위 태스크)이 보유 중인 적재 임대 (같은 데이터셋을 다시 잡지 않음)
+_held_datasets: contextvars.ContextVar[FrozenSet[str]] = contextvars.ContextVar(
+    "ingestion_lease_held", default=frozenset()
+)
+
+
+class IngestionBusyError(RuntimeError):
+    """다른 프로세스가 같은 데이터셋을 적재 중이라 기다리는 시간 안에 임대를 잡지 못함"""
+
+
+@asynccontextmanager
+async def ingestion_lease(dataset: str, wait_sec: float = INGESTION_LEASE_WAIT_SEC) -> AsyncIterator[bool]:
+    """
+    데이터셋 적재 임대 (ingest:<dataset>)
+
+    스케줄 작업 / 상품 목록 점검 / POST /*/save / 백필이 모두 같은 임대를 잡으므로
+    한 데이터셋의 일자 삭제 → 재적재가 프로세스 사이에서 겹치지 않는다.
+    이미 보유 중인 작업 안에서 다시 잡으면 그대로 True (재진입)
+
+    Args:
+        dataset: 적재 상태 데이터셋 이름
+        wait_sec: 다른 프로세스가 보유 중일 때 기다릴 최대 시간 (0이면 바로 반환)
+
+    Returns:
+        점유했으면 True
+
+    사용 예시:
+        async with ingestion_lease(DATASET_ETF, wait_sec=0) as held:
+            if held:
+                await usecase.catch_up(DATASET_ETF)
+    """
+    held_datasets = _held_datasets.get()
+    if dataset in held_datasets:
+        yield True
+        return
+
+    async with RedisLease(f"ingest:{dataset}").hold(wait_sec=wait_sec) as held:
+        if not held:
+            yield False
+            return
+        token = _held_datasets.set(held_datasets | {dataset})
+        try:
+            yield True
+        finally:
+            _held_datasets.reset(token)
+
+
+@asynccontextmanager
+async def exclusive_ingestion(dataset: str, wait_sec: float = INGESTION_LEASE_WAIT_SEC) -> AsyncIterator[None]:
+    """적재 임대를 잡고 실행 (wait_sec 안에 잡지 못하면 IngestionBusyError)"""
+    async with ingestion_lease(dataset, wait_sec) as held:
+        if not held:
+            raise IngestionBusyError(f"[{dataset}] 다른 프로세스가 적재 중입니다 ({wait_sec}초 대기 후 포기)")
+        yield
@@ -0,0 +1,204 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import redis
+
+from config.database.session import commit_guard
+from config.redis_config import get_redis
+from util.log.log import Log
+
+logger = Log.get_logger()
+
+# 임대 만료 (초): 보유 중에는 1/3 주기로 연장하므로 프로세스가 죽으면 이 시간 뒤 다른 프로세스가 이어받음
+LEASE_TTL_SEC = int(os.getenv("LEASE_TTL_SEC", "60"))
+# Redis 장애로 임대를 확인할 수 없을 때 작업을 그대로 실행할지 (False면 건너뜀)
+LEASE_FAIL_OPEN = os.getenv("LEASE_FAIL_OPEN", "true").lower() == "true"
+
+# 임대를 기다릴 때 다시 시도하는 주기 (초)
+LEASE_POLL_SEC = float(os.getenv("LEASE_POLL_SEC", "1.0"))
+
+KEY_PREFIX = "lease:"
+
+# 비어 있을 때만 펜싱 토큰을 증가시켜 "토큰:소유자"로 점유 → 토큰 반환 (점유 중이면 0)
+_ACQUIRE_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 1 then
+    return 0
+end
+local fence = redis.call('incr', KEYS[2])
+redis.call('set', KEYS[1], fence .. ':' .. ARGV[1], 'PX', ARGV[2])
+return fence
+"""
+
+# 소유자일 때만 연장 / 해제
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaseLostError(RuntimeError):
+    """임대를 잃은(만료 후 다른 소유자가 잡은) 실행의 DB commit 거부"""
+
+
+def process_owner() -> str:
+    """임대 소유자 식별자 (호스트:PID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class RedisLease:
+    """
+    Redis 기반 임대(lease) 락 + 펜싱 토큰
+
+    - 점유할 때마다 단조 증가하는 펜싱 토큰(fence)을 발급 → 이전 소유자의 실행과 구분해 기록
+    - 보유 중에는 백그라운드에서 만료를 연장하고, 연장에 실패하면(다른 소유자에게 넘어감)
+      보유 중인 작업을 취소하여 두 프로세스가 동시에 같은 작업을 진행하지 않도록 함
+    - 취소가 닿지 않는 DB 스레드에서 이미 진행 중인 쓰기도 막도록, 보유 블록 안의 primary commit 직전에
+      임대 값(토큰:소유자)이 그대로인지 확인하고 아니면 LeaseLostError로 commit 거부 (commit_guard)
+      확인과 commit 사이의 짧은 구간은 남지만 임대 TTL에 비하면 무시할 수 있음
+    - 해제는 소유자일 때만 (만료 후 다른 프로세스가 잡은 임대를 지우지 않음)
+
+    사용 예시:
+        lease = RedisLease("job:product_etf")
+        async with lease.hold() as held:
+            if held:
+                await run_job()
+    """
+
+    def __init__(self, name: str, ttl_sec: int = LEASE_TTL_SEC, redis_client: Optional[redis.Redis] = None):
+        self.name = name
+        self.key = f"{KEY_PREFIX}{name}"
+        self.fence_key = f"{self.key}:fence"
+        self.ttl_ms = ttl_sec * 1000
+        self.owner = f"{process_owner()}:{uuid.uuid4().hex[:8]}"
+        self.fence: Optional[int] = None
+        self.lost = False
+        self._redis = redis_client
+        self._value: Optional[str] = None
+
+    @property
+    def redis_client(self) -> redis.Redis:
+        return self._redis or get_redis()
+
+    def acquire(self) -> bool:
+        fence = int(self.redis_client.eval(_ACQUIRE_SCRIPT, 2, self.key, self.fence_key, self.owner, self.ttl_ms))
+        if not fence:
+            return False
+        self.fence = fence
+        self.lost = False
+        self._value = f"{fence}:{self.owner}"
+        return True
+
+    def renew(self) -> bool:
+        if self._value is None:
+            return False
+        return bool(self.redis_client.eval(_RENEW_SCRIPT, 1, self.key, self._value, self.ttl_ms))
+
+    def release(self):
+        if self._value is None:
+            return
+        try:
+            self.redis_client.eval(_RELEASE_SCRIPT, 1, self.key, self._value)
+        except Exception as e:
+            logger.warning(f"[lease] {self.name} 해제 실패 (만료 후 자동 해제): {e}")
+        finally:
+            self._value = None
+
+    def ensure_held(self):
+        """
+        아직 이 소유자가 임대를 보유 중인지 확인 (commit 직전 확인용)
+
+        Redis 오류로 확인할 수 없으면 LEASE_FAIL_OPEN이면 통과
+        """
+        if self.lost or self._value is None:
+            raise LeaseLostError(f"[lease] {self.name} 임대를 잃어 commit하지 않습니다 (fence={self.fence})")
+        try:
+            holder = self.redis_client.get(self.key)
+        except Exception as e:
+            if LEASE_FAIL_OPEN:
+                logger.warning(f"[lease] {self.name} 보유 확인 실패 (fail open): {e}")
+                return
+            raise
+        if holder != self._value:
+            self.lost = True
+            raise LeaseLostError(f"[lease] {self.name} 임대를 잃어 commit하지 않습니다 (fence={self.fence}, 현재 {holder})")
+
+    def current_holder(self) -> Optional[str]:
+        """현재 임대 값 ("토큰:소유자"), 없으면 None"""
+        return self.redis_client.get(self.key)
+
+    @asynccontextmanager
+    async def hold(self, fail_open: bool = LEASE_FAIL_OPEN, wait_sec: float = 0) -> AsyncIterator[bool]:
+        """
+        임대를 잡고 보유하는 동안 만료를 연장
+
+        Args:
+            fail_open: Redis 오류로 임대를 확인할 수 없을 때 True를 반환할지
+            wait_sec: 다른 프로세스가 보유 중이면 풀릴 때까지 기다릴 최대 시간 (0이면 바로 반환)
+
+        Returns:
+            점유했으면 True (다른 프로세스가 wait_sec 동안 계속 보유하면 False)
+        """
+        deadline = time.monotonic() + wait_sec
+        try:
+            acquired = await asyncio.to_thread(self.acquire)
+            while not acquired and time.monotonic() < deadline:
+                await asyncio.sleep(min(LEASE_POLL_SEC, max(0.0, deadline - time.monotonic())))
+                acquired = await asyncio.to_thread(self.acquire)
+        except Exception as e:
+            logger.warning(f"[lease] {self.name} 임대 확인 실패 (fail_open={fail_open}): {e}")
+            yield fail_open
+            return
+
+        if not acquired:
+            yield False
+            return
+
+        keeper = asyncio.create_task(self._keep_alive(asyncio.current_task()))
+        try:
+            with commit_guard(self.ensure_held):
+                yield True
+        finally:
+            keeper.cancel()
+            await asyncio.to_thread(self.release)
+
+    async def _keep_alive(self, holder: asyncio.Task):
+        interval = self.ttl_ms / 1000 / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await asyncio.to_thread(self.renew)
+            except Exception as e:
+                # 일시 장애: 만료 전까지 계속 시도
+                logger.warning(f"[lease] {self.name} 연장 실패: {e}")
+                continue
+            if not renewed:
+                self.lost = True
+                logger.error(f"[lease] {self.name} 임대를 잃었습니다 (fence={self.fence}) → 진행 중인 작업을 중단합니다.")
+                holder.cancel()
+                return
+
+
+def claim_once(key: str, ttl_sec: int, redis_client: Optional[redis.Redis] = None) -> bool:
+    """
+    key를 처음 요청한 프로세스만 True (예: 스케줄 실행 시각별 1회 실행)
+
+    Args:
+        key: 실행 단위 키
+        ttl_sec: 기록 유지 시간
+    """
+    client = redis_client or get_redis()
+    return bool(client.set(f"{KEY_PREFIX}{key}", process_owner(), nx=True, ex=max(1, ttl_sec)))